@@ -1,41 +1,21 @@
 import streamlit as st
 import google.generativeai as genai
-from google.generativeai.types import HarmCategory, HarmBlockThreshold
 import pandas as pd
-import numpy as np
 import matplotlib.pyplot as plt
-import json
-from PIL import Image
 import PyPDF2
-import io
 import docx
 import zipfile
 from pptx import Presentation
-import re
-
-# --- IMPORT LIBRARY TEKNIK SIPIL CUSTOM (ENGINEX BRAIN) ---
-# Pastikan file-file libs_*.py ada di satu folder dengan file ini
-import libs_ahsp
-import libs_baja
-import libs_bridge
-import libs_gempa
-import libs_geoteknik
-import libs_optimizer
-import libs_pondasi
-import libs_sni
-
-# Import Library Tambahan (Pake Try-Except biar gak crash kalau belum install modulnya)
-try:
-    import libs_sustainability
-    has_sustainability = True
-except ImportError:
-    has_sustainability = False
+import hashlib
+import time
+import uuid
+from contextlib import contextmanager
 
-try:
-    import libs_bim_importer
-    has_bim = True
-except ImportError:
-    has_bim = False
+# --- SERVICE LAYER (PERSONA, KONTEKS, LLM, EKSEKUSI KODE & EXPORT) ---
+# Library teknik sipil custom di-load lazy dari paket enginex oleh service_enginex
+from service_enginex import EnginexService, create_docx_from_text, extract_table_to_excel
+from image_enginex import EnginexImagePipeline
+from enginex import profiling
 
 # --- KONFIGURASI HALAMAN ---
 st.set_page_config(page_title="ENGINEX Ultimate", page_icon="🏗️", layout="wide")
@@ -84,113 +64,108 @@ if 'processed_files' not in st.session_state:
     st.session_state.processed_files = set()
 if 'current_expert_active' not in st.session_state:
     st.session_state.current_expert_active = "👑 The GEMS Grandmaster"
+if 'export_requests' not in st.session_state:
+    st.session_state.export_requests = set()
+
+# ==========================================
+# 0A. TRACING (DURASI PER TAHAP REQUEST)
+# ==========================================
+class RequestTracer:
+    """
+    Pencatat span durasi ringan untuk satu run script (satu giliran chat).
+    Span disimpan ke tabel `request_metrics` di EnginexBackend saat flush().
+    """
+    # Stage yang selalu terjadi di setiap rerun; tidak disimpan jika hanya ini yang tercatat
+    PASSIVE_STAGES = {"history_load"}
+
+    def __init__(self):
+        self.request_id = uuid.uuid4().hex[:12]
+        self.spans = []
+
+    @contextmanager
+    def span(self, stage, detail=""):
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(stage, (time.perf_counter() - t0) * 1000, detail)
+
+    def add(self, stage, durasi_ms, detail=""):
+        self.spans.append((stage, str(detail)[:200], durasi_ms))
+
+    def flush(self, backend, project, gem):
+        if not any(stage not in self.PASSIVE_STAGES for stage, _, _ in self.spans):
+            return
+        backend.simpan_metrics(self.request_id, project, gem, self.spans)
+        self.spans = []
+
+tracer = RequestTracer()
 
 # ==========================================
 # 0. FUNGSI BANTUAN EXPORT & PLOTTING
 # ==========================================
 
-def create_docx_from_text(text_content):
-    """Mengubah teks chat menjadi file Word (.docx)"""
-    try:
-        doc = docx.Document()
-        doc.add_heading('Laporan Output ENGINEX', 0)
-        
-        lines = text_content.split('\n')
-        for line in lines:
-            clean_line = line.strip()
-            if clean_line.startswith('## '):
-                doc.add_heading(clean_line.replace('## ', ''), level=2)
-            elif clean_line.startswith('### '):
-                doc.add_heading(clean_line.replace('### ', ''), level=3)
-            elif clean_line.startswith('- ') or clean_line.startswith('* '):
-                try:
-                    doc.add_paragraph(clean_line, style='List Bullet')
-                except:
-                    doc.add_paragraph(clean_line)
-            elif clean_line:
-                doc.add_paragraph(clean_line)
-                
-        bio = io.BytesIO()
-        doc.save(bio)
-        bio.seek(0)
-        return bio
-    except Exception as e:
-        return None
+MIME_DOCX = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+MIME_XLSX = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
 
-def extract_table_to_excel(text_content):
-    """Mendeteksi tabel Markdown dalam chat dan mengubahnya ke Excel (.xlsx)"""
-    try:
-        lines = text_content.split('\n')
-        table_data = []
-        
-        for line in lines:
-            stripped = line.strip()
-            if "|" in stripped:
-                if set(stripped.replace('|', '').replace('-', '').replace(' ', '')) == set():
-                    continue
-                row_cells = [c.strip() for c in stripped.split('|')]
-                if stripped.startswith('|'): row_cells = row_cells[1:]
-                if stripped.endswith('|'): row_cells = row_cells[:-1]
-                if row_cells:
-                    table_data.append(row_cells)
-        
-        if len(table_data) < 2: return None
-            
-        headers = table_data[0]
-        data_rows = table_data[1:]
-        df = pd.DataFrame(data_rows, columns=headers)
-        
-        output = io.BytesIO()
-        with pd.ExcelWriter(output, engine='xlsxwriter') as writer:
-            df.to_excel(writer, index=False, sheet_name='Data_ENGINEX')
-            worksheet = writer.sheets['Data_ENGINEX']
-            for i, col in enumerate(df.columns):
-                worksheet.set_column(i, i, 20)
-        output.seek(0)
-        return output
-    except Exception as e:
-        return None
+def hash_teks(text_content):
+    """Sidik jari (hash) teks respons, dipakai sebagai kunci cache export"""
+    return hashlib.sha1(text_content.encode("utf-8")).hexdigest()[:16]
+
+@st.cache_data(show_spinner=False, max_entries=128)
+def build_export_file(jenis, text_hash, _text_content):
+    """
+    Membangun file export (docx/xlsx) HANYA saat diminta user.
+    Di-cache berdasarkan (jenis, hash teks); argumen `_text_content`
+    sengaja tidak ikut di-hash oleh Streamlit. Span export hanya tercatat saat
+    file benar-benar dibangun (cache hit tidak menjalankan fungsi ini).
+    """
+    with tracer.span(f"export_{jenis}", text_hash):
+        if jenis == "docx":
+            bio = create_docx_from_text(_text_content)
+        else:
+            bio = extract_table_to_excel(_text_content)
+        return bio.getvalue() if bio else None
+
+def render_export_buttons(text_content, expert_name, msg_key):
+    """
+    Tombol export lazy untuk satu pesan (berlaku juga untuk riwayat lama).
+    Klik pertama menyiapkan file, klik berikutnya mengunduh hasil cache.
+    """
+    text_hash = hash_teks(text_content)
+    jenis_list = [("docx", "📄 Laporan (.docx)", f"Laporan_{expert_name[:5]}.docx", MIME_DOCX)]
+    # Cek murah: tombol Excel hanya muncul jika ada indikasi tabel Markdown
+    if "|" in text_content:
+        jenis_list.append(("xlsx", "📊 Tabel (.xlsx)", f"Data_{expert_name[:5]}.xlsx", MIME_XLSX))
+
+    cols = st.columns(len(jenis_list))
+    for col, (jenis, label, nama_file, mime) in zip(cols, jenis_list):
+        req_key = (jenis, text_hash)
+        if req_key not in st.session_state.export_requests:
+            if not col.button(f"⚙️ Siapkan {label}", key=f"prep_{jenis}_{text_hash}_{msg_key}"):
+                continue
+            st.session_state.export_requests.add(req_key)
+
+        file_bytes = build_export_file(jenis, text_hash, text_content)
+        if file_bytes:
+            col.download_button(f"⬇️ Download {label}", file_bytes, nama_file, mime, key=f"dl_{jenis}_{text_hash}_{msg_key}")
+        else:
+            col.caption("Tidak ada tabel yang bisa diexport.")
 
 def execute_generated_code(code_str):
     """
     [ENGINEERING PLOTTER & CALCULATION ENGINE]
     Mengeksekusi string kode Python yang dihasilkan AI.
-    Sekarang mendukung library teknik sipil custom.
+    Kotak perkakas (pd, np, plt, libs_*) disiapkan oleh EnginexService.
     """
-    try:
-        # KITA MASUKKAN SEMUA LIBS KE DALAM "KOTAK PERKAKAS" (LOCAL VARS)
-        # Agar kode Python dari AI bisa mengenali 'libs_sni', 'libs_ahsp', dll.
-        local_vars = {
-            "pd": pd,
-            "np": np,
-            "plt": plt,
-            "st": st,
-            # DAFTARKAN LIBRARY CUSTOM DI SINI:
-            "libs_ahsp": libs_ahsp,
-            "libs_baja": libs_baja,
-            "libs_bridge": libs_bridge,
-            "libs_gempa": libs_gempa,
-            "libs_geoteknik": libs_geoteknik,
-            "libs_optimizer": libs_optimizer,
-            "libs_pondasi": libs_pondasi,
-            "libs_sni": libs_sni
-        }
-        
-        # Tambahkan optional libs jika terinstall
-        if has_sustainability:
-            local_vars["libs_sustainability"] = libs_sustainability
-        if has_bim:
-            local_vars["libs_bim_importer"] = libs_bim_importer
-        
-        # Eksekusi kode dalam lingkungan yang sudah dibekali tools
-        exec(code_str, {}, local_vars)
-        return True
-    except Exception as e:
-        st.error(f"⚠️ Gagal Eksekusi Kode: {e}")
+    ok, err = service.execute_code(code_str, {"st": st})
+    if not ok:
+        st.error(f"⚠️ Gagal Eksekusi Kode: {err.splitlines()[0]}")
         # Tampilkan detail error biar gampang debug
         with st.expander("Lihat Kode Error"):
             st.code(code_str, language='python') 
-        return False
+            st.code(err)
+    return ok
 
 # ==========================================
 # 1. SETUP API KEY & MODEL (SIDEBAR)
@@ -256,15 +231,42 @@ with st.sidebar:
 # --- KONEKSI DATABASE & PERSONA ---
 try:
     from backend_enginex import EnginexBackend
-    from persona import gems_persona, get_persona_list, get_system_instruction
+    from persona import get_persona_list
     
     if 'backend' not in st.session_state:
         st.session_state.backend = EnginexBackend()
     db = st.session_state.backend
+    service = EnginexService(model_name=selected_model_name, backend=db)
 except ImportError as e:
     st.error(f"⚠️ Error Import File Backend/Persona: {e}")
     st.stop()
 
+with st.sidebar:
+    with st.expander("🛠️ Admin: Metrik Performa"):
+        df_metrics = db.get_metrics_summary()
+        if df_metrics.empty:
+            st.caption("Belum ada data metrik.")
+        else:
+            st.dataframe(df_metrics, hide_index=True, use_container_width=True)
+        if st.button("🗑️ Hapus Metrik"):
+            db.clear_metrics()
+            st.rerun()
+
+        # Profiling engine (opt-in): method engine hanya dibungkus saat toggle aktif
+        profiling_on = st.toggle("Profiling Engine", value=profiling.profiler.enabled)
+        if profiling_on and not profiling.profiler.enabled:
+            profiling.enable()
+        elif not profiling_on and profiling.profiler.enabled:
+            profiling.disable()
+        df_prof = profiling.report()
+        if not df_prof.empty:
+            st.dataframe(df_prof, hide_index=True, use_container_width=True)
+            st.download_button("⬇️ cProfile (.prof)", profiling.dump_cprofile(), "enginex.prof",
+                               mime="application/octet-stream")
+            if st.button("🗑️ Reset Profiling"):
+                profiling.reset()
+                st.rerun()
+
 # ==========================================
 # 2. SAVE/LOAD & PROYEK
 # ==========================================
@@ -288,41 +290,7 @@ with st.sidebar:
     st.divider()
 
 # ==========================================
-# 3. DEFINISI PERSONA (INSTRUKSI PLOTTING)
-# ==========================================
-
-PLOT_INSTRUCTION = """
-[ATURAN PENTING UNTUK VISUALISASI & PERHITUNGAN]:
-Jika user meminta grafik/diagram/plot atau PERHITUNGAN TEKNIS:
-1. JANGAN HANYA MEMBERIKAN DESKRIPSI.
-2. ANDA WAJIB MENULISKAN KODE PYTHON DI DALAM BLOK KODE (```python).
-3. Gunakan library `matplotlib.pyplot` (sebagai plt) dan `numpy` (sebagai np).
-4. Gunakan Library Custom yang tersedia (`libs_sni`, `libs_ahsp`, dll) sesuai instruksi di TOOL_DOCS.
-5. WAJIB: Di akhir kode plotting, gunakan perintah `st.pyplot(plt.gcf())` agar grafik muncul.
-6. Untuk menampilkan Dataframe hasil hitungan, gunakan `st.dataframe(df)` atau `st.write(df)`.
-"""
-
-# ==========================================
-# 4. FUNGSI AUTO-ROUTER
-# ==========================================
-def get_auto_pilot_decision(user_query, model_api_key):
-    try:
-        router_model = genai.GenerativeModel("gemini-1.5-flash")
-        list_ahli = list(gems_persona.keys())
-        router_prompt = f"""
-        Pilih SATU ahli dari daftar berikut untuk menjawab pertanyaan: "{user_query}"
-        Daftar: {list_ahli}
-        Output: HANYA nama ahli persis. Jika ragu, pilih '👑 The GEMS Grandmaster'.
-        """
-        response = router_model.generate_content(router_prompt)
-        suggested = response.text.strip()
-        if suggested in list_ahli: return suggested
-        return "👑 The GEMS Grandmaster"
-    except:
-        return "👑 The GEMS Grandmaster"
-
-# ==========================================
-# 5. SIDEBAR BAWAH & FILE UPLOAD
+# 3. SIDEBAR BAWAH & FILE UPLOAD
 # ==========================================
 with st.sidebar:
     manual_selection = st.selectbox(
@@ -343,6 +311,13 @@ with st.sidebar:
     
     if uploaded_files: st.info(f"📎 {len(uploaded_files)} File")
     
+    max_edge_gambar = st.select_slider(
+        "🖼️ Resolusi Maks Gambar (px):",
+        options=[768, 1024, 1536, 2048, 3072],
+        value=1536,
+        help="Foto/gambar kerja diperkecil & dikompres sebelum dikirim ke AI agar lebih cepat."
+    )
+    
     st.divider()
     if st.button("🧹 Reset Chat"):
         db.clear_chat(nama_proyek, st.session_state.current_expert_active)
@@ -350,15 +325,21 @@ with st.sidebar:
         st.rerun()
 
 # ==========================================
-# 6. FUNGSI BACA FILE
+# 4. FUNGSI BACA FILE
 # ==========================================
+@st.cache_resource
+def get_image_pipeline(max_edge):
+    # Satu pipeline per resolusi, cache hasil proses (hash isi file) ikut tersimpan di dalamnya
+    return EnginexImagePipeline(max_edge=max_edge)
+
 def process_uploaded_file(uploaded_file):
     if uploaded_file is None: return None, None
     file_type = uploaded_file.name.split('.')[-1].lower()
     
     try:
         if file_type in ['png', 'jpg', 'jpeg']:
-            return "image", Image.open(uploaded_file)
+            # Auto-orient, downscale, re-encode & tiling -> list blob gambar
+            return "image", get_image_pipeline(max_edge_gambar).process(uploaded_file.getvalue())
         elif file_type == 'pdf':
             pdf_reader = PyPDF2.PdfReader(uploaded_file)
             text = ""
@@ -411,7 +392,7 @@ def process_uploaded_file(uploaded_file):
     return "error", "Format tidak didukung"
 
 # ==========================================
-# 7. MAIN CHAT AREA
+# 5. MAIN CHAT AREA
 # ==========================================
 st.markdown(f'<div class="main-header">{nama_proyek}</div>', unsafe_allow_html=True)
 
@@ -419,10 +400,13 @@ current_expert = st.session_state.current_expert_active
 st.caption(f"Status: **Connected** | Expert: **{current_expert}**")
 
 # Display History
-history = db.get_chat_history(nama_proyek, current_expert)
-for chat in history:
+with tracer.span("history_load"):
+    history = db.get_chat_history(nama_proyek, current_expert)
+for idx, chat in enumerate(history):
     with st.chat_message(chat['role']):
         st.markdown(chat['content'])
+        if chat['role'] == "assistant":
+            render_export_buttons(chat['content'], current_expert, idx)
 
 prompt = st.chat_input(f"Tanya sesuatu ke {current_expert}...")
 
@@ -431,7 +415,8 @@ if prompt:
     detected_expert = current_expert
     if use_auto_pilot:
         with st.status("🧠 Menganalisis konteks...", expanded=True) as status:
-            detected_expert = get_auto_pilot_decision(prompt, clean_api_key)
+            with tracer.span("auto_pilot_routing"):
+                detected_expert = service.pilih_ahli_otomatis(prompt)
             status.write(f"Ahli yang relevan: **{detected_expert}**")
             st.session_state.current_expert_active = detected_expert
             st.markdown(f'<div class="auto-pilot-msg">🤖 Auto-Pilot: Mengalihkan ke {detected_expert}</div>', unsafe_allow_html=True)
@@ -448,10 +433,11 @@ if prompt:
     if uploaded_files:
         for upl_file in uploaded_files:
             if upl_file.name not in st.session_state.processed_files:
-                ftype, fcontent = process_uploaded_file(upl_file)
+                with tracer.span("process_uploaded_file", upl_file.name):
+                    ftype, fcontent = process_uploaded_file(upl_file)
                 if ftype == "image":
                     with st.chat_message("user"): st.image(upl_file, width=200)
-                    content_to_send.append(fcontent)
+                    content_to_send.extend(fcontent)
                 elif ftype == "text":
                     with st.chat_message("user"): st.caption(f"📄 Data: {upl_file.name}")
                     content_to_send[0] += f"\n\n--- FILE: {upl_file.name} ---\n{fcontent}\n------\n"
@@ -464,55 +450,28 @@ if prompt:
     with st.chat_message("assistant"):
         with st.spinner(f"{final_expert_name.split(' ')[1]} sedang berpikir..."):
             try:
-                safety = {
-                    HarmCategory.HARM_CATEGORY_HARASSMENT: HarmBlockThreshold.BLOCK_NONE,
-                    HarmCategory.HARM_CATEGORY_HATE_SPEECH: HarmBlockThreshold.BLOCK_NONE,
-                    HarmCategory.HARM_CATEGORY_SEXUALLY_EXPLICIT: HarmBlockThreshold.BLOCK_NONE,
-                    HarmCategory.HARM_CATEGORY_DANGEROUS_CONTENT: HarmBlockThreshold.BLOCK_NONE,
-                }
-
-                # ==========================================================
-                # [LOGIKA INSTRUKSI]
-                # ==========================================================
-                
-                # Daftar ahli yang TIDAK BOLEH dikasih senjata coding (Hanya Ngetik)
-                level_2_agents = ["Drafter", "Legal", "Visionary", "Admin", "Syariah"]
-                
-                # Cek apakah ahli saat ini masuk golongan Level 2?
-                is_text_only = any(keyword in final_expert_name for keyword in level_2_agents)
-                
-                base_instruction = gems_persona[final_expert_name]
-                
-                if is_text_only:
-                    full_system_instruction = base_instruction
-                else:
-                    full_system_instruction = base_instruction + "\n\n" + PLOT_INSTRUCTION
-
-                model = genai.GenerativeModel(
-                    model_name=selected_model_name,
-                    system_instruction=full_system_instruction, 
-                    safety_settings=safety
-                )
+                # Ahli Level 2 (Drafter, Legal, dll) hanya mengetik, tanpa eksekusi kode
+                is_text_only = service.is_text_only(final_expert_name)
                 
                 # Context History
-                current_history = db.get_chat_history(nama_proyek, final_expert_name)
-                hist_formatted = []
-                for h in current_history:
-                    if h['content'] != prompt:
-                        role_api = "user" if h['role']=="user" else "model"
-                        hist_formatted.append({"role": role_api, "parts": [h['content']]})
+                with tracer.span("history_load_context"):
+                    hist_formatted = service.build_history(nama_proyek, final_expert_name, prompt)
                 
-                chat_session = model.start_chat(history=hist_formatted)
-                response_stream = chat_session.send_message(content_to_send, stream=True)
+                t_llm = time.perf_counter()
+                response_stream = service.stream_response(final_expert_name, hist_formatted, content_to_send, prompt=prompt)
                 
                 full_response_text = ""
                 placeholder = st.empty()
+                ttft_recorded = False
                 
-                for chunk in response_stream:
-                    if chunk.text:
-                        full_response_text += chunk.text
-                        placeholder.markdown(full_response_text + "▌")
+                for chunk_text in response_stream:
+                    if not ttft_recorded:
+                        tracer.add("llm_ttft", (time.perf_counter() - t_llm) * 1000, selected_model_name)
+                        ttft_recorded = True
+                    full_response_text += chunk_text
+                    placeholder.markdown(full_response_text + "▌")
                 
+                tracer.add("llm_stream_total", (time.perf_counter() - t_llm) * 1000, selected_model_name)
                 placeholder.markdown(full_response_text)
                 db.simpan_chat(nama_proyek, final_expert_name, "assistant", full_response_text)
                 
@@ -520,31 +479,25 @@ if prompt:
                 # ENGINEERING PLOTTER EXECUTION
                 # ==================================================
                 if not is_text_only:
-                    code_blocks = re.findall(r"```python(.*?)```", full_response_text, re.DOTALL)
-                    for code in code_blocks:
-                        # Cek apakah kode mengandung modul visualisasi atau hitungan
-                        keywords_trigger = ["plt.", "matplotlib", "libs_", "st.dataframe", "st.write"]
-                        if any(k in code for k in keywords_trigger):
-                            st.markdown("### ⚙️ Engine Output:")
-                            with st.container():
+                    # Hanya blok yang mengandung modul visualisasi atau hitungan
+                    code_blocks = service.extract_code_blocks(full_response_text)
+                    for i_block, code in enumerate(code_blocks):
+                        st.markdown("### ⚙️ Engine Output:")
+                        with st.container():
+                            with tracer.span("execute_generated_code", f"blok {i_block + 1}"):
                                 success = execute_generated_code(code)
-                                if success:
-                                    st.caption("✅ Eksekusi Kode Berhasil.")
-                                plt.clf()
+                            if success:
+                                st.caption("✅ Eksekusi Kode Berhasil.")
+                            plt.clf()
 
                 # ==================================================
-                # DOWNLOAD BUTTONS
+                # DOWNLOAD BUTTONS (LAZY, DIBANGUN SAAT DIMINTA)
                 # ==================================================
                 st.markdown("---")
-                col1, col2 = st.columns(2)
-                
-                docx_file = create_docx_from_text(full_response_text)
-                if docx_file:
-                    col1.download_button("📄 Download Laporan (.docx)", docx_file, f"Laporan_{final_expert_name[:5]}.docx", "application/vnd.openxmlformats-officedocument.wordprocessingml.document")
-                
-                xlsx_file = extract_table_to_excel(full_response_text)
-                if xlsx_file:
-                    col2.download_button("📊 Download Tabel (.xlsx)", xlsx_file, f"Data_{final_expert_name[:5]}.xlsx", "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet")
+                render_export_buttons(full_response_text, final_expert_name, len(history))
                 
             except Exception as e:
                 st.error(f"⚠️ Error: {e}")
+
+# --- SIMPAN METRIK REQUEST INI ---
+tracer.flush(db, nama_proyek, st.session_state.current_expert_active)
@@ -38,7 +38,7 @@ class EnginexBackend:
         self.cursor = self.conn.cursor()
 
     def init_db(self):
-        """Membuat tabel riwayat_konsultasi jika belum ada"""
+        """Membuat tabel riwayat_konsultasi, request_metrics & harga_regional jika belum ada"""
         try:
             self.cursor.execute('''
                 CREATE TABLE IF NOT EXISTS riwayat_konsultasi (
@@ -50,6 +50,34 @@ class EnginexBackend:
                     content TEXT
                 )
             ''')
+            self.cursor.execute('''
+                CREATE TABLE IF NOT EXISTS request_metrics (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    tanggal TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    request_id TEXT,
+                    project_name TEXT,
+                    gem_name TEXT,
+                    stage TEXT,
+                    detail TEXT,
+                    durasi_ms REAL
+                )
+            ''')
+            self.cursor.execute("CREATE INDEX IF NOT EXISTS idx_metrics_stage ON request_metrics (stage, id)")
+            self.cursor.execute('''
+                CREATE TABLE IF NOT EXISTS harga_regional (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    tanggal TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    wilayah TEXT NOT NULL,
+                    periode TEXT NOT NULL,
+                    versi INTEGER NOT NULL,
+                    sumber_daya TEXT NOT NULL,
+                    jenis TEXT,
+                    harga REAL NOT NULL
+                )
+            ''')
+            # Lookup per wilayah & periode (versi terakhir) lewat index, bukan scan tabel
+            self.cursor.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_harga_regional ON harga_regional (wilayah, periode, versi, sumber_daya)")
+            self.cursor.execute("CREATE INDEX IF NOT EXISTS idx_harga_periode ON harga_regional (periode, wilayah)")
             self.conn.commit()
         except Exception as e:
             print(f"❌ Error Init Database: {e}")
@@ -103,6 +131,142 @@ class EnginexBackend:
         except: 
             return []
 
+    # ==========================================
+    # FITUR METRIK PERFORMA (TRACING)
+    # ==========================================
+
+    def simpan_metrics(self, request_id, project, gem, spans):
+        """
+        Menyimpan span durasi satu request.
+        spans: list of tuple (stage, detail, durasi_ms)
+        """
+        try:
+            waktu_sekarang = datetime.now()
+            rows = [(waktu_sekarang, request_id, project, gem, stage, detail, durasi) for stage, detail, durasi in spans]
+            self.cursor.executemany(
+                "INSERT INTO request_metrics (tanggal, request_id, project_name, gem_name, stage, detail, durasi_ms) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows
+            )
+            self.conn.commit()
+        except Exception as e:
+            print(f"❌ Error Simpan Metrics: {e}")
+
+    def get_metrics_summary(self, limit=5000):
+        """Ringkasan p50/p95 durasi (ms) per stage dari N span terakhir"""
+        try:
+            query = "SELECT stage, durasi_ms FROM request_metrics ORDER BY id DESC LIMIT ?"
+            df = pd.read_sql(query, self.conn, params=(limit,))
+            if df.empty:
+                return df
+
+            grp = df.groupby('stage')['durasi_ms']
+            summary = pd.DataFrame({
+                'n': grp.count(),
+                'p50_ms': grp.quantile(0.50),
+                'p95_ms': grp.quantile(0.95),
+                'total_ms': grp.sum()
+            }).round(1)
+            return summary.sort_values('total_ms', ascending=False).reset_index()
+        except Exception as e:
+            print(f"⚠️ Gagal load metrics: {e}")
+            return pd.DataFrame()
+
+    def clear_metrics(self):
+        """Menghapus seluruh data metrik performa"""
+        try:
+            self.cursor.execute("DELETE FROM request_metrics")
+            self.conn.commit()
+        except Exception as e:
+            print(f"❌ Error Clear Metrics: {e}")
+
+    # ==========================================
+    # FITUR HARGA SATUAN REGIONAL (VERSIONED)
+    # ==========================================
+
+    def simpan_harga_regional(self, data):
+        """
+        Simpan tabel harga dasar multi-wilayah. Setiap (wilayah, periode) yang disimpan
+        mendapat versi baru (versi lama tetap ada untuk audit).
+        data: DataFrame kolom wilayah, periode, sumber_daya, harga (opsional jenis: bahan/upah).
+        Output: dict {(wilayah, periode): versi}
+        """
+        try:
+            df = pd.DataFrame(data)
+            if 'jenis' not in df.columns:
+                df['jenis'] = None
+            waktu_sekarang = datetime.now()
+            versi_baru = {}
+            for (wilayah, periode), grp in df.groupby(['wilayah', 'periode'], sort=False):
+                self.cursor.execute(
+                    "SELECT COALESCE(MAX(versi), 0) FROM harga_regional WHERE wilayah = ? AND periode = ?",
+                    (wilayah, periode)
+                )
+                versi = self.cursor.fetchone()[0] + 1
+                # Satu harga per sumber daya per versi (baris duplikat: ambil yang terakhir)
+                grp = grp.drop_duplicates('sumber_daya', keep='last')
+                rows = [(waktu_sekarang, wilayah, periode, versi, sd, jenis, float(h))
+                        for sd, jenis, h in zip(grp['sumber_daya'], grp['jenis'], grp['harga'])]
+                self.cursor.executemany(
+                    "INSERT INTO harga_regional (tanggal, wilayah, periode, versi, sumber_daya, jenis, harga) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    rows
+                )
+                versi_baru[(wilayah, periode)] = versi
+            self.conn.commit()
+            return versi_baru
+        except Exception as e:
+            self.conn.rollback()
+            print(f"❌ Error Simpan Harga Regional: {e}")
+            return {}
+
+    def get_harga_regional(self, periode, wilayah=None, versi=None):
+        """
+        Harga dasar satu periode (format panjang: wilayah, sumber_daya, jenis, harga, versi).
+        wilayah: None (semua) atau list nama wilayah. versi: None = versi terakhir tiap wilayah.
+        Hasil bisa langsung dipakai AHSP_Engine.hitung_hsp_regional / hitung_rab_regional.
+        """
+        try:
+            params = [periode]
+            filter_wilayah = ""
+            if wilayah is not None:
+                wilayah = [wilayah] if isinstance(wilayah, str) else list(wilayah)
+                filter_wilayah = f" AND wilayah IN ({','.join('?' * len(wilayah))})"
+                params += wilayah
+            if versi is None:
+                query = f"""
+                    SELECT h.wilayah, h.sumber_daya, h.jenis, h.harga, h.versi
+                    FROM harga_regional h
+                    JOIN (SELECT wilayah, MAX(versi) AS versi FROM harga_regional
+                          WHERE periode = ?{filter_wilayah} GROUP BY wilayah) v
+                      ON h.wilayah = v.wilayah AND h.versi = v.versi
+                    WHERE h.periode = ?
+                    ORDER BY h.wilayah, h.sumber_daya
+                """
+                params = params + [periode]
+            else:
+                query = f"""
+                    SELECT wilayah, sumber_daya, jenis, harga, versi FROM harga_regional
+                    WHERE periode = ?{filter_wilayah} AND versi = ?
+                    ORDER BY wilayah, sumber_daya
+                """
+                params = params + [versi]
+            return pd.read_sql(query, self.conn, params=params)
+        except Exception as e:
+            print(f"⚠️ Gagal load harga regional: {e}")
+            return pd.DataFrame(columns=['wilayah', 'sumber_daya', 'jenis', 'harga', 'versi'])
+
+    def daftar_harga_regional(self):
+        """Ringkasan data harga: wilayah, periode, versi terakhir, jumlah item"""
+        try:
+            query = """
+                SELECT wilayah, periode, MAX(versi) AS versi_terakhir, COUNT(DISTINCT sumber_daya) AS n_item,
+                       MAX(tanggal) AS update_terakhir
+                FROM harga_regional GROUP BY wilayah, periode ORDER BY periode DESC, wilayah
+            """
+            return pd.read_sql(query, self.conn)
+        except Exception as e:
+            print(f"⚠️ Gagal load daftar harga: {e}")
+            return pd.DataFrame()
+
     # ==========================================
     # FITUR MANAJEMEN DATA (BACKUP & RESTORE)
     # ==========================================
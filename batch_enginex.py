@@ -0,0 +1,156 @@
+"""
+BATCH RUNNER ENGINEX (CLI)
+Menjalankan file prompt ke banyak proyek/ahli sekaligus secara konkuren.
+
+Contoh:
+    python batch_enginex.py prompts.txt --projects "Gedung A,Gedung B" \
+        --experts "Struktur,Geoteknik" --concurrency 4 --output hasil.csv
+
+Format file prompt: satu atau lebih prompt dipisah baris berisi '---'.
+Placeholder {project} dan {expert} diganti otomatis.
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+import matplotlib
+matplotlib.use("Agg")  # Tanpa GUI
+
+import pandas as pd
+
+from backend_enginex import EnginexBackend
+from service_enginex import EnginexService
+
+def baca_prompt(path):
+    with open(path, encoding="utf-8") as f:
+        raw = f.read()
+    blok = [p.strip() for p in raw.replace("\r\n", "\n").split("\n---\n")]
+    return [p for p in blok if p]
+
+def baca_daftar(value):
+    """Daftar dipisah koma, atau @file berisi satu item per baris"""
+    if value.startswith("@"):
+        with open(value[1:], encoding="utf-8") as f:
+            return [line.strip() for line in f if line.strip()]
+    return [v.strip() for v in value.split(",") if v.strip()]
+
+async def jalankan_batch(service, jobs, concurrency, execute_code, build_exports, export_dir=None):
+    """
+    Menjalankan semua job (project, expert, prompt) dengan batas konkurensi.
+    Job dengan (project, expert) sama berbagi riwayat chat, jadi dijalankan berurutan sesuai
+    urutan file prompt; konkurensi hanya antar grup. Hasil dikembalikan dalam urutan jobs.
+    """
+    sem = asyncio.Semaphore(concurrency)
+    total = len(jobs)
+    selesai = 0
+
+    grup = {}
+    for i, (project, expert, prompt) in enumerate(jobs):
+        grup.setdefault((project, expert), []).append((i, prompt))
+
+    async def satu_job(project, expert, prompt):
+        nonlocal selesai
+        t0 = time.perf_counter()
+        hasil = await asyncio.to_thread(service.konsultasi, project, expert, prompt, execute_code, build_exports)
+        hasil["durasi_s"] = time.perf_counter() - t0
+        selesai += 1
+        status = "❌" if hasil["error"] else "✅"
+        print(f"[{selesai}/{total}] {status} {project} | {hasil['expert']} ({hasil['durasi_s']:.1f}s)", flush=True)
+
+        if export_dir and hasil["exports"]:
+            os.makedirs(export_dir, exist_ok=True)
+            for jenis, data in hasil["exports"].items():
+                nama = f"{project}_{hasil['expert'][2:]}_{selesai}.{jenis}".replace(" ", "_").replace("/", "-")
+                with open(os.path.join(export_dir, nama), "wb") as f:
+                    f.write(data)
+        return hasil
+
+    results = [None] * total
+
+    async def satu_grup(project, expert, daftar):
+        async with sem:
+            for i, prompt in daftar:
+                results[i] = await satu_job(project, expert, prompt)
+
+    await asyncio.gather(*(satu_grup(project, expert, daftar) for (project, expert), daftar in grup.items()))
+    return results
+
+def ringkas_hasil(results):
+    rows = []
+    for r in results:
+        rows.append({
+            "project": r["project"],
+            "expert": r["expert"],
+            "prompt": r["prompt"][:80],
+            "durasi_s": round(r.get("durasi_s", 0), 2),
+            "panjang_jawaban": len(r["response"]),
+            "blok_kode": len(r["code_results"]),
+            "blok_kode_gagal": sum(1 for c in r["code_results"] if not c["sukses"]),
+            "error": r["error"]
+        })
+    return pd.DataFrame(rows)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="ENGINEX batch consultation runner")
+    parser.add_argument("prompt_file", help="File teks berisi prompt (dipisah '---')")
+    parser.add_argument("--projects", required=True, help="Nama proyek dipisah koma, atau @file")
+    parser.add_argument("--experts", default="👑 The GEMS Grandmaster",
+                        help="Nama ahli (boleh sebagian) dipisah koma, @file, atau 'auto'")
+    parser.add_argument("--concurrency", type=int, default=4, help="Maksimum request paralel")
+    parser.add_argument("--model", default="gemini-1.5-flash")
+    parser.add_argument("--api-key", default=os.environ.get("GOOGLE_API_KEY"))
+    parser.add_argument("--db", default="enginex_core.db", help="Path database EnginexBackend")
+    parser.add_argument("--no-exec", action="store_true", help="Jangan eksekusi blok kode python")
+    parser.add_argument("--export-dir", help="Simpan file .docx/.xlsx hasil ke folder ini")
+    parser.add_argument("--output", help="Simpan ringkasan hasil ke CSV")
+    parser.add_argument("--profile", help="Aktifkan profiling engine, simpan laporan ke PREFIX.csv & PREFIX.prof")
+    args = parser.parse_args(argv)
+
+    if not args.api_key:
+        parser.error("API Key tidak ada. Isi --api-key atau env GOOGLE_API_KEY.")
+
+    backend = EnginexBackend(args.db)
+    service = EnginexService(api_key=args.api_key, model_name=args.model, backend=backend)
+
+    prompts = baca_prompt(args.prompt_file)
+    projects = baca_daftar(args.projects)
+    experts = baca_daftar(args.experts)
+    experts = [e if e == "auto" else service.resolve_expert(e) for e in experts]
+
+    jobs = []
+    for project in projects:
+        for expert in experts:
+            for prompt in prompts:
+                text = prompt.replace("{project}", project).replace("{expert}", expert)
+                jobs.append((project, expert, text))
+
+    if args.profile:
+        from enginex import profiling
+        profiling.enable()
+
+    print(f"🚀 {len(jobs)} job ({len(projects)} proyek x {len(experts)} ahli x {len(prompts)} prompt), "
+          f"konkurensi {args.concurrency}")
+    t0 = time.perf_counter()
+    results = asyncio.run(jalankan_batch(
+        service, jobs, max(1, args.concurrency),
+        execute_code=not args.no_exec,
+        build_exports=bool(args.export_dir),
+        export_dir=args.export_dir
+    ))
+    df = ringkas_hasil(results)
+    print(f"🏁 Selesai dalam {time.perf_counter() - t0:.1f}s | gagal: {df['error'].notna().sum()}")
+
+    if args.output:
+        df.to_csv(args.output, index=False)
+    if args.profile:
+        profiling.disable()
+        profiling.report().to_csv(f"{args.profile}.csv", index=False)
+        profiling.dump_cprofile(f"{args.profile}.prof")
+        print(f"📊 Laporan profiling: {args.profile}.csv / {args.profile}.prof")
+    backend.close()
+    return 0 if df['error'].isna().all() else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
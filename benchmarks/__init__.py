@@ -0,0 +1,3 @@
+"""
+Micro-benchmark engine ENGINEX. Jalankan dengan `python -m benchmarks run`.
+"""
@@ -0,0 +1,76 @@
+"""
+CLI benchmark ENGINEX.
+
+    python -m benchmarks run                          # jalankan & tampilkan
+    python -m benchmarks run --output hasil.json      # simpan hasil
+    python -m benchmarks run --save-baseline          # perbarui benchmarks/baseline.json
+    python -m benchmarks run --compare                # jalankan lalu bandingkan ke baseline
+    python -m benchmarks compare base.json hasil.json --threshold 0.2
+
+Exit code 1 jika ada kasus yang regresi melebihi threshold, atau kasus tanpa baseline
+(status BARU; rekam ulang baseline atau pakai --allow-new).
+"""
+import argparse
+import os
+import sys
+
+import matplotlib
+matplotlib.use("Agg")  # Tanpa GUI
+
+from . import runner
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="ENGINEX engine benchmarks")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+
+    p_run = sub.add_parser("run", help="Jalankan benchmark")
+    p_run.add_argument("--filter", help="Regex nama kasus, mis. 'sni|ahsp'")
+    p_run.add_argument("--repeat", type=int, default=5)
+    p_run.add_argument("--min-time", type=float, default=0.05, help="Durasi minimum per repeat (detik)")
+    p_run.add_argument("--output", help="Simpan hasil ke file JSON")
+    p_run.add_argument("--save-baseline", action="store_true", help=f"Tulis hasil ke {BASELINE_PATH}")
+    p_run.add_argument("--compare", nargs="?", const=BASELINE_PATH, help="Bandingkan dengan baseline JSON")
+    p_run.add_argument("--threshold", type=float, default=0.15, help="Toleransi regresi (0.15 = 15%%)")
+    p_run.add_argument("--allow-new", action="store_true", help="Kasus tanpa baseline tidak dianggap gagal")
+
+    p_cmp = sub.add_parser("compare", help="Bandingkan dua file hasil")
+    p_cmp.add_argument("baseline")
+    p_cmp.add_argument("current")
+    p_cmp.add_argument("--threshold", type=float, default=0.15)
+    p_cmp.add_argument("--allow-new", action="store_true", help="Kasus tanpa baseline tidak dianggap gagal")
+
+    args = parser.parse_args(argv)
+
+    if args.cmd == "compare":
+        baseline, current = runner.muat(args.baseline), runner.muat(args.current)
+    else:
+        current = runner.jalankan(args.filter, args.repeat, args.min_time)
+        if args.output:
+            runner.simpan(current, args.output)
+        if args.save_baseline:
+            runner.simpan(current, BASELINE_PATH)
+            print(f"💾 Baseline disimpan: {BASELINE_PATH}")
+        if not args.compare:
+            return 0
+        baseline = runner.muat(args.compare)
+
+    rows, n_regresi = runner.bandingkan(baseline, current, args.threshold)
+    print(runner.format_perbandingan(rows))
+    tanpa_baseline = [key for key, *_, status in rows if status == "BARU"]
+    gagal = False
+    if n_regresi:
+        print(f"❌ {n_regresi} kasus regresi > {args.threshold:.0%}")
+        gagal = True
+    if tanpa_baseline:
+        print(f"{'⚠️' if args.allow_new else '❌'} {len(tanpa_baseline)} kasus tanpa baseline (tidak dicek): "
+              f"{', '.join(tanpa_baseline)}")
+        gagal = gagal or not args.allow_new
+    if gagal:
+        return 1
+    print("✅ Tidak ada regresi")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,336 @@
+"""
+Daftar kasus benchmark engine ENGINEX.
+
+Setiap kasus adalah fungsi setup(n, rng) yang menyiapkan input deterministik
+dan mengembalikan callable tanpa argumen yang akan diukur waktunya.
+n = jumlah item per panggilan (1 = skalar, >1 = batch).
+Setup boleh melempar ImportError jika dependency opsional belum terinstall.
+"""
+import io
+
+import numpy as np
+import pandas as pd
+
+SEED = 20240601
+SIZES = (1, 1000)
+
+CASES = {}
+
+def benchmark(name, sizes=SIZES):
+    def deco(setup):
+        CASES[name] = {"setup": setup, "sizes": tuple(sizes)}
+        return setup
+    return deco
+
+# ==========================================
+# 1. INPUT DETERMINISTIK
+# ==========================================
+def data_balok(n, rng):
+    """Dimensi & beban balok yang realistis (mm, kNm)"""
+    b = rng.choice(np.arange(200, 501, 50), n).astype(float)
+    h = np.maximum(b + 100, rng.choice(np.arange(300, 901, 50), n)).astype(float)
+    ds = np.full(n, 50.0)
+    Mu = rng.uniform(20, 400, n)
+    As = rng.uniform(400, 3000, n)
+    return b, h, ds, Mu, As
+
+def teks_laporan(n):
+    """Teks markdown laporan dengan n bagian"""
+    blok = []
+    for i in range(n):
+        blok.append(f"## Bagian {i + 1}\n- Poin analisa {i}\n- Rekomendasi {i}\n1. Langkah {i}\n"
+                    f"Paragraf penjelasan teknis nomor {i} untuk laporan struktur.")
+    return "\n".join(blok)
+
+def buat_model_ifc(n_elemen, rng, n_lantai=10):
+    """Bytes IFC4 berisi n kolom/balok yang tersebar di beberapa lantai"""
+    import ifcopenshell
+    import ifcopenshell.guid
+
+    f = ifcopenshell.file(schema="IFC4")
+
+    def placement(xyz, parent=None):
+        loc = f.createIfcCartesianPoint(tuple(float(v) for v in xyz))
+        axis = f.createIfcAxis2Placement3D(loc, None, None)
+        return f.createIfcLocalPlacement(parent, axis)
+
+    site = placement((0, 0, 0))
+    lantai = [placement((0, 0, 4.0 * i), site) for i in range(n_lantai)]
+    xy = rng.uniform(0, 60, (n_elemen, 2))
+    for i in range(n_elemen):
+        tipe = "IfcColumn" if i % 2 else "IfcBeam"
+        lp = placement((xy[i, 0], xy[i, 1], 0.0), lantai[i % n_lantai])
+        f.create_entity(tipe, GlobalId=ifcopenshell.guid.new(), Name=f"{tipe[3:]}-{i}", ObjectPlacement=lp)
+    return f.to_string().encode("utf-8")
+
+def panggil_semua(fn, args):
+    """Panggil fn untuk tiap argumen; input yang ditolak engine (ValueError) dihitung None"""
+    hasil = []
+    for a in args:
+        try:
+            hasil.append(fn(*a))
+        except ValueError:
+            hasil.append(None)
+    return hasil
+
+# ==========================================
+# 2. ENGINE STRUKTUR
+# ==========================================
+@benchmark("sni.kebutuhan_tulangan")
+def _kebutuhan_tulangan(n, rng):
+    from enginex.sni import SNI_Concrete_2847
+    eng = SNI_Concrete_2847(25, 400)
+    b, h, ds, Mu, _ = data_balok(n, rng)
+    args = list(zip(Mu.tolist(), b.tolist(), h.tolist(), ds.tolist()))
+    return lambda: panggil_semua(eng.kebutuhan_tulangan, args)
+
+@benchmark("sni.desain_lentur_batch", sizes=(1000, 10000))
+def _desain_lentur_batch(n, rng):
+    from enginex.sni import SNI_Concrete_2847
+    eng = SNI_Concrete_2847(25, 400)
+    b, h, ds, Mu, _ = data_balok(n, rng)
+    return lambda: eng.desain_lentur_batch(Mu, b, h, ds)
+
+@benchmark("sni.hitung_momen_nominal")
+def _momen_nominal(n, rng):
+    from enginex.sni import SNI_Concrete_2847
+    eng = SNI_Concrete_2847(25, 400)
+    b, h, ds, _, As = data_balok(n, rng)
+    args = list(zip(b.tolist(), h.tolist(), As.tolist(), ds.tolist()))
+    return lambda: [eng.hitung_momen_nominal(*a) for a in args]
+
+@benchmark("sni.kebutuhan_tulangan_batch", sizes=(1, 1000, 10000))
+def _kebutuhan_tulangan_batch(n, rng):
+    from enginex.sni import SNI_Concrete_2847
+    eng = SNI_Concrete_2847(25, 400)
+    b, h, ds, Mu, _ = data_balok(n, rng)
+    return lambda: eng.kebutuhan_tulangan_batch(Mu, b, h, ds)
+
+@benchmark("sni.cek_balok_batch", sizes=(1000, 10000))
+def _cek_balok_batch(n, rng):
+    from enginex.sni import SNI_Concrete_2847
+    eng = SNI_Concrete_2847(25, 400)
+    b, h, ds, Mu, As = data_balok(n, rng)
+    df = pd.DataFrame({"b": b, "h": h, "ds": ds, "Mu": Mu, "As": As})
+    return lambda: eng.cek_balok_batch(df)
+
+@benchmark("baja.cek_balok_lentur")
+def _cek_balok_lentur(n, rng):
+    from enginex.baja import SNI_Steel_1729
+    eng = SNI_Steel_1729(240, 410)
+    Mu = rng.uniform(50, 400, n).tolist()
+    Zx = rng.choice([481, 775, 1250, 1910, 2500], n).tolist()
+    Lb = rng.uniform(1, 8, n).tolist()
+    args = [(m, {"Zx": z}, l) for m, z, l in zip(Mu, Zx, Lb)]
+    return lambda: [eng.cek_balok_lentur(*a) for a in args]
+
+@benchmark("baja.cek_lentur_katalog", sizes=(1, 100))
+def _cek_lentur_katalog(n, rng):
+    from enginex.baja import SNI_Steel_1729
+    eng = SNI_Steel_1729(240, 410)
+    # n = jumlah kombinasi Mu/Lb, tiap kombinasi mengevaluasi seluruh katalog
+    args = list(zip(rng.uniform(50, 400, n).tolist(), rng.uniform(1, 8, n).tolist()))
+    return lambda: [eng.pilih_profil_teringan(m, l) for m, l in args]
+
+@benchmark("profil_baja.indeks", sizes=(1, 1000))
+def _profil_indeks(n, rng):
+    from enginex import profil_baja
+    kat = profil_baja.katalog()
+    # n = jumlah query rentang "Zx >= X dan h <= D, urut kg/m"
+    args = list(zip(rng.uniform(1e5, 1e7, n).tolist(), rng.uniform(200, 1200, n).tolist()))
+    return lambda: [kat.indeks(Zx_min=z, h_max=h) for z, h in args]
+
+@benchmark("bridge.analisis_momen_gelagar")
+def _momen_gelagar(n, rng):
+    from enginex.bridge import SNI_Bridge_Loader
+    loaders = [SNI_Bridge_Loader(L) for L in rng.uniform(10, 100, n).tolist()]
+    jarak = rng.uniform(1.2, 2.0, n).tolist()
+    return lambda: [ld.analisis_momen_gelagar(s) for ld, s in zip(loaders, jarak)]
+
+@benchmark("gempa.hitung_base_shear")
+def _base_shear(n, rng):
+    from enginex.gempa import SNI_Gempa_1726
+    engines = [SNI_Gempa_1726(ss, s1, site) for ss, s1, site in zip(
+        rng.uniform(0.3, 1.5, n).tolist(), rng.uniform(0.1, 0.6, n).tolist(),
+        rng.choice(["SC", "SD", "SE"], n).tolist())]
+    W = rng.uniform(1000, 50000, n).tolist()
+    return lambda: [e.hitung_base_shear(w, 8.0) for e, w in zip(engines, W)]
+
+# ==========================================
+# 3. ENGINE GEOTEKNIK & PONDASI
+# ==========================================
+@benchmark("geoteknik.hitung_talud_batu_kali")
+def _talud(n, rng):
+    from enginex.geoteknik import Geotech_Engine
+    eng = Geotech_Engine(18.0, 30.0, 5.0)
+    H = rng.uniform(1, 6, n).tolist()
+    return lambda: [eng.hitung_talud_batu_kali(t, 0.4, 0.4 + 0.5 * t) for t in H]
+
+@benchmark("geoteknik.hitung_bore_pile")
+def _bore_pile(n, rng):
+    from enginex.geoteknik import Geotech_Engine
+    eng = Geotech_Engine(18.0, 30.0, 5.0)
+    args = list(zip(rng.choice([40, 60, 80, 100], n).tolist(), rng.uniform(6, 30, n).tolist(),
+                    rng.uniform(5, 50, n).tolist()))
+    return lambda: [eng.hitung_bore_pile(*a) for a in args]
+
+@benchmark("pondasi.hitung_footplate")
+def _footplate(n, rng):
+    from enginex.pondasi import Foundation_Engine
+    eng = Foundation_Engine(150.0)
+    args = list(zip(rng.uniform(100, 2000, n).tolist(), rng.uniform(1, 3, n).tolist()))
+    return lambda: [eng.hitung_footplate(p, B, B, 300) for p, B in args]
+
+@benchmark("sweep.talud", sizes=(1000, 20000))
+def _sweep_talud(n, rng):
+    from enginex.geoteknik import Geotech_Engine
+    from enginex import sweep
+    grid = {"phi": [25, 30, 35, 40], "H": np.linspace(1, 6, n // 4), "b_bawah": [1.5]}
+    # workers=1: ukur overhead runner per titik (tanpa variasi jumlah core)
+    return lambda: sweep.jalankan_sweep(Geotech_Engine.hitung_talud_batu_kali, grid,
+                                        fixed={"gamma_tanah": 18.0, "c": 5.0, "b_atas": 0.4}, workers=1)
+
+# ==========================================
+# 4. BIAYA & OPTIMASI
+# ==========================================
+@benchmark("ahsp.hitung_hsp")
+def _hitung_hsp(n, rng):
+    from enginex.ahsp import AHSP_Engine
+    eng = AHSP_Engine()
+    harga = {'semen': 1500, 'pasir': 250000, 'split': 300000, 'kayu': 3500000, 'besi': 14000,
+             'batu kali': 280000, 'bata merah': 900, 'pekerja': 110000, 'tukang': 135000, 'mandor': 160000}
+    kode = rng.choice(sorted(eng.koefisien), n).tolist()
+    return lambda: [eng.hitung_hsp(k, harga, harga) for k in kode]
+
+@benchmark("ahsp.hitung_rab", sizes=(1000, 50000))
+def _hitung_rab(n, rng):
+    from enginex.ahsp import AHSP_Engine
+    eng = AHSP_Engine()
+    harga = {'semen': 1500, 'pasir': 250000, 'split': 300000, 'kayu': 3500000, 'besi': 14000,
+             'batu kali': 280000, 'bata merah': 900, 'pekerja': 110000, 'tukang': 135000, 'mandor': 160000}
+    boq = pd.DataFrame({"kode": rng.choice(sorted(eng.koefisien) + ["beton_k275"], n),
+                        "volume": rng.uniform(1, 100, n),
+                        "divisi": rng.choice(["I. PERSIAPAN", "II. STRUKTUR", "III. ARSITEKTUR"], n)})
+    return lambda: eng.hitung_rab(boq, harga, harga)
+
+@benchmark("ahsp.simulasi_risiko", sizes=(10000, 100000))
+def _simulasi_risiko(n, rng):
+    from enginex.ahsp import AHSP_Engine, RAB_Risk_Engine
+    eng = RAB_Risk_Engine(AHSP_Engine())
+    harga = {'semen': 1500, 'pasir': 250000, 'split': 300000, 'kayu': 3500000, 'besi': 14000,
+             'batu kali': 280000, 'bata merah': 900, 'pekerja': 110000, 'tukang': 135000, 'mandor': 160000}
+    boq = pd.DataFrame({"kode": rng.choice(sorted(eng.engine.koefisien), 5000), "volume": rng.uniform(1, 100, 5000)})
+    # n = jumlah iterasi Monte Carlo
+    return lambda: eng.simulasi(boq, harga, harga, ketidakpastian_harga={"*": ("triangular", 0.9, 1.0, 1.3)},
+                                ketidakpastian_volume={"*": ("lognormal", 0.05)},
+                                korelasi={("semen", "besi"): 0.6}, n_iter=n, seed=SEED)
+
+@benchmark("ahsp.muat_katalog_cache", sizes=(1000, 5000))
+def _muat_katalog(n, rng):
+    import tempfile
+    from enginex import ahsp
+    folder = tempfile.mkdtemp(prefix="bench_ahsp_")
+    item = [f"Bahan {i} (kg)" for i in range(300)]
+    rows = [(f"A.{a}", f"Pekerjaan {a}", "bahan", it, k)
+            for a in range(n) for it, k in zip(rng.choice(item, 6), rng.uniform(0.01, 10, 6).tolist())]
+    path = f"{folder}/ahsp.csv"
+    pd.DataFrame(rows, columns=["kode", "uraian", "jenis", "item", "koefisien"]).to_csv(path, index=False)
+    ahsp.muat_katalog(path)  # kompilasi pertama -> cache biner
+    # n = jumlah analisa; yang diukur load dari cache (hash file + mmap)
+    return lambda: ahsp.muat_katalog(path)
+
+@benchmark("ahsp.cocokkan_boq", sizes=(100, 1000))
+def _cocokkan_boq(n, rng):
+    from enginex.ahsp import AHSPMatcher, KatalogAHSP
+    kata = ["pasangan", "plesteran", "beton", "bekisting", "galian", "urugan", "cat", "keramik",
+            "dinding", "lantai", "kolom", "balok", "pondasi", "tanah", "pasir", "bata", "besi", "kayu"]
+    desc = [" ".join(rng.choice(kata, 4)) + f" tipe {i}" for i in range(3000)]
+    kat = KatalogAHSP.dari_koefisien({f"a{i}": {"desc": d, "bahan": {"semen": 1.0}} for i, d in enumerate(desc)})
+    # Uraian BOQ = uraian analisa dengan kata tertukar/terpotong; n = jumlah baris unik
+    uraian = [" ".join(rng.permutation(d.split())[:4]) for d in rng.choice(desc, n)]
+    # Matcher baru tiap panggilan -> yang diukur pencocokan tanpa cache (termasuk bangun index)
+    return lambda: AHSPMatcher(kat).cocokkan_batch(uraian)
+
+@benchmark("optimizer.cari_dimensi_optimal", sizes=(1, 50))
+def _dimensi_optimal(n, rng):
+    from enginex.optimizer import BeamOptimizer
+    opt = BeamOptimizer(25, 400, {'beton': 1100000, 'baja': 14000, 'bekisting': 150000})
+    args = list(zip(rng.uniform(50, 500, n).tolist(), rng.uniform(4, 9, n).tolist()))
+    return lambda: [opt.cari_dimensi_optimal(m, L) for m, L in args]
+
+@benchmark("optimizer.cari_dimensi_optimal_grid_halus", sizes=(1, 50))
+def _dimensi_optimal_halus(n, rng):
+    from enginex.optimizer import BeamOptimizer
+    opt = BeamOptimizer(25, 400, {'beton': 1100000, 'baja': 14000, 'bekisting': 150000})
+    args = list(zip(rng.uniform(50, 500, n).tolist(), rng.uniform(4, 9, n).tolist()))
+    return lambda: [opt.cari_dimensi_optimal(m, L, step=25, b_max=800, h_max=1500) for m, L in args]
+
+@benchmark("optimizer.rebar_pilih_batch", sizes=(100, 5000))
+def _rebar_batch(n, rng):
+    from enginex.optimizer import RebarSelector
+    b = rng.choice(np.arange(200, 501, 50), n)
+    As_req = rng.uniform(200, 4000, n)
+    # Selector baru tiap panggilan: ukur pencarian branch-and-bound, bukan cache
+    return lambda: RebarSelector().pilih_batch(b, As_req)
+
+@benchmark("optimizer.optimasi_gedung", sizes=(100, 2000))
+def _optimasi_gedung(n, rng):
+    from enginex.optimizer import BuildingBeamOptimizer
+    harga = {'beton': 1100000, 'baja': 14000, 'bekisting': 150000}
+    df = pd.DataFrame({"id": np.arange(n), "Mu": rng.uniform(50, 450, n), "bentang": rng.uniform(4, 9, n)})
+    # Instance baru tiap panggilan: ukur solve penuh, bukan cache hit
+    return lambda: BuildingBeamOptimizer(25, 400, harga).optimasi(df, max_tipe=6)
+
+@benchmark("optimizer.pareto_proyek", sizes=(100, 2000))
+def _pareto_proyek(n, rng):
+    from enginex.optimizer import BuildingBeamOptimizer
+    opt = BuildingBeamOptimizer(25, 400, {'beton': 1100000, 'baja': 14000, 'bekisting': 150000})
+    df = pd.DataFrame({"id": np.arange(n), "Mu": rng.uniform(50, 450, n), "bentang": rng.uniform(4, 9, n)})
+    return lambda: opt.pareto_proyek(df)
+
+# ==========================================
+# 5. BIM (IFC)
+# ==========================================
+@benchmark("bim_importer.parse_structure", sizes=(100, 2000))
+def _ifc_parse(n, rng):
+    from enginex.bim_importer import IFC_Parser_Engine
+    data = buat_model_ifc(n, rng)
+    return lambda: IFC_Parser_Engine(io.BytesIO(data)).parse_structure()
+
+# ==========================================
+# 6. EXPORTER
+# ==========================================
+@benchmark("export.civil3d_csv", sizes=(10, 10000))
+def _civil3d(n, rng):
+    from export_enginex import EnginexExporter
+    df = pd.DataFrame({"x": rng.uniform(0, 1e3, n), "y": rng.uniform(0, 1e3, n),
+                       "z": rng.uniform(0, 50, n), "desc": "TITIK"})
+    return lambda: EnginexExporter.export_to_civil3d_csv(df)
+
+@benchmark("export.geospatial_map", sizes=(10, 1000))
+def _geomap(n, rng):
+    from export_enginex import EnginexExporter
+    lon = rng.uniform(95, 141, n); lat = rng.uniform(-11, 6, n)
+    placemark = "".join(f"<Placemark><name>P{i}</name><Point><coordinates>{x},{y},0</coordinates></Point></Placemark>"
+                        for i, (x, y) in enumerate(zip(lon, lat)))
+    kml = f'<kml xmlns="http://www.opengis.net/kml/2.2"><Document>{placemark}</Document></kml>'
+    return lambda: EnginexExporter.render_geospatial_map(kml, "kml")
+
+@benchmark("export.pupr_excel", sizes=(10, 5000))
+def _pupr_excel(n, rng):
+    from export_enginex import EnginexExporter
+    df = pd.DataFrame({"Uraian": [f"Item {i}" for i in range(n)], "Volume": rng.uniform(1, 100, n),
+                       "Harga": rng.uniform(1e4, 1e7, n)})
+    return lambda: EnginexExporter.create_pupr_excel(df)
+
+@benchmark("export.pupr_word", sizes=(5, 200))
+def _pupr_word(n, rng):
+    from export_enginex import EnginexExporter
+    teks = teks_laporan(n)
+    return lambda: EnginexExporter.create_pupr_word(teks, "Benchmark")
+
+@benchmark("export.pupr_pptx", sizes=(5, 100))
+def _pupr_pptx(n, rng):
+    from export_enginex import EnginexExporter
+    teks = teks_laporan(n)
+    return lambda: EnginexExporter.create_pupr_pptx(teks, "Benchmark")
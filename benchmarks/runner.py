@@ -0,0 +1,131 @@
+"""
+Runner benchmark: pengukuran waktu, simpan baseline JSON, dan perbandingan regresi.
+"""
+import json
+import platform
+import re
+import sys
+import time
+import zlib
+from datetime import datetime
+
+import numpy as np
+
+from .cases import CASES, SEED
+
+def _rng_for(name, n):
+    # Seed stabil per kasus & ukuran (tidak tergantung urutan/filter kasus)
+    return np.random.default_rng([SEED, zlib.crc32(name.encode()), n])
+
+def ukur(fn, repeat=5, min_time=0.05):
+    """
+    Kalibrasi jumlah loop agar satu repeat >= min_time detik,
+    lalu kembalikan list waktu per panggilan (detik) untuk tiap repeat.
+    """
+    fn()  # warm-up (import, cache)
+    loops = 1
+    while True:
+        t0 = time.perf_counter()
+        for _ in range(loops):
+            fn()
+        dt = time.perf_counter() - t0
+        if dt >= min_time or loops >= 1_000_000:
+            break
+        loops *= 2 if dt == 0 else max(2, min(10, int(min_time / dt) + 1))
+
+    hasil = [dt / loops]
+    for _ in range(repeat - 1):
+        t0 = time.perf_counter()
+        for _ in range(loops):
+            fn()
+        hasil.append((time.perf_counter() - t0) / loops)
+    return hasil, loops
+
+def jalankan(filter_regex=None, repeat=5, min_time=0.05, log=print):
+    """Jalankan semua kasus (opsional difilter regex nama). Return dict hasil siap JSON."""
+    pola = re.compile(filter_regex) if filter_regex else None
+    results = {}
+    skipped = {}
+    for name, case in CASES.items():
+        if pola and not pola.search(name):
+            continue
+        for n in case["sizes"]:
+            key = f"{name}[n={n}]"
+            try:
+                fn = case["setup"](n, _rng_for(name, n))
+            except ImportError as e:
+                skipped[key] = f"dependency tidak ada: {e.name or e}"
+                log(f"⏭️  {key:<45} dilewati ({skipped[key]})")
+                continue
+            times, loops = ukur(fn, repeat, min_time)
+            median = float(np.median(times))
+            results[key] = {
+                "case": name,
+                "n": n,
+                "loops": loops,
+                "median_s": median,
+                "min_s": float(min(times)),
+                "per_item_us": median / n * 1e6,
+            }
+            log(f"⏱️  {key:<45} {median * 1e3:10.3f} ms  ({median / n * 1e6:9.2f} µs/item)")
+
+    return {
+        "meta": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "python": sys.version.split()[0],
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+            "repeat": repeat,
+            "min_time": min_time,
+            "filter": filter_regex,
+        },
+        "results": results,
+        "skipped": skipped,
+    }
+
+def simpan(data, path):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+
+def muat(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+def bandingkan(baseline, current, threshold=0.15):
+    """
+    Bandingkan median per kasus. Return (rows, n_regresi).
+    Kasus dianggap regresi jika lebih lambat dari baseline * (1 + threshold).
+    """
+    base = baseline["results"]
+    rows = []
+    n_regresi = 0
+    for key, cur in current["results"].items():
+        if key not in base:
+            rows.append((key, None, cur["median_s"], None, "BARU"))
+            continue
+        ratio = cur["median_s"] / base[key]["median_s"] if base[key]["median_s"] > 0 else float("inf")
+        if ratio > 1 + threshold:
+            status = "REGRESI"
+            n_regresi += 1
+        elif ratio < 1 - threshold:
+            status = "LEBIH CEPAT"
+        else:
+            status = "OK"
+        rows.append((key, base[key]["median_s"], cur["median_s"], ratio, status))
+    # Jika run difilter, kasus di luar filter bukan "hilang"
+    if current.get("meta", {}).get("filter"):
+        return rows, n_regresi
+    for key in base:
+        if key not in current["results"] and key not in current.get("skipped", {}):
+            rows.append((key, base[key]["median_s"], None, None, "HILANG"))
+    return rows, n_regresi
+
+def format_perbandingan(rows):
+    lines = [f"{'Kasus':<45} {'Baseline (ms)':>14} {'Sekarang (ms)':>14} {'Rasio':>8}  Status"]
+    for key, b, c, ratio, status in rows:
+        fb = f"{b * 1e3:14.3f}" if b is not None else f"{'-':>14}"
+        fc = f"{c * 1e3:14.3f}" if c is not None else f"{'-':>14}"
+        fr = f"{ratio:8.2f}" if ratio is not None else f"{'-':>8}"
+        lines.append(f"{key:<45} {fb} {fc} {fr}  {status}")
+    return "\n".join(lines)
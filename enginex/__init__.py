@@ -0,0 +1,70 @@
+"""
+ENGINEX - Paket engine perhitungan teknik sipil.
+
+Submodule di-load secara lazy (PEP 562): `import enginex` tidak mem-parse
+engine apa pun sampai atributnya diakses, mis. `enginex.sni.SNI_Concrete_2847`.
+Nama lama `libs_*` tetap tersedia lewat shim di root repo dan LIBS_ALIASES.
+"""
+import importlib
+import re
+
+__version__ = "11.0.0"
+
+# Submodule engine -> nama lama (libs_*) yang dipakai kode AI & skrip lama
+LIBS_ALIASES = {
+    "libs_sni": "sni",
+    "libs_ahsp": "ahsp",
+    "libs_baja": "baja",
+    "libs_bridge": "bridge",
+    "libs_gempa": "gempa",
+    "libs_geoteknik": "geoteknik",
+    "libs_optimizer": "optimizer",
+    "libs_pondasi": "pondasi",
+    "libs_sustainability": "sustainability",
+    "libs_bim_importer": "bim_importer",
+    "libs_tools": "tools",
+    "libs_export": "export",
+    "libs_pdf": "pdf",
+    "libs_report_generator": "report_generator",
+}
+
+# Submodule utilitas tanpa nama libs_* lama
+_UTILITY_SUBMODULES = frozenset({"profiling", "profil_baja", "sweep"})
+
+_SUBMODULES = frozenset(LIBS_ALIASES.values()) | _UTILITY_SUBMODULES
+_LIBS_RE = re.compile(r"\blibs_[a-z_]+\b")
+
+__all__ = sorted(_SUBMODULES) + ["LIBS_ALIASES", "load_lib", "namespace_for"]
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        module = importlib.import_module(f".{name}", __name__)
+        globals()[name] = module  # akses berikutnya tidak lewat __getattr__ lagi
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(set(globals()) | _SUBMODULES)
+
+def load_lib(libs_name):
+    """Load engine berdasarkan nama lama, mis. load_lib('libs_sni') -> enginex.sni"""
+    return __getattr__(LIBS_ALIASES[libs_name])
+
+def namespace_for(code_str=None):
+    """
+    Dict {'libs_*': module} untuk eksekusi kode AI.
+    Jika code_str diberikan, hanya engine yang disebut di kode yang di-load.
+    Engine dengan dependency opsional yang belum terinstall (mis. ifcopenshell) dilewati.
+    """
+    if code_str is None:
+        names = LIBS_ALIASES
+    else:
+        names = [n for n in dict.fromkeys(_LIBS_RE.findall(code_str)) if n in LIBS_ALIASES]
+
+    namespace = {}
+    for libs_name in names:
+        try:
+            namespace[libs_name] = load_lib(libs_name)
+        except ImportError:
+            continue
+    return namespace
@@ -0,0 +1,1002 @@
+import hashlib
+import os
+import re
+import shutil
+import tempfile
+import threading
+from functools import lru_cache
+from types import MappingProxyType
+
+import numpy as np
+import pandas as pd
+
+# ==========================================
+# 1. DATABASE KOEFISIEN AHSP (SNI/Permen PUPR)
+# ==========================================
+# Tabel analisa standar (immutable setelah dikompilasi). Diperluas agar AI tidak bingung.
+_AHSP_STANDAR = {
+    # --- BETON ---
+    "beton_k175": {
+        "desc": "Beton K-175 (fc 14.5 MPa)",
+        "bahan": {"Semen (kg)": 326, "Pasir (m3)": 0.52, "Split (m3)": 0.76},
+        "upah": {"Pekerja": 1.65, "Tukang": 0.275, "Mandor": 0.083}
+    },
+    "beton_k225": {
+        "desc": "Beton K-225 (fc 19 MPa)",
+        "bahan": {"Semen (kg)": 371, "Pasir (m3)": 0.498, "Split (m3)": 0.77},
+        "upah": {"Pekerja": 1.65, "Tukang": 0.275, "Mandor": 0.083}
+    },
+    "beton_k250": {
+        "desc": "Beton K-250 (fc 21.7 MPa)",
+        "bahan": {"Semen (kg)": 384, "Pasir (m3)": 0.494, "Split (m3)": 0.77},
+        "upah": {"Pekerja": 1.65, "Tukang": 0.275, "Mandor": 0.083}
+    },
+    "beton_k300": {
+        "desc": "Beton K-300 (fc 25 MPa)",
+        "bahan": {"Semen (kg)": 413, "Pasir (m3)": 0.48, "Split (m3)": 0.77},
+        "upah": {"Pekerja": 1.65, "Tukang": 0.275, "Mandor": 0.083}
+    },
+    "beton_k350": {
+        "desc": "Beton K-350 (fc 29 MPa)",
+        "bahan": {"Semen (kg)": 448, "Pasir (m3)": 0.47, "Split (m3)": 0.76},
+        "upah": {"Pekerja": 1.65, "Tukang": 0.275, "Mandor": 0.083}
+    },
+
+    # --- BESI ---
+    "pembesian_polos": {
+        "desc": "Pembesian 10 kg dengan Besi Polos/Ulir",
+        "bahan": {"Besi Beton (kg)": 10.5, "Kawat Beton (kg)": 0.15},
+        "upah": {"Pekerja": 0.07, "Tukang": 0.07, "Mandor": 0.004}
+    },
+    "bekisting_balok": {
+        "desc": "Pemasangan 1 m2 Bekisting Balok (Kayu)",
+        "bahan": {"Kayu Kelas III (m3)": 0.04, "Paku (kg)": 0.4, "Minyak Bekisting (L)": 0.2},
+        "upah": {"Pekerja": 0.66, "Tukang": 0.33, "Mandor": 0.033}
+    },
+    "bekisting_kolom": {
+        "desc": "Pemasangan 1 m2 Bekisting Kolom",
+        "bahan": {"Kayu Kelas III (m3)": 0.04, "Paku (kg)": 0.4, "Minyak (L)": 0.2, "Plywood 9mm (lbr)": 0.35},
+        "upah": {"Pekerja": 0.66, "Tukang": 0.33, "Mandor": 0.033}
+    },
+
+    # --- PONDASI ---
+    "pasangan_batu_kali": {
+        "desc": "Pasangan Batu Kali 1:4 (Talud)",
+        "bahan": {"Batu Kali (m3)": 1.2, "Semen (kg)": 163, "Pasir (m3)": 0.52},
+        "upah": {"Pekerja": 1.5, "Tukang": 0.75, "Mandor": 0.075}
+    },
+    "bore_pile_k300": {
+        "desc": "Pengecoran Bore Pile K-300",
+        "bahan": {"Beton K300 (m3)": 1.05},
+        "upah": {"Pekerja": 2.0, "Tukang": 0.5, "Mandor": 0.1}
+    },
+
+    # --- ARSITEKTUR ---
+    "pasangan_bata_merah": {
+        "desc": "Pasangan Dinding Bata Merah 1:4",
+        "bahan": {"Bata Merah (bh)": 70, "Semen (kg)": 11.5, "Pasir (m3)": 0.043},
+        "upah": {"Pekerja": 0.3, "Tukang": 0.1, "Mandor": 0.015}
+    },
+    "plesteran": {
+        "desc": "Plesteran 1:4 Tebal 15mm",
+        "bahan": {"Semen (kg)": 6.24, "Pasir (m3)": 0.024},
+        "upah": {"Pekerja": 0.3, "Tukang": 0.15, "Mandor": 0.015}
+    },
+    "acian": {
+        "desc": "Acian Semen",
+        "bahan": {"Semen (kg)": 3.25},
+        "upah": {"Pekerja": 0.2, "Tukang": 0.1, "Mandor": 0.01}
+    },
+    "cat_tembok": {
+        "desc": "Pengecatan Tembok (2 Lapis)",
+        "bahan": {"Cat Tembok (kg)": 0.26, "Plamir (kg)": 0.1},
+        "upah": {"Pekerja": 0.02, "Tukang": 0.063, "Mandor": 0.003}
+    },
+    "pasang_kus_pintu": {
+        "desc": "Pemasangan Kusen Pintu/Jendela",
+        "bahan": {"Angkur (bh)": 4},
+        "upah": {"Pekerja": 0.5, "Tukang": 1.0, "Mandor": 0.05}
+    },
+    "pasang_pipa_pvc": {
+        "desc": "Pasang Pipa PVC AW 3/4 inch",
+        "bahan": {"Pipa PVC (m)": 1.2, "Perlengkapan (ls)": 0.35},
+        "upah": {"Pekerja": 0.036, "Tukang": 0.06, "Mandor": 0.002}
+    }
+}
+
+# Aturan pencocokan nama item bahan -> id sumber daya kanonik (= key harga_bahan_dasar).
+# Urutan penting: aturan pertama yang cocok dipakai. Berbeda dengan rantai if/elif versi lama:
+#   - "kawat" dicek sebelum "beton", jadi Kawat Beton dihargai 'kawat beton' (dulu 'beton k300');
+#   - item yang tidak cocok memakai nama bersihnya sendiri sebagai id (mis. "Plamir (kg)" ->
+#     "plamir", "Angkur (bh)" -> "angkur"), dulu selalu dihargai 0.
+# Harga 0 tetap berlaku bila id tersebut tidak ada di harga_bahan_dasar.
+ATURAN_BAHAN = (
+    ("semen", "semen"),
+    ("pasir", "pasir"),
+    ("split", "split"),
+    ("kayu", "kayu"),
+    ("besi", "besi"),
+    ("batu kali", "batu kali"),
+    ("kawat", "kawat beton"), # bukan beton ready-mix
+    ("beton", "beton k300"),
+    ("bata", "bata merah"),
+    ("cat", "cat tembok"),
+    ("pipa", "pipa pvc"),
+    ("plywood", "plywood"),
+    ("paku", "paku"),
+    ("minyak", "minyak"),
+)
+
+_SATUAN_RE = re.compile(r"\(([^)]*)\)")
+
+def id_sumber_daya(nama_item, jenis="bahan"):
+    """Nama item analisa -> id sumber daya kanonik. Upah: nama huruf kecil (pekerja, tukang, mandor)."""
+    if jenis == "upah":
+        return nama_item.lower()
+    key_clean = nama_item.split(" (")[0].lower()
+    for kata, sid in ATURAN_BAHAN:
+        if kata in key_clean:
+            return sid
+    return key_clean
+
+def _bekukan(obj):
+    if isinstance(obj, dict):
+        return MappingProxyType({k: _bekukan(v) for k, v in obj.items()})
+    return obj
+
+class KatalogAHSP:
+    """
+    Katalog AHSP terkompilasi: matriks koefisien padat (analisa x sumber daya).
+    HSP seluruh analisa = K @ vektor_harga (satu perkalian matriks-vektor).
+    """
+    def __init__(self, kode, desc, sumber, jenis_sumber, satuan, K):
+        self.kode = tuple(kode)
+        self.desc = tuple(desc)
+        self.sumber = tuple(sumber) # id sumber daya kanonik
+        self.jenis_sumber = np.asarray(jenis_sumber, dtype=np.int8) # 0 = bahan, 1 = upah
+        self.satuan = tuple(satuan)
+        self.K = np.asarray(K, dtype=float)
+        self.K.setflags(write=False)
+        self.jenis_sumber.setflags(write=False)
+        self.index_kode = {k: i for i, k in enumerate(self.kode)}
+        self.index_sumber = {s: j for j, s in enumerate(self.sumber)}
+        self._koefisien = None
+        self._cache_hsp = {}
+        self._terakhir = None
+        self._matcher = None
+
+    @property
+    def matcher(self):
+        """Index trigram kode & uraian analisa (dibangun sekali per katalog, saat pertama dipakai)"""
+        if self._matcher is None:
+            self._matcher = AHSPMatcher(self)
+        return self._matcher
+
+    @classmethod
+    def dari_koefisien(cls, koefisien):
+        """Kompilasi dict {kode: {desc, bahan: {item: koef}, upah: {item: koef}}}"""
+        sumber, jenis, satuan, idx = [], [], [], {}
+        entri = []
+        for kode, data in koefisien.items():
+            for j_kode, kelompok in ((0, "bahan"), (1, "upah")):
+                for item, koef in data.get(kelompok, {}).items():
+                    sid = id_sumber_daya(item, kelompok)
+                    if (sid, j_kode) not in idx:
+                        idx[(sid, j_kode)] = len(sumber)
+                        sumber.append(sid)
+                        jenis.append(j_kode)
+                        m = _SATUAN_RE.search(item)
+                        satuan.append(m.group(1) if m else ("OH" if j_kode else ""))
+                    entri.append((kode, idx[(sid, j_kode)], koef))
+        kode_list = list(koefisien)
+        baris = {k: i for i, k in enumerate(kode_list)}
+        K = np.zeros((len(kode_list), len(sumber)))
+        for kode, j, koef in entri:
+            K[baris[kode], j] += koef
+        katalog = cls(kode_list, [koefisien[k].get("desc", k) for k in kode_list], sumber, jenis, satuan, K)
+        katalog._koefisien = _bekukan(koefisien)
+        return katalog
+
+    @property
+    def koefisien(self):
+        """Tampilan dict (read-only) {kode: {desc, bahan, upah}} untuk kompatibilitas kode lama"""
+        if self._koefisien is None:
+            data = {}
+            for i, kode in enumerate(self.kode):
+                nz = np.nonzero(self.K[i])[0]
+                data[kode] = {
+                    "desc": self.desc[i],
+                    "bahan": {f"{self.sumber[j]} ({self.satuan[j]})": float(self.K[i, j]) for j in nz if self.jenis_sumber[j] == 0},
+                    "upah": {self.sumber[j].title(): float(self.K[i, j]) for j in nz if self.jenis_sumber[j] == 1},
+                }
+            self._koefisien = _bekukan(data)
+        return self._koefisien
+
+    def vektor_harga(self, harga_bahan_dasar, harga_upah_dasar):
+        """Dict harga dasar -> vektor harga per sumber daya (0 jika tidak ada)"""
+        return np.array([(harga_upah_dasar if j else harga_bahan_dasar).get(s, 0)
+                         for s, j in zip(self.sumber, self.jenis_sumber.tolist())], dtype=float)
+
+    def matriks_harga(self, harga_regional):
+        """
+        Harga multi-wilayah -> (daftar wilayah, matriks P wilayah x sumber daya).
+        harga_regional: DataFrame lebar (index = wilayah, kolom = id sumber daya) atau
+        format panjang dengan kolom 'wilayah', 'sumber_daya', 'harga' (mis. dari database).
+        Sumber daya yang tidak ada harganya = 0 (sama dengan dict harga).
+        """
+        df = pd.DataFrame(harga_regional)
+        if {'wilayah', 'sumber_daya', 'harga'} <= set(df.columns):
+            df = df.pivot_table(index='wilayah', columns='sumber_daya', values='harga', aggfunc='last')
+        P = df.reindex(columns=list(self.sumber)).fillna(0).to_numpy(dtype=float)
+        return list(df.index), P
+
+    def hsp(self, harga_bahan_dasar, harga_upah_dasar):
+        """HSP seluruh analisa (array urut self.kode), di-cache per set harga"""
+        # Jalur cepat: set harga sama dengan panggilan terakhir (perbandingan dict, tanpa hashing)
+        terakhir = self._terakhir
+        if terakhir is not None and terakhir[0] == harga_bahan_dasar and terakhir[1] == harga_upah_dasar:
+            return terakhir[2]
+        try:
+            key = (tuple(harga_bahan_dasar.items()), tuple(harga_upah_dasar.items()))
+            hasil = self._cache_hsp.get(key)
+        except TypeError: # harga tidak hashable -> tanpa cache
+            key, hasil = None, None
+        if hasil is None:
+            hasil = self.K @ self.vektor_harga(harga_bahan_dasar, harga_upah_dasar)
+            hasil.setflags(write=False)
+            if key is not None:
+                if len(self._cache_hsp) >= 256:
+                    self._cache_hsp.clear()
+                self._cache_hsp[key] = hasil
+        self._terakhir = (dict(harga_bahan_dasar), dict(harga_upah_dasar), hasil)
+        return hasil
+
+# ==========================================
+# PENCOCOKAN FUZZY (TRIGRAM)
+# ==========================================
+_NON_ALNUM_RE = re.compile(r"[^0-9a-z]+")
+_MUTU_BETON_RE = re.compile(r"beton\D{0,10}?k\s*-?\s*(\d{3})")
+
+def normalisasi_teks(teks):
+    return _NON_ALNUM_RE.sub(" ", str(teks).lower()).strip()
+
+def trigram(teks):
+    """Set trigram karakter dari teks ternormalisasi (dengan padding spasi)"""
+    t = f" {normalisasi_teks(teks)} "
+    return {t[i:i + 3] for i in range(len(t) - 2)}
+
+class AHSPMatcher:
+    """
+    Inverted index trigram atas kode + uraian analisa.
+    Skor (0..1) = rata-rata koefisien Dice 2|Q∩D| / (|Q| + |D|) dan cakupan query |Q∩D| / |Q|,
+    supaya query pendek ("cat") tetap cocok dengan uraian analisa yang panjang.
+    Tiap trigram dibobot IDF, jadi kata umum ("pemasangan") tidak mendominasi skor.
+    Hasil cocok teks bebas di-cache per proyek.
+    """
+    def __init__(self, katalog):
+        self.katalog = katalog
+        vocab = {}
+        doc_ids, tri_ids, n_tri = [], [], []
+        for i, (kode, desc) in enumerate(zip(katalog.kode, katalog.desc)):
+            tri = trigram(f"{kode.replace('_', ' ')} {desc}")
+            n_tri.append(len(tri))
+            for t in tri:
+                tri_ids.append(vocab.setdefault(t, len(vocab)))
+                doc_ids.append(i)
+        self.vocab = vocab
+        n_doc = len(katalog.kode)
+        # Postings format CSR: dokumen untuk trigram t = indices[indptr[t]:indptr[t+1]]
+        tri_ids = np.asarray(tri_ids, dtype=np.int64)
+        doc_ids = np.asarray(doc_ids, dtype=np.int64)
+        df = np.bincount(tri_ids, minlength=len(vocab))
+        urut = np.argsort(tri_ids, kind="stable")
+        self.indices = doc_ids[urut]
+        self.indptr = np.concatenate([[0], np.cumsum(df)])
+        self.idf = np.log1p(n_doc / np.maximum(df, 1))
+        self.idf_baru = np.log1p(n_doc) # trigram query yang tidak ada di katalog
+        self.bobot_doc = np.bincount(doc_ids, weights=self.idf[tri_ids], minlength=n_doc)
+        self._cache_proyek = {}
+
+    def skor(self, teks):
+        """Skor teks terhadap semua analisa (array n_analisa)"""
+        n_doc = len(self.bobot_doc)
+        tri = trigram(teks)
+        if not tri:
+            return np.zeros(n_doc)
+        ids = [self.vocab[t] for t in tri if t in self.vocab]
+        bobot_q = self.idf[ids].sum() + (len(tri) - len(ids)) * self.idf_baru
+        if ids:
+            posting = [self.indices[self.indptr[t]:self.indptr[t + 1]] for t in ids]
+            w = np.repeat(self.idf[ids], [len(p) for p in posting])
+            sama = np.bincount(np.concatenate(posting), weights=w, minlength=n_doc)
+        else:
+            sama = np.zeros(n_doc)
+        return 0.5 * (2.0 * sama / (bobot_q + self.bobot_doc) + sama / bobot_q)
+
+    def cari(self, teks, top_k=5):
+        """Kandidat analisa terurut: DataFrame {kode, desc, skor}"""
+        s = self.skor(teks)
+        k = min(top_k, len(s))
+        idx = np.argpartition(-s, k - 1)[:k] if k < len(s) else np.arange(len(s))
+        idx = idx[np.lexsort((idx, -s[idx]))]
+        return pd.DataFrame({'kode': [self.katalog.kode[i] for i in idx],
+                             'desc': [self.katalog.desc[i] for i in idx], 'skor': s[idx]})
+
+    def terbaik(self, teks):
+        """(kode, skor) kandidat terbaik"""
+        s = self.skor(teks)
+        i = int(s.argmax())
+        return self.katalog.kode[i], float(s[i])
+
+    def cocokkan(self, teks, proyek=None):
+        """terbaik() dengan cache per proyek (None = cache umum untuk kode tidak dikenal)"""
+        cache = self._cache_proyek.setdefault(proyek, {})
+        k = normalisasi_teks(teks)
+        if k not in cache:
+            cache[k] = self.terbaik(k)
+        return cache[k]
+
+    def cocokkan_batch(self, daftar_teks, ambang=0.4, proyek=None):
+        """
+        Cocokkan banyak teks (mis. kolom uraian BOQ). Teks unik dihitung sekali;
+        hasil disimpan di cache proyek (jika nama proyek diberikan) untuk import berikutnya.
+        Output DataFrame {teks, kode, desc, skor, status} (kode None jika skor < ambang).
+        """
+        teks = pd.Series(daftar_teks, dtype=object).fillna("").astype(str)
+        hasil = {t: self.cocokkan(t, proyek) for t in pd.unique(teks)}
+        kode, skor = zip(*teks.map(hasil)) if len(teks) else ((), ())
+        skor = np.asarray(skor, dtype=float)
+        lolos = skor >= ambang
+        kode = [k if ok else None for k, ok in zip(kode, lolos)]
+        return pd.DataFrame({
+            'teks': teks.to_numpy(),
+            'kode': kode,
+            'desc': [self.katalog.desc[self.katalog.index_kode[k]] if k else "" for k in kode],
+            'skor': skor,
+            'status': np.where(lolos, "OK", "TIDAK YAKIN"),
+        })
+
+    def tetapkan(self, proyek, teks, kode):
+        """Koreksi manual: paksa teks -> kode untuk proyek ini (skor 1.0)"""
+        if kode not in self.katalog.index_kode:
+            raise ValueError(f"Kode analisa tidak ada di katalog: {kode}")
+        self._cache_proyek.setdefault(proyek, {})[normalisasi_teks(teks)] = (kode, 1.0)
+
+@lru_cache(maxsize=None)
+def katalog_standar():
+    """Katalog bawaan, dikompilasi sekali per proses"""
+    return KatalogAHSP.dari_koefisien(_AHSP_STANDAR)
+
+# ==========================================
+# 2. IMPORT DATABASE AHSP (CSV/EXCEL) & CACHE BINER
+# ==========================================
+# Nama kolom yang diterima (header tabel AHSP bervariasi) -> kolom normal
+KOLOM_ALIAS = {
+    "kode": ("kode", "kode_analisa", "kode analisa", "no_analisa"),
+    "desc": ("desc", "uraian", "deskripsi", "uraian_pekerjaan", "uraian pekerjaan"),
+    "jenis": ("jenis", "kelompok", "kategori"),
+    "item": ("item", "komponen", "sumber_daya", "sumber daya", "nama_item", "nama item"),
+    "satuan": ("satuan", "sat"),
+    "koefisien": ("koefisien", "koef", "koefisien_analisa"),
+}
+
+# Item tenaga kerja (kolom jenis kosong/tidak ada) -> kelompok upah
+_UPAH_RE = re.compile(r"\b(?:pekerja|tukang|mandor|operator|tenaga)\b", re.IGNORECASE)
+
+def _angka_koefisien(nilai):
+    """Koefisien teks -> float. Desimal koma ("0,52", "1.234,5") & titik ("0.52") diterima."""
+    teks = nilai.astype(str).str.strip().str.replace(" ", "", regex=False)
+    koma = teks.str.contains(",", regex=False)
+    teks = teks.where(~koma, teks.str.replace(".", "", regex=False).str.replace(",", ".", regex=False))
+    return pd.to_numeric(teks, errors="coerce")
+
+def normalisasi_tabel(df):
+    """
+    Tabel AHSP format panjang (satu baris per komponen) -> kolom kode, desc, jenis, item, satuan, koefisien.
+    jenis: 'upah' untuk tenaga kerja, selain itu 'bahan' (termasuk alat). Jika kolom jenis tidak ada
+    atau kosong, tenaga kerja dikenali dari nama item (pekerja/tukang/mandor/operator).
+    Baris tanpa item (judul/pemisah) dibuang dan dicatat di attrs["baris_dibuang"] (nomor baris tabel asal).
+    Item dengan koefisien kosong/bukan angka -> ValueError (tidak dibuang diam-diam).
+    """
+    kolom = {c.strip().lower(): c for c in df.columns}
+    hasil = {}
+    for nama, alias in KOLOM_ALIAS.items():
+        asal = next((kolom[a] for a in alias if a in kolom), None)
+        if asal is not None:
+            hasil[nama] = df[asal]
+    hilang = {"kode", "item", "koefisien"} - set(hasil)
+    if hilang:
+        raise ValueError(f"Kolom wajib tidak ada di tabel AHSP: {sorted(hilang)}")
+    out = pd.DataFrame(hasil).reset_index(drop=True)
+    ada_item = out["item"].notna() & (out["item"].astype(str).str.strip() != "")
+    dibuang = np.flatnonzero(~ada_item.to_numpy()).tolist()
+    out = out[ada_item]
+
+    koef = out["koefisien"]
+    if not pd.api.types.is_numeric_dtype(koef):
+        koef = _angka_koefisien(koef)
+    salah = koef.isna()
+    if salah.any():
+        contoh = ", ".join(f"baris {i}: {out.at[i, 'item']!s} = {out.at[i, 'koefisien']!r}"
+                           for i in out.index[salah][:10])
+        raise ValueError(f"{int(salah.sum())} koefisien kosong/bukan angka di tabel AHSP ({contoh})")
+
+    out = out.assign(
+        kode=out["kode"].astype(str).str.strip(),
+        item=out["item"].astype(str).str.strip(),
+        koefisien=koef.astype(float),
+    )
+    jenis = out["jenis"].fillna("").astype(str).str.lower().str.strip() if "jenis" in out else pd.Series("", index=out.index)
+    upah = jenis.str.contains("upah|tenaga")
+    tebak = (jenis == "") | (jenis == "nan")
+    out["jenis"] = np.where(upah | (tebak & out["item"].str.contains(_UPAH_RE)), "upah", "bahan")
+    if "desc" not in out:
+        out["desc"] = out["kode"]
+    # Satuan kosong -> ambil dari nama item, mis. "Semen (kg)"
+    dari_item = out["item"].str.extract(_SATUAN_RE, expand=False).fillna("")
+    satuan = out["satuan"].fillna("").astype(str).str.strip() if "satuan" in out else dari_item
+    out["satuan"] = np.where(satuan != "", satuan, dari_item)
+    out = out.reset_index(drop=True)
+    out.attrs["baris_dibuang"] = dibuang
+    return out
+
+def _dari_tabel(df):
+    """Kompilasi tabel panjang ternormalisasi -> KatalogAHSP (vektor, tanpa loop per baris)"""
+    upah = (df["jenis"] == "upah").to_numpy()
+    # id kanonik dihitung sekali per nama item unik
+    items = df["item"].to_numpy(dtype=object)
+    peta = {(it, u): id_sumber_daya(it, "upah" if u else "bahan") for it, u in set(zip(items.tolist(), upah.tolist()))}
+    sid = np.array([peta[(it, u)] for it, u in zip(items.tolist(), upah.tolist())], dtype=object)
+
+    r, kode = pd.factorize(df["kode"], sort=False)
+    kunci = pd.Series(np.where(upah, "1|", "0|").astype(object) + sid)
+    c, sumber_kunci = pd.factorize(kunci, sort=False)
+    K = np.zeros((len(kode), len(sumber_kunci)))
+    np.add.at(K, (r, c), df["koefisien"].to_numpy(dtype=float))
+
+    pertama_kode = pd.Series(np.arange(len(df))).groupby(r).first().to_numpy()
+    pertama_sumber = pd.Series(np.arange(len(df))).groupby(c).first().to_numpy()
+    satuan = df["satuan"].astype(str).to_numpy()[pertama_sumber]
+    return KatalogAHSP(
+        kode=list(kode),
+        desc=df["desc"].astype(str).to_numpy()[pertama_kode].tolist(),
+        sumber=[k[2:] for k in sumber_kunci],
+        jenis_sumber=[int(k[0]) for k in sumber_kunci],
+        satuan=[st if st else ("OH" if k[0] == "1" else "") for st, k in zip(satuan.tolist(), sumber_kunci)],
+        K=K,
+    )
+
+def hash_file(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for blok in iter(lambda: f.read(1 << 20), b""):
+            h.update(blok)
+    return h.hexdigest()
+
+def simpan_cache(katalog, folder):
+    """Tulis cache biner secara atomik: K.npy (bisa di-mmap) + index.npz (kode, desc, sumber, satuan, jenis)"""
+    induk = os.path.dirname(folder) or "."
+    os.makedirs(induk, exist_ok=True)
+    tmp = tempfile.mkdtemp(dir=induk, prefix=".tmp_ahsp_")
+    try:
+        np.save(os.path.join(tmp, "K.npy"), np.ascontiguousarray(katalog.K))
+        np.savez(os.path.join(tmp, "index.npz"),
+                 kode=np.array(katalog.kode, dtype=str), desc=np.array(katalog.desc, dtype=str),
+                 sumber=np.array(katalog.sumber, dtype=str), satuan=np.array(katalog.satuan, dtype=str),
+                 jenis_sumber=katalog.jenis_sumber)
+        os.replace(tmp, folder)
+    except OSError:
+        shutil.rmtree(tmp, ignore_errors=True)
+        if not os.path.isdir(folder): # proses lain mungkin sudah menulis cache yang sama
+            raise
+
+def muat_cache(folder):
+    """Cold load dari cache biner (K di-memory-map, read-only)"""
+    idx = np.load(os.path.join(folder, "index.npz"), allow_pickle=False)
+    K = np.load(os.path.join(folder, "K.npy"), mmap_mode="r")
+    return KatalogAHSP(idx["kode"].tolist(), idx["desc"].tolist(), idx["sumber"].tolist(),
+                       idx["jenis_sumber"], idx["satuan"].tolist(), K)
+
+# Naikkan jika aturan parsing/format cache berubah (cache lama dengan hash file sama diabaikan)
+VERSI_CACHE = 2
+
+def _folder_cache(path, cache_dir):
+    if cache_dir is None:
+        cache_dir = os.path.join(os.path.dirname(os.path.abspath(path)), ".ahsp_cache")
+    return cache_dir
+
+def muat_katalog(path, cache_dir=None, sheet_name=0):
+    """
+    Load database AHSP dari CSV/Excel. Hasil kompilasi di-cache per hash isi file,
+    jadi load berikutnya (file sama) hanya membaca cache biner.
+    Folder cache default: <folder file>/.ahsp_cache (fallback ke temp dir jika read-only).
+    """
+    digest = hash_file(path)[:16]
+    folder = os.path.join(_folder_cache(path, cache_dir), f"ahsp_v{VERSI_CACHE}_{digest}")
+    if os.path.isdir(folder):
+        try:
+            return muat_cache(folder)
+        except (OSError, ValueError, KeyError):
+            pass # cache rusak -> kompilasi ulang
+
+    if path.lower().endswith((".xlsx", ".xlsm", ".xls")):
+        tabel = pd.read_excel(path, sheet_name=sheet_name)
+    else:
+        tabel = pd.read_csv(path, sep=None, engine="python") # deteksi pemisah , atau ;
+    katalog = _dari_tabel(normalisasi_tabel(tabel))
+    try:
+        simpan_cache(katalog, folder)
+    except OSError:
+        # Filesystem read-only (mis. Streamlit Cloud) -> cache di temp dir
+        folder = os.path.join(tempfile.gettempdir(), "ahsp_cache", f"ahsp_v{VERSI_CACHE}_{digest}")
+        try:
+            simpan_cache(katalog, folder)
+        except OSError:
+            pass
+    return katalog
+
+class AHSPReloader:
+    """
+    Pantau file database AHSP (watchdog). Saat file berubah, katalog baru dikompilasi
+    di thread watchdog lalu ditukar ke semua engine terdaftar dengan satu assignment atribut
+    (atomik): perhitungan yang sedang jalan tetap memakai katalog lama sampai selesai.
+    """
+    def __init__(self, path, engines=(), cache_dir=None, jeda=0.5, on_reload=None):
+        self.path = os.path.abspath(path)
+        self.engines = list(engines)
+        self.cache_dir = cache_dir
+        self.jeda = jeda # debounce (detik): editor sering menulis file beberapa kali
+        self.on_reload = on_reload
+        self.error = None
+        self._timer = None
+        self._lock = threading.Lock()
+        self._observer = None
+
+    def daftar(self, engine):
+        self.engines.append(engine)
+        return engine
+
+    def reload(self):
+        """Kompilasi ulang & tukar katalog. Gagal parse -> katalog lama tetap dipakai."""
+        with self._lock:
+            try:
+                katalog = muat_katalog(self.path, self.cache_dir)
+            except Exception as e:
+                self.error = e
+                return None
+            self.error = None
+            for engine in self.engines:
+                engine.katalog = katalog
+        if self.on_reload is not None:
+            self.on_reload(katalog)
+        return katalog
+
+    def _jadwalkan(self):
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer = threading.Timer(self.jeda, self.reload)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def start(self):
+        from watchdog.events import FileSystemEventHandler
+        from watchdog.observers import Observer
+
+        reloader = self
+
+        class _Handler(FileSystemEventHandler):
+            def on_any_event(self, event):
+                # Hanya perubahan isi (event baca/opened dari reload sendiri diabaikan)
+                if event.event_type not in ("modified", "created", "moved"):
+                    return
+                paths = {getattr(event, "src_path", None), getattr(event, "dest_path", None)}
+                if reloader.path in {os.path.abspath(p) for p in paths if p}:
+                    reloader._jadwalkan()
+
+        self._observer = Observer()
+        self._observer.schedule(_Handler(), os.path.dirname(self.path), recursive=False)
+        self._observer.daemon = True
+        self._observer.start()
+        return self
+
+    def stop(self):
+        if self._timer is not None:
+            self._timer.cancel()
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join(timeout=2)
+            self._observer = None
+
+# ==========================================
+# 3. ENGINE AHSP
+# ==========================================
+class AHSP_Engine:
+    def __init__(self, katalog=None):
+        # Katalog terkompilasi dipakai bersama antar instance (tidak dibangun ulang per engine)
+        self.katalog = katalog or katalog_standar()
+        self.ambang_fuzzy = 0.4 # skor trigram minimum agar kode tidak dikenal tetap dipetakan
+
+    @classmethod
+    def dari_file(cls, path, cache_dir=None, pantau=False):
+        """
+        Engine dengan database AHSP dari file CSV/Excel.
+        pantau=True: file dipantau (watchdog) & katalog di-reload otomatis saat berubah;
+        reloader tersedia di engine.reloader (panggil .stop() untuk berhenti).
+        """
+        engine = cls(muat_katalog(path, cache_dir))
+        engine.reloader = AHSPReloader(path, [engine], cache_dir).start() if pantau else None
+        return engine
+
+    @property
+    def koefisien(self):
+        return self.katalog.koefisien
+
+    def _mutu_beton(self, teks):
+        """
+        Teks berisi mutu beton (mis. 'Beton K-275') -> (True, kode beton_kNNN terkecil yang >= mutu diminta).
+        Tidak pernah dibulatkan ke bawah: mutu di atas katalog -> (True, None). Teks tanpa mutu -> (False, None).
+        """
+        m = _MUTU_BETON_RE.search(str(teks).lower())
+        if not m:
+            return False, None
+        diminta = int(m.group(1))
+        mutu = sorted((int(k[len("beton_k"):]), k) for k in self.katalog.kode if re.fullmatch(r"beton_k\d+", k))
+        # K-275 tidak ada -> K-300 (lebih kuat & lebih mahal, aman untuk estimasi)
+        return True, next((k for n, k in mutu if n >= diminta), None)
+
+    def _resolve(self, kode_analisa):
+        """(kode katalog atau None, skor 0..1) - lihat resolve_kode"""
+        kat = self.katalog
+        if kode_analisa in kat.index_kode:
+            return kode_analisa, 1.0
+        ada_mutu, kode = self._mutu_beton(kode_analisa)
+        if ada_mutu:
+            # Mutu eksplisit tidak boleh jatuh ke pencocokan fuzzy (bisa ke mutu yang lebih rendah)
+            return kode, (1.0 if kode is not None else 0.0)
+        kode, skor = kat.matcher.cocokkan(kode_analisa)
+        return (kode if skor >= self.ambang_fuzzy else None), skor
+
+    def resolve_kode(self, kode_analisa):
+        """
+        Kode analisa -> kode di katalog, atau None. Dipakai RAB (hasil & skornya dilaporkan per baris).
+        1. Kode persis
+        2. Mutu beton yang tidak ada (mis. K-275) -> mutu terdekat DI ATASNYA; di atas mutu tertinggi -> None
+        3. Pencocokan trigram kode/uraian dengan skor >= ambang_fuzzy
+        """
+        return self._resolve(kode_analisa)[0]
+
+    def cari_analisa(self, teks, top_k=5):
+        """Kandidat analisa untuk teks bebas (mis. uraian BOQ): DataFrame {kode, desc, skor}"""
+        return self.katalog.matcher.cari(teks, top_k)
+
+    def cocokkan_boq(self, uraian, proyek=None, ambang=None):
+        """Batch: kolom uraian BOQ -> kode analisa + skor (cache per proyek). Mutu beton eksplisit diutamakan."""
+        kat = self.katalog
+        hasil = kat.matcher.cocokkan_batch(uraian, self.ambang_fuzzy if ambang is None else ambang, proyek)
+        mutu = {t: self._mutu_beton(t) for t in pd.unique(hasil['teks'])}
+        ada = hasil['teks'].map(lambda t: mutu[t][0]).to_numpy(dtype=bool)
+        if ada.any():
+            kode = [mutu[t][1] for t in hasil['teks'][ada]]
+            hasil.loc[ada, 'kode'] = kode
+            hasil.loc[ada, 'desc'] = [kat.desc[kat.index_kode[k]] if k is not None else None for k in kode]
+            hasil.loc[ada, 'skor'] = [1.0 if k is not None else 0.0 for k in kode]
+            hasil.loc[ada, 'status'] = ["MUTU BETON" if k is not None else "MUTU TIDAK TERSEDIA" for k in kode]
+        return hasil
+
+    def hitung_hsp_semua(self, harga_bahan_dasar, harga_upah_dasar):
+        """HSP seluruh analisa sekaligus -> Series {kode: HSP}"""
+        return pd.Series(self.katalog.hsp(harga_bahan_dasar, harga_upah_dasar), index=self.katalog.kode, name="HSP")
+
+    def hitung_hsp(self, kode_analisa, harga_bahan_dasar, harga_upah_dasar):
+        """
+        HSP satu analisa, kode harus persis ada di katalog (tanpa substitusi diam-diam).
+        Kode tidak dikenal -> ValueError berisi saran kode (pakai cari_analisa / resolve_kode untuk memilih).
+        """
+        i = self.katalog.index_kode.get(kode_analisa)
+        if i is None:
+            ada_mutu, kode = self._mutu_beton(kode_analisa)
+            saran = [kode] if kode is not None else []
+            if not ada_mutu:
+                saran = self.cari_analisa(kode_analisa, 3).query("skor > 0")['kode'].tolist()
+            raise ValueError(f"Kode analisa '{kode_analisa}' tidak ada di katalog AHSP"
+                             + (f"; mungkin maksudnya: {', '.join(saran)}" if saran else ""))
+        return float(self.katalog.hsp(harga_bahan_dasar, harga_upah_dasar)[i])
+
+    def hitung_rab(self, boq, harga_bahan_dasar, harga_upah_dasar, overhead_profit=0.10, ppn=0.11, proyek=None):
+        """
+        RAB lengkap dari BOQ dalam satu pass (vektor).
+        boq: DataFrame kolom 'kode', 'volume', opsional 'divisi' & 'uraian'.
+             Tanpa kolom 'kode', analisa dicocokkan dari 'uraian' (trigram, cache per proyek).
+        overhead_profit: biaya umum & keuntungan (fraksi dari jumlah, Permen PUPR maks 15%).
+        Output dict:
+          rincian     : DataFrame per baris (HSP bahan/upah, jumlah)
+          divisi      : DataFrame subtotal per divisi
+          sumber_daya : DataFrame kebutuhan total sumber daya proyek (kg semen, m3 pasir, OH pekerja, ...)
+          rekap       : dict jumlah, overhead & profit, PPN, total, dibulatkan
+        """
+        kat = self.katalog
+        df = pd.DataFrame(boq).reset_index(drop=True)
+        skor_uraian = None
+        if 'kode' not in df and 'uraian' in df:
+            cocok = self.cocokkan_boq(df['uraian'], proyek)
+            df['kode'] = cocok['kode'].fillna("").to_numpy()
+            skor_uraian = cocok['skor'].to_numpy(dtype=float)
+        kode = df['kode'].astype(str)
+        volume = df['volume'].to_numpy(dtype=float)
+
+        # Resolve kode unik sekali (fallback dilaporkan per baris: Status FALLBACK + Skor Cocok)
+        peta = {k: self._resolve(k) for k in pd.unique(kode)}
+        kode_pakai = kode.map(lambda k: peta[k][0])
+        skor = kode.map(lambda k: peta[k][1]).to_numpy(dtype=float)
+        if skor_uraian is not None:
+            skor = np.where(kode != "", skor_uraian, 0.0)
+        baris = kode_pakai.map(kat.index_kode).fillna(-1).to_numpy(dtype=int)
+        dikenal = baris >= 0
+
+        # HSP bahan & upah seluruh analisa (matriks-vektor), lalu indeks per baris BOQ
+        p = kat.vektor_harga(harga_bahan_dasar, harga_upah_dasar)
+        upah = kat.jenis_sumber == 1
+        hsp_bahan = np.append(kat.K[:, ~upah] @ p[~upah], 0.0)[baris]
+        hsp_upah = np.append(kat.K[:, upah] @ p[upah], 0.0)[baris]
+
+        rincian = pd.DataFrame({
+            'kode': kode,
+            'kode_pakai': kode_pakai,
+            'uraian': df['uraian'] if 'uraian' in df else [kat.desc[i] if i >= 0 else "" for i in baris.tolist()],
+            'divisi': df['divisi'] if 'divisi' in df else "UMUM",
+            'volume': volume,
+            'HSP Bahan': hsp_bahan,
+            'HSP Upah': hsp_upah,
+            'HSP': hsp_bahan + hsp_upah,
+            'Jumlah Bahan': volume * hsp_bahan,
+            'Jumlah Upah': volume * hsp_upah,
+            'Jumlah': volume * (hsp_bahan + hsp_upah),
+            'Status': np.where(dikenal, np.where(kode == kode_pakai, "OK", "FALLBACK"), "KODE TIDAK DIKENAL"),
+            'Skor Cocok': skor,
+        })
+
+        divisi = (rincian.groupby('divisi', sort=False, as_index=False)
+                  [['Jumlah Bahan', 'Jumlah Upah', 'Jumlah']].sum())
+
+        # Kebutuhan sumber daya: volume per analisa (bincount) x matriks koefisien
+        vol_analisa = np.bincount(baris[dikenal], weights=volume[dikenal], minlength=len(kat.kode))
+        kebutuhan = vol_analisa @ kat.K
+        sumber_daya = pd.DataFrame({
+            'sumber_daya': kat.sumber,
+            'jenis': np.where(upah, "upah", "bahan"),
+            'satuan': kat.satuan,
+            'kebutuhan': kebutuhan,
+            'harga': p,
+            'biaya': kebutuhan * p,
+        })
+        sumber_daya = sumber_daya[sumber_daya['kebutuhan'] > 0].reset_index(drop=True)
+
+        jumlah = float(rincian['Jumlah'].sum())
+        op = jumlah * overhead_profit
+        pajak = (jumlah + op) * ppn
+        total = jumlah + op + pajak
+        rekap = {
+            'Jumlah': jumlah,
+            'Overhead & Profit': op,
+            'PPN': pajak,
+            'Total': total,
+            'Dibulatkan': float(np.ceil(total / 1000) * 1000),
+            'Baris': len(df),
+            'Baris Tidak Dikenal': int((~dikenal).sum()),
+        }
+        return {"rincian": rincian, "divisi": divisi, "sumber_daya": sumber_daya, "rekap": rekap}
+
+    def hitung_hsp_regional(self, harga_regional):
+        """
+        HSP seluruh analisa untuk banyak wilayah sekaligus: K @ P.T.
+        Output: DataFrame (index = kode analisa, kolom = wilayah).
+        """
+        wilayah, P = self.katalog.matriks_harga(harga_regional)
+        return pd.DataFrame(self.katalog.K @ P.T, index=self.katalog.kode, columns=wilayah)
+
+    def hitung_rab_regional(self, boq, harga_regional, overhead_profit=0.10, ppn=0.11):
+        """
+        Total RAB satu BOQ untuk semua wilayah dalam satu perkalian matriks.
+        Volume BOQ diringkas per analisa dulu, jadi biaya tidak tergantung jumlah baris x wilayah.
+        Output: DataFrame per wilayah {Jumlah Bahan, Jumlah Upah, Jumlah, Overhead & Profit, PPN, Total},
+        urut dari termurah.
+        """
+        kat = self.katalog
+        df = pd.DataFrame(boq)
+        kode = df['kode'].astype(str)
+        peta = {k: self.resolve_kode(k) for k in pd.unique(kode)}
+        baris = kode.map(peta).map(kat.index_kode).fillna(-1).to_numpy(dtype=int)
+        volume = df['volume'].to_numpy(dtype=float)
+        dikenal = baris >= 0
+        vol_analisa = np.bincount(baris[dikenal], weights=volume[dikenal], minlength=len(kat.kode))
+
+        wilayah, P = kat.matriks_harga(harga_regional)
+        # Kebutuhan sumber daya proyek (1 x S) lalu dikali harga tiap wilayah
+        kebutuhan = vol_analisa @ kat.K
+        upah = kat.jenis_sumber == 1
+        jml_bahan = P[:, ~upah] @ kebutuhan[~upah]
+        jml_upah = P[:, upah] @ kebutuhan[upah]
+        jumlah = jml_bahan + jml_upah
+        op = jumlah * overhead_profit
+        pajak = (jumlah + op) * ppn
+        hasil = pd.DataFrame({
+            'wilayah': wilayah,
+            'Jumlah Bahan': jml_bahan,
+            'Jumlah Upah': jml_upah,
+            'Jumlah': jumlah,
+            'Overhead & Profit': op,
+            'PPN': pajak,
+            'Total': jumlah + op + pajak,
+        })
+        return hasil.sort_values('Total').reset_index(drop=True)
+
+# ==========================================
+# 4. SIMULASI RISIKO BIAYA (MONTE CARLO)
+# ==========================================
+def _phi_normal(z):
+    """CDF normal standar (vektor). Aproksimasi Abramowitz-Stegun 7.1.26, galat < 1.5e-7."""
+    x = np.abs(z) / np.sqrt(2.0)
+    t = 1.0 / (1.0 + 0.3275911 * x)
+    poly = t * (0.254829592 + t * (-0.284496736 + t * (1.421413741 + t * (-1.453152027 + t * 1.061405429))))
+    erf = 1.0 - poly * np.exp(-x * x)
+    return 0.5 * (1.0 + np.where(z < 0, -erf, erf))
+
+def _faktor(spec, z):
+    """
+    Sampel faktor pengali (1.0 = nilai dasar) dari normal standar z (copula Gaussian).
+    spec: ('triangular', min, modus, max) atau ('lognormal', sigma) dengan rata-rata 1.
+    """
+    jenis = spec[0]
+    if jenis == "triangular":
+        a, m, b = spec[1:4]
+        u = _phi_normal(z)
+        fc = (m - a) / (b - a)
+        return np.where(u < fc, a + np.sqrt(u * (b - a) * (m - a)), b - np.sqrt((1 - u) * (b - a) * (b - m)))
+    if jenis == "lognormal":
+        sigma = spec[1]
+        return np.exp(sigma * z - 0.5 * sigma * sigma)
+    raise ValueError(f"Distribusi tidak dikenal: {jenis!r} (pakai 'triangular' atau 'lognormal')")
+
+class RAB_Risk_Engine:
+    """
+    Analisa risiko biaya RAB (P50/P80) dengan simulasi Monte Carlo di atas katalog AHSP terkompilasi.
+    Variabel acak = faktor harga per sumber daya & faktor volume per kode analisa,
+    boleh berkorelasi (copula Gaussian). Iterasi dijalankan per chunk agar memori terbatas.
+    """
+    def __init__(self, engine=None):
+        self.engine = engine or AHSP_Engine()
+
+    def _variabel(self, ketidakpastian_harga, ketidakpastian_volume, kode_aktif):
+        """Daftar (nama, tipe, indeks, spec); kunci '*' = default untuk semua harga / volume"""
+        kat = self.engine.katalog
+        var = []
+        harga = dict(ketidakpastian_harga or {})
+        default_h = harga.pop("*", None)
+        for j, sid in enumerate(kat.sumber):
+            spec = harga.get(sid, default_h)
+            if spec is not None:
+                var.append((sid, "harga", j, spec))
+        volume = dict(ketidakpastian_volume or {})
+        default_v = volume.pop("*", None)
+        for i in kode_aktif:
+            kode = kat.kode[i]
+            spec = volume.get(kode, default_v)
+            if spec is not None:
+                var.append((f"vol:{kode}", "volume", i, spec))
+        return var
+
+    @staticmethod
+    def _cholesky(nama, korelasi):
+        n = len(nama)
+        C = np.eye(n)
+        if korelasi:
+            idx = {v: i for i, v in enumerate(nama)}
+            for (a, b), rho in korelasi.items():
+                if a in idx and b in idx:
+                    C[idx[a], idx[b]] = C[idx[b], idx[a]] = rho
+            # Pastikan semi-definit positif (input korelasi manual bisa tidak konsisten)
+            w, V = np.linalg.eigh(C)
+            C = (V * np.maximum(w, 1e-10)) @ V.T
+            d = np.sqrt(np.diag(C))
+            C = C / d[:, None] / d[None, :]
+        return np.linalg.cholesky(C)
+
+    def simulasi(self, boq, harga_bahan_dasar, harga_upah_dasar, ketidakpastian_harga=None,
+                 ketidakpastian_volume=None, korelasi=None, n_iter=100000, chunk=20000,
+                 overhead_profit=0.10, ppn=0.11, persentil=(10, 50, 80, 90), seed=None, simpan_sampel=True):
+        """
+        Simulasi Monte Carlo total RAB: deterministik, mean, std, persentil (P50/P80) & tornado sensitivitas.
+        boq: DataFrame kolom 'kode', 'volume' (seperti hitung_rab).
+        ketidakpastian_harga: {id sumber daya | '*': spec}, mis. {'semen': ('triangular', 0.9, 1.0, 1.3)}.
+        ketidakpastian_volume: {kode analisa | '*': spec}, mis. {'*': ('lognormal', 0.05)}.
+        korelasi: {(var_a, var_b): rho}; nama variabel = id sumber daya atau 'vol:<kode>'.
+        Output dict: deterministik, mean, std, persentil (Series P..), tornado (DataFrame), sampel (array total).
+        """
+        kat = self.engine.katalog
+        df = pd.DataFrame(boq)
+        kode = df['kode'].astype(str)
+        peta = {k: self.engine.resolve_kode(k) for k in pd.unique(kode)}
+        baris = kode.map(peta).map(kat.index_kode).fillna(-1).to_numpy(dtype=int)
+        volume = df['volume'].to_numpy(dtype=float)
+        dikenal = baris >= 0
+        vol0 = np.bincount(baris[dikenal], weights=volume[dikenal], minlength=len(kat.kode))
+
+        # Hanya analisa yang dipakai BOQ (sub-matriks kecil)
+        aktif = np.nonzero(vol0)[0]
+        K = kat.K[aktif]
+        vol0 = vol0[aktif]
+        p0 = kat.vektor_harga(harga_bahan_dasar, harga_upah_dasar)
+        faktor_total = (1 + overhead_profit) * (1 + ppn)
+
+        var = self._variabel(ketidakpastian_harga, ketidakpastian_volume, aktif)
+        nama = [v[0] for v in var]
+        posisi_aktif = {i: k for k, i in enumerate(aktif)}
+
+        def total(f_harga, f_vol):
+            # f_harga: (n x S), f_vol: (n x A) -> total RAB (n)
+            kebutuhan = (f_vol * vol0) @ K
+            return (kebutuhan * (f_harga * p0)).sum(axis=1) * faktor_total
+
+        def susun(faktor):
+            """Faktor per variabel (n x V) -> matriks faktor harga & volume penuh"""
+            n = faktor.shape[0]
+            f_harga = np.ones((n, len(p0)))
+            f_vol = np.ones((n, len(aktif)))
+            for k, (_, tipe, idx, _) in enumerate(var):
+                if tipe == "harga":
+                    f_harga[:, idx] = faktor[:, k]
+                else:
+                    f_vol[:, posisi_aktif[idx]] = faktor[:, k]
+            return f_harga, f_vol
+
+        deterministik = float(total(np.ones((1, len(p0))), np.ones((1, len(aktif))))[0])
+        if not var:
+            return {"deterministik": deterministik, "mean": deterministik, "std": 0.0,
+                    "persentil": pd.Series({f"P{q}": deterministik for q in persentil}),
+                    "tornado": pd.DataFrame(columns=['variabel', 'rendah', 'tinggi', 'swing', 'korelasi']),
+                    "sampel": np.full(n_iter, deterministik) if simpan_sampel else None}
+
+        L = self._cholesky(nama, korelasi)
+        rng = np.random.default_rng(seed)
+        sampel = np.empty(n_iter)
+        # Akumulator korelasi Pearson (faktor vs total) tanpa menyimpan semua sampel faktor
+        sx = np.zeros(len(var)); sxx = np.zeros(len(var)); sxy = np.zeros(len(var))
+        for mulai in range(0, n_iter, chunk):
+            n = min(chunk, n_iter - mulai)
+            z = rng.standard_normal((n, len(var))) @ L.T
+            faktor = np.column_stack([_faktor(spec, z[:, k]) for k, (_, _, _, spec) in enumerate(var)])
+            t = total(*susun(faktor))
+            sampel[mulai:mulai + n] = t
+            sx += faktor.sum(axis=0); sxx += (faktor * faktor).sum(axis=0); sxy += faktor.T @ t
+
+        mean = sampel.mean()
+        std = sampel.std()
+        cov = sxy / n_iter - (sx / n_iter) * mean
+        std_x = np.sqrt(np.maximum(sxx / n_iter - (sx / n_iter) ** 2, 0))
+        with np.errstate(invalid="ignore", divide="ignore"):
+            korel = cov / (std_x * std)
+
+        # Tornado: total saat satu variabel di P10 / P90 (lainnya nilai dasar), dievaluasi sebagai satu batch
+        z10, z90 = -1.2815515655446004, 1.2815515655446004
+        n_var = len(var)
+        faktor_uji = np.ones((2 * n_var, n_var))
+        for k, (_, _, _, spec) in enumerate(var):
+            faktor_uji[k, k] = _faktor(spec, np.array(z10))
+            faktor_uji[n_var + k, k] = _faktor(spec, np.array(z90))
+        uji = total(*susun(faktor_uji))
+        tornado = pd.DataFrame({
+            'variabel': nama,
+            'rendah': uji[:n_var],
+            'tinggi': uji[n_var:],
+            'swing': np.abs(uji[n_var:] - uji[:n_var]),
+            'korelasi': korel,
+        }).sort_values('swing', ascending=False).reset_index(drop=True)
+
+        return {
+            "deterministik": deterministik,
+            "mean": float(mean),
+            "std": float(std),
+            "persentil": pd.Series({f"P{q}": v for q, v in zip(persentil, np.percentile(sampel, persentil))}),
+            "tornado": tornado,
+            "sampel": sampel if simpan_sampel else None,
+        }
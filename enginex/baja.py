@@ -0,0 +1,294 @@
+import numpy as np
+import pandas as pd
+
+from .profil_baja import BENTUK_I, KatalogProfil, katalog_i, properti_profil_i
+
+# ==========================================
+# CLASS 1: BAJA BERAT (WF/H-BEAM) - SNI 1729
+# ==========================================
+class SNI_Steel_1729:
+    phi_b = 0.9 # Faktor ketahanan lentur (SNI 1729:2020 Pasal F1)
+
+    def __init__(self, fy, fu):
+        self.fy = fy # MPa
+        self.fu = fu # MPa
+        self.E = 200000 # MPa
+        self._param_katalog = {}
+        self._param_profil = {}
+
+    # ==========================================
+    # INTI PERHITUNGAN (ARRAY) - dipakai versi skalar & katalog
+    # ==========================================
+    def _kelas(self, lam, lam_p, lam_r):
+        return np.select([lam <= lam_p, lam <= lam_r], ["KOMPAK", "NON-KOMPAK"], "LANGSING")
+
+    def _parameter_lentur(self, prop):
+        """
+        Besaran lentur yang tidak bergantung Lb (SNI 1729:2020 Bab F), profil I simetris ganda sumbu kuat.
+        - Badan kompak        : F2 (LTB) + F3 (tekuk lokal sayap)
+        - Badan non-kompak    : F4 (faktor plastifikasi badan Rpc, rt)
+        - Badan langsing      : F5 (faktor reduksi girder Rpg)
+        prop: mapping kolom array (h, b, tw, tf, r, Sx, Zx, Iy, ry, J, Cw) - katalog / DataFrame / dict
+        """
+        E, Fy = self.E, self.fy
+        h, b, tw, tf = (np.asarray(prop[k], dtype=float) for k in ("h", "b", "tw", "tf"))
+        r = np.asarray(prop["r"], dtype=float) if "r" in prop else np.zeros_like(h)
+        Sx, Zx, Iy, ry, J, Cw = (np.asarray(prop[k], dtype=float) for k in ("Sx", "Zx", "Iy", "ry", "J", "Cw"))
+        akar = np.sqrt(E / Fy)
+
+        # Kelangsingan elemen (SNI 1729 Tabel B4.1b kasus 10 & 15)
+        lam_f = b / (2 * tf)
+        lam_pf, lam_rf = 0.38 * akar, 1.0 * akar
+        lam_w = (h - 2 * tf - 2 * r) / tw
+        lam_pw, lam_rw = 3.76 * akar, 5.70 * akar
+        badan_kompak = lam_w <= lam_pw
+        badan_langsing = lam_w > lam_rw
+
+        Mp = Fy * Zx
+        My = Fy * Sx
+        FL = 0.7 * Fy
+        ho = h - tf
+        aw = np.minimum((h - 2 * tf - 2 * r) * tw / (b * tf), 10.0)
+        rt = b / np.sqrt(12 * (1 + aw / 6))
+        rts = np.sqrt(np.sqrt(Iy * Cw) / Sx)
+        kc = np.clip(4 / np.sqrt(lam_w), 0.35, 0.76)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            # --- F2/F4: momen batas atas (Rpc*Myc; = Mp untuk badan kompak) ---
+            Rpc = np.where(badan_kompak, Mp / My,
+                           np.minimum(Mp / My - (Mp / My - 1) * (lam_w - lam_pw) / (lam_rw - lam_pw), Mp / My))
+            M_maks = Rpc * My
+            r_ltb = np.where(badan_kompak, rts, rt)
+            Lp = np.where(badan_kompak, 1.76 * ry, 1.1 * rt) * akar
+            jc = J / (Sx * ho)
+            Lr = 1.95 * r_ltb * E / FL * np.sqrt(jc + np.sqrt(jc ** 2 + 6.76 * (FL / E) ** 2))
+            Mn_flb = np.select(
+                [lam_f <= lam_pf, lam_f <= lam_rf],
+                [M_maks, M_maks - (M_maks - FL * Sx) * (lam_f - lam_pf) / (lam_rf - lam_pf)],
+                0.9 * E * kc * Sx / lam_f ** 2)
+            M_elastis = FL * Sx # momen di Lb = Lr
+
+            # --- F5: badan langsing (semua momen = Rpg * Fcr * Sx, jc = 0) ---
+            if np.any(badan_langsing):
+                Rpg = np.minimum(1 - aw / (1200 + 300 * aw) * (lam_w - lam_rw), 1.0)
+                Fcr_flb = np.select(
+                    [lam_f <= lam_pf, lam_f <= lam_rf],
+                    [Fy, Fy - 0.3 * Fy * (lam_f - lam_pf) / (lam_rf - lam_pf)],
+                    0.9 * E * kc / lam_f ** 2)
+                M_maks = np.where(badan_langsing, Rpg * Fy * Sx, M_maks)
+                M_elastis = np.where(badan_langsing, Rpg * FL * Sx, M_elastis)
+                Mn_flb = np.where(badan_langsing, Rpg * Fcr_flb * Sx, Mn_flb)
+                r_ltb = np.where(badan_langsing, rt, r_ltb)
+                jc = np.where(badan_langsing, 0.0, jc)
+                Lp = np.where(badan_langsing, 1.1 * rt * akar, Lp)
+                Lr = np.where(badan_langsing, np.pi * rt * np.sqrt(E / FL), Lr)
+
+        return {
+            "M_maks": M_maks, "M_elastis": M_elastis, "Mn_FLB": Mn_flb,
+            "Sx": Sx if not np.any(badan_langsing) else np.where(badan_langsing, Rpg * Sx, Sx),
+            "r_ltb": r_ltb, "jc": jc, "Lp": Lp, "Lr": Lr,
+            "lam_f": lam_f, "lam_w": lam_w,
+            "kelas_sayap": self._kelas(lam_f, lam_pf, lam_rf),
+            "kelas_badan": self._kelas(lam_w, lam_pw, lam_rw),
+        }
+
+    def _ltb_inelastis(self, par, Lb, Cb):
+        """Interpolasi linier M_maks -> M_elastis antara Lp & Lr (F2-2/F4-2/F5-3)"""
+        return Cb * (par["M_maks"] - (par["M_maks"] - par["M_elastis"]) * (Lb - par["Lp"]) / (par["Lr"] - par["Lp"]))
+
+    def _ltb_elastis(self, par, Lb, Cb):
+        """Fcr * Sx (F2-4/F4-5; untuk F5 jc = 0 & Sx sudah dikali Rpg)"""
+        kl = (Lb / par["r_ltb"]) ** 2
+        return Cb * np.pi ** 2 * self.E / kl * np.sqrt(1 + 0.078 * par["jc"] * kl) * par["Sx"]
+
+    def _mn_ltb(self, par, Lb, Cb=1.0):
+        """Mn tekuk torsi lateral (Nmm) untuk panjang tak terkekang Lb (mm)"""
+        Lp, Lr, M_maks = par["Lp"], par["Lr"], par["M_maks"]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            inelastis = self._ltb_inelastis(par, Lb, Cb)
+            elastis = self._ltb_elastis(par, Lb, Cb)
+        return np.where(Lb <= Lp, M_maks, np.minimum(np.where(Lb <= Lr, inelastis, elastis), M_maks))
+
+    def _kapasitas_lentur(self, par, Lb_mm, Cb=1.0):
+        """Gabungkan LTB & tekuk lokal sayap: dict array Mn, Mn_LTB, kontrol (+ isi par)"""
+        Mn_ltb = self._mn_ltb(par, Lb_mm, Cb)
+        Mn_flb = par["Mn_FLB"]
+        kontrol = np.where(Mn_flb < Mn_ltb, "TEKUK LOKAL SAYAP",
+                           np.where(Lb_mm > par["Lp"], "TEKUK TORSI LATERAL", "LELEH"))
+        return {**par, "Mn": np.minimum(Mn_ltb, Mn_flb), "Mn_LTB": Mn_ltb, "kontrol": kontrol}
+
+    def _kapasitas_skalar(self, par, Lb, Cb=1.0):
+        """Versi skalar _kapasitas_lentur (satu profil, float) tanpa np.where: return (Mn, kontrol)"""
+        if Lb <= par["Lp"]:
+            Mn_ltb = par["M_maks"]
+        elif Lb <= par["Lr"]:
+            Mn_ltb = min(self._ltb_inelastis(par, Lb, Cb), par["M_maks"])
+        else:
+            Mn_ltb = min(float(self._ltb_elastis(par, Lb, Cb)), par["M_maks"])
+        Mn_flb = par["Mn_FLB"]
+        kontrol = "TEKUK LOKAL SAYAP" if Mn_flb < Mn_ltb else ("TEKUK TORSI LATERAL" if Lb > par["Lp"] else "LELEH")
+        return min(Mn_ltb, Mn_flb), kontrol
+
+    @staticmethod
+    def _cek_bentuk_i(kat):
+        """Rumus Bab F di sini hanya untuk profil I: tolak katalog yang memuat CHS/RHS dsb."""
+        if "bentuk" not in kat:
+            return
+        lain = sorted(set(np.asarray(kat["bentuk"]).tolist()) - set(BENTUK_I))
+        if lain:
+            raise ValueError(f"Cek lentur hanya untuk profil I {BENTUK_I}, katalog memuat {lain}; "
+                             f"pakai katalog.pilih_bentuk(*BENTUK_I)")
+
+    def _parameter_katalog(self, kat):
+        """_parameter_lentur di-cache per KatalogProfil (read-only); DataFrame/dict dihitung ulang"""
+        if not isinstance(kat, KatalogProfil):
+            self._cek_bentuk_i(kat)
+            return self._parameter_lentur(kat)
+        hit = self._param_katalog.get(id(kat))
+        if hit is None:
+            self._cek_bentuk_i(kat)
+            # Simpan referensi katalog agar id() tidak dipakai ulang objek lain
+            hit = self._param_katalog[id(kat)] = (kat, self._parameter_lentur(kat))
+        return hit[1]
+
+    # ==========================================
+    # VERSI KATALOG (SEMUA PROFIL SEKALIGUS)
+    # ==========================================
+    def _cek_katalog(self, Mu_kNm, Lb_m, katalog, Cb):
+        """Inti cek_lentur_katalog: dict kolom array"""
+        kat = katalog_i() if katalog is None else katalog
+        res = self._kapasitas_lentur(self._parameter_katalog(kat), np.asarray(Lb_m, dtype=float) * 1000, Cb)
+        phi_Mn = self.phi_b * res["Mn"] / 1e6 # Nmm -> kNm
+        with np.errstate(divide='ignore'):
+            ratio = np.where(phi_Mn > 0, np.asarray(Mu_kNm, dtype=float) / phi_Mn, 99)
+        n = len(phi_Mn)
+        return {
+            "Profil": np.asarray(kat["Profil"]) if "Profil" in kat else np.arange(n),
+            "Berat (kg/m)": np.asarray(kat["berat"], dtype=float) if "berat" in kat else np.full(n, np.nan),
+            "Sayap": res["kelas_sayap"],
+            "Badan": res["kelas_badan"],
+            "Lp (m)": res["Lp"] / 1000,
+            "Lr (m)": res["Lr"] / 1000,
+            "Phi_Mn": phi_Mn,
+            "Ratio": ratio,
+            "Status": np.where(ratio <= 1.0, "AMAN", "TIDAK AMAN"),
+            "Kontrol": res["kontrol"],
+        }
+
+    def cek_lentur_katalog(self, Mu_kNm, Lb_m, katalog=None, Cb=1.0):
+        """
+        Cek lentur semua profil katalog untuk satu Mu/Lb dalam satu panggilan (vektor).
+        katalog: KatalogProfil / mapping kolom array (default profil I WF+H+WB); Mu/Lb/Cb boleh array sepanjang katalog.
+        Katalog dengan kolom 'bentuk' di luar profil I (CHS, RHS) ditolak dengan ValueError.
+        Return DataFrame per profil (urutan katalog).
+        """
+        return pd.DataFrame(self._cek_katalog(Mu_kNm, Lb_m, katalog, Cb))
+
+    def pilih_profil_teringan(self, Mu_kNm, Lb_m, katalog=None, Cb=1.0):
+        """Profil teringan yang AMAN untuk Mu/Lb (dict baris cek_lentur_katalog), None jika tidak ada"""
+        kol = self._cek_katalog(Mu_kNm, Lb_m, katalog, Cb)
+        aman = np.flatnonzero(kol["Ratio"] <= 1.0)
+        if not len(aman):
+            return None
+        # Berat sama -> kapasitas terbesar
+        i = aman[np.lexsort((-kol["Phi_Mn"][aman], kol["Berat (kg/m)"][aman]))[0]]
+        return {k: v[i:i + 1].tolist()[0] for k, v in kol.items()}
+
+    # ==========================================
+    # VERSI SKALAR (SATU PROFIL)
+    # ==========================================
+    def _parameter_profil(self, profil_data):
+        """
+        Nama profil katalog / dict dimensi {h, b, tw, tf[, r]} / dict properti lengkap.
+        Dict lama yang hanya berisi Zx (cm3) -> profil katalog dengan Zx terdekat.
+        Return (dict parameter lentur skalar, nama) - di-cache per profil (kecuali nilai dict tidak hashable).
+        """
+        key = profil_data if isinstance(profil_data, str) else tuple(sorted(profil_data.items()))
+        try:
+            hit = self._param_profil.get(key)
+        except TypeError: # mis. nilai berupa array -> hitung tanpa cache
+            key, hit = None, None
+        if hit is not None:
+            return hit
+        kat = katalog_i()
+        if isinstance(profil_data, str):
+            try:
+                i, nama = kat.posisi(profil_data), profil_data
+            except KeyError:
+                raise ValueError(f"Profil I '{profil_data}' tidak ada di katalog") from None
+        elif all(k in profil_data for k in ("h", "b", "tw", "tf")):
+            prop = properti_profil_i(*(profil_data.get(k, 0.0) for k in ("h", "b", "tw", "tf", "r")))
+            # Properti tabel (cm3/cm4/cm6) yang diberikan user menimpa hasil hitungan
+            skala = {"Sx": 1e3, "Zx": 1e3, "Ix": 1e4, "Iy": 1e4, "J": 1e4, "Cw": 1e6, "ry": 10}
+            prop.update({k: np.asarray(profil_data[k] * f, dtype=float) for k, f in skala.items() if k in profil_data})
+            # Besaran turunan Iy ikut disesuaikan bila tidak diberikan sendiri
+            if "Iy" in profil_data:
+                if "ry" not in profil_data:
+                    prop["ry"] = np.sqrt(prop["Iy"] / prop["A"])
+                if "Cw" not in profil_data:
+                    prop["Cw"] = prop["Iy"] * (prop["h"] - prop["tf"]) ** 2 / 4
+            par = {k: v.item() for k, v in self._parameter_lentur(prop).items()}
+            hit = (par, f"WF {profil_data['h']}x{profil_data['b']}")
+            if key is not None:
+                self._param_profil[key] = hit
+            return hit
+        else:
+            i = kat.terdekat("Zx", profil_data["Zx"] * 1000)
+            nama = f"{kat['Profil'][i]} (Zx terdekat)"
+        par = {k: v[i].item() for k, v in self._parameter_katalog(kat).items()}
+        hit = (par, nama)
+        if key is not None:
+            self._param_profil[key] = hit
+        return hit
+
+    def cek_balok_lentur(self, Mu_kNm, profil_data, Lb_m, Cb=1.0):
+        """
+        Cek Kapasitas Lentur Balok I/WF (Phi_Mn) - SNI 1729:2020 Bab F
+        profil_data: nama profil katalog, dict dimensi {'h','b','tw','tf','r'} (mm),
+                     atau dict lama {'Zx': cm3} (dipetakan ke profil katalog terdekat)
+        Cb: faktor modifikasi momen tidak seragam (1.0 = konservatif)
+        """
+        par, nama = self._parameter_profil(profil_data)
+        Mn, kontrol = self._kapasitas_skalar(par, Lb_m * 1000, Cb)
+
+        # Kapasitas Desain
+        phi_Mn = self.phi_b * Mn / 1e6 # Nmm -> kNm
+
+        ratio = Mu_kNm / phi_Mn if phi_Mn > 0 else 99
+        Lp, Lr = par["Lp"] / 1000, par["Lr"] / 1000
+
+        return {
+            "Phi_Mn": phi_Mn,
+            "Ratio": ratio,
+            "Status": "AMAN" if ratio <= 1.0 else "TIDAK AMAN (Bahaya Tekuk)",
+            "Lp": Lp,
+            "Lr": Lr,
+            "Kontrol": kontrol,
+            "Keterangan": (f"{nama}: sayap {par['kelas_sayap']}, badan {par['kelas_badan']}; "
+                           f"Lb={Lb_m}m (Lp={Lp:.2f}m, Lr={Lr:.2f}m) -> {kontrol}")
+        }
+
+# ==========================================
+# CLASS 2: BAJA RINGAN (ATAP) - ESTIMASI
+# ==========================================
+class Baja_Ringan_Calc:
+    def hitung_kebutuhan_atap(self, luas_atap_m2, jenis_genteng):
+        # Koefisien per m2
+        if "Metal" in jenis_genteng:
+            k_c = 0.35; k_reng = 0.6 # Ringan
+        else:
+            k_c = 0.55; k_reng = 1.2 # Berat
+            
+        btg_c = np.ceil(luas_atap_m2 * k_c)
+        btg_reng = np.ceil(luas_atap_m2 * k_reng)
+        
+        # Sekrup genteng (12/m2) + Sekrup truss (8/btg C + 4/btg Reng)
+        sekrup_genteng = luas_atap_m2 * 12 
+        sekrup_truss = (btg_c * 8) + (btg_reng * 4)
+        total_sekrup = np.ceil(sekrup_genteng + sekrup_truss)
+        
+        return {
+            "C75.75 (Btg)": int(btg_c),
+            "Reng 30.45 (Btg)": int(btg_reng),
+            "Sekrup (Box)": int(total_sekrup/1000) + 1
+        }
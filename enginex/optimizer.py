@@ -0,0 +1,513 @@
+import math
+import pandas as pd
+import numpy as np
+from . import sni
+from . import ahsp
+from . import sustainability
+
+DIAMETER_STANDAR = (10, 13, 16, 19, 22, 25, 29, 32) # mm, tulangan ulir (D) di pasaran
+FAKTOR_K_FC = 0.083 # Mutu K (kg/cm2, kubus) -> fc' silinder (MPa), sama untuk semua mutu
+
+class RebarSelector:
+    """
+    Pemilihan susunan tulangan diskrit termurah yang memenuhi As_req.
+    Ruang cari: diameter utama (+ opsional 1 diameter pengisi, maks 2 ukuran di bawahnya) x jumlah x lapis,
+    dengan syarat selimut, sengkang & jarak bersih (SNI 2847 Pasal 25.2):
+      jarak bersih >= max(25 mm, db, 4/3 ukuran agregat), jarak antar lapis >= 25 mm.
+    Biaya per meter balok = berat baja x faktor lewatan x harga + ongkos per batang + ongkos lapis tambahan.
+    Hasil di-cache per (b, bucket As_req); As_req dibulatkan ke atas -> konservatif.
+    """
+    def __init__(self, harga_baja=14000, selimut=40, dia_sengkang=10, agregat=20, diameter=DIAMETER_STANDAR,
+                 max_lapis=3, campur=2, biaya_batang=1500, biaya_lapis=10000, faktor_lewatan=1.3, bucket_As=0.02):
+        self.harga_baja = harga_baja
+        self.selimut = selimut
+        self.dia_sengkang = dia_sengkang
+        self.agregat = agregat
+        self.diameter = tuple(sorted(diameter, reverse=True))
+        self.max_lapis = max_lapis
+        self.campur = campur # jumlah ukuran di bawah D utama yang boleh jadi pengisi (0 = satu diameter)
+        self.biaya_batang = biaya_batang # Rp per batang per meter (potong, bengkok, pasang)
+        self.biaya_lapis = biaya_lapis # Rp per lapis tambahan per meter (spacer, tenaga, d efektif berkurang)
+        self.faktor_lewatan = faktor_lewatan # sama dengan BeamOptimizer (lewatan & waste)
+        self.bucket_As = bucket_As
+        self._luas = {D: 0.25 * math.pi * D * D for D in self.diameter}
+        self._cache = {}
+
+    def _harga_luas(self):
+        # Rp per mm2 tulangan per meter panjang
+        return 7850e-6 * self.faktor_lewatan * self.harga_baja
+
+    def _bucket(self, As_req):
+        basis = 1 + self.bucket_As
+        return round(basis ** math.ceil(math.log(max(As_req, 1.0)) / math.log(basis)), 6)
+
+    def _maks_per_lapis(self, b, D):
+        jarak = max(25, D, 4 / 3 * self.agregat)
+        lebar = b - 2 * (self.selimut + self.dia_sengkang)
+        return int((lebar + jarak) // (D + jarak))
+
+    def _cari(self, b, As_req):
+        """Branch-and-bound atas (D utama, D pengisi, n utama); bound = biaya luas minimum + batang minimum"""
+        c_luas = self._harga_luas()
+        terbaik, biaya_terbaik = None, math.inf
+        # Urutkan cabang berdasarkan bound supaya solusi bagus cepat ditemukan
+        cabang = []
+        for i, D1 in enumerate(self.diameter):
+            n_lapis = self._maks_per_lapis(b, D1)
+            if n_lapis < 2:
+                continue
+            pengisi = [None] + list(self.diameter[i + 1:i + 1 + int(self.campur)])
+            for D2 in pengisi:
+                A1 = self._luas[D1]
+                n_min = max(2, math.ceil(As_req / A1 - 1e-9)) if D2 is None else 2
+                n_min_total = max(2, math.ceil(As_req / A1 - 1e-9))
+                bound = c_luas * max(As_req, n_min * A1 if D2 is None else As_req) + self.biaya_batang * n_min_total
+                cabang.append((bound, D1, D2, n_lapis))
+        cabang.sort(key=lambda t: t[0])
+
+        for bound, D1, D2, n_lapis in cabang:
+            if bound >= biaya_terbaik:
+                break # semua cabang berikutnya punya bound lebih besar
+            A1 = self._luas[D1]
+            n1_penuh = max(2, math.ceil(As_req / A1 - 1e-9))
+            n1_list = [n1_penuh] if D2 is None else range(n1_penuh - 1, 1, -1)
+            for n1 in n1_list:
+                sisa = As_req - n1 * A1
+                n2 = 0 if D2 is None else max(1, math.ceil(sisa / self._luas[D2] - 1e-9))
+                if D2 is not None and sisa <= 0:
+                    continue
+                n = n1 + n2
+                lapis = math.ceil(n / n_lapis)
+                # Bound parsial: jumlah batang hanya naik saat n1 turun
+                if c_luas * As_req + self.biaya_batang * n >= biaya_terbaik:
+                    break
+                if lapis > self.max_lapis:
+                    continue
+                As = n1 * A1 + (n2 * self._luas[D2] if n2 else 0.0)
+                biaya = c_luas * As + self.biaya_batang * n + self.biaya_lapis * (lapis - 1)
+                if biaya < biaya_terbaik:
+                    biaya_terbaik = biaya
+                    terbaik = (D1, n1, D2, n2, lapis, As)
+        if terbaik is None:
+            return None
+
+        D1, n1, D2, n2, lapis, As = terbaik
+        jarak = max(25, D1, 4 / 3 * self.agregat)
+        # Titik berat tulangan dari serat tarik (lapis diisi penuh dari bawah)
+        n_lapis = self._maks_per_lapis(b, D1)
+        isi = [min(n_lapis, n1 + n2 - i * n_lapis) for i in range(lapis)]
+        y = [self.selimut + self.dia_sengkang + D1 / 2 + i * (D1 + 25) for i in range(lapis)]
+        ds = sum(k * yi for k, yi in zip(isi, y)) / sum(isi)
+        teks = f"{n1} D{D1}" + (f" + {n2} D{D2}" if n2 else "")
+        return {
+            'Susunan': teks, 'D': D1, 'n': n1, 'D_pengisi': D2 if n2 else None, 'n_pengisi': n2,
+            'Lapis': lapis, 'As': As, 'ds': ds,
+            'Jarak Bersih': (b - 2 * (self.selimut + self.dia_sengkang) - isi[0] * D1) / (isi[0] - 1),
+            'Jarak Min': jarak, 'Biaya': biaya_terbaik
+        }
+
+    def pilih(self, b, As_req):
+        """Susunan termurah untuk satu penampang. Output dict atau None jika tidak muat."""
+        if not np.isfinite(As_req):
+            return None
+        key = (int(round(b)), self._bucket(As_req))
+        if key not in self._cache:
+            self._cache[key] = self._cari(*key)
+        return self._cache[key]
+
+    def pilih_cek_d(self, b, as_perlu, ds_rencana, iterasi=5):
+        """
+        Susunan termurah dengan cek ulang tinggi efektif d.
+        as_perlu(ds) -> As_req (mm2) bila titik berat tulangan tarik berjarak ds dari serat tarik.
+        Susunan berlapis menggeser titik berat ke atas (d mengecil): As_req dihitung ulang dengan
+        ds aktual sampai susunan tidak lagi melebihi ds yang dipakai menghitung As_req.
+        Output dict pilih() + 'As_req', 'ds_rencana', atau None jika tidak muat / tidak konvergen.
+        """
+        ds = ds_rencana
+        for _ in range(iterasi):
+            As_req = as_perlu(ds)
+            res = self.pilih(b, As_req)
+            if res is None:
+                return None
+            if res['ds'] <= ds + 1e-9:
+                return {**res, 'As_req': As_req, 'ds_rencana': ds}
+            ds = res['ds']
+        return None
+
+    def pilih_batch(self, b, As_req):
+        """Versi batch: b & As_req array (broadcast). Output DataFrame satu baris per elemen."""
+        b, As_req = np.broadcast_arrays(np.asarray(b, dtype=float), np.asarray(As_req, dtype=float))
+        rows = []
+        for bi, Ai in zip(b.ravel().tolist(), As_req.ravel().tolist()):
+            res = self.pilih(bi, Ai)
+            rows.append({'b': bi, 'As_req': Ai, **(res or {'Susunan': "TIDAK MUAT", 'As': np.nan, 'Biaya': np.nan})})
+        return pd.DataFrame(rows)
+
+    def biaya_ds_batch(self, b, As_req):
+        """Biaya tulangan diskrit per meter & titik berat ds susunan (array, NaN jika tidak muat)"""
+        b, As_req = np.broadcast_arrays(np.asarray(b, dtype=float), np.asarray(As_req, dtype=float))
+        biaya = np.full(b.shape, np.nan)
+        ds = np.full(b.shape, np.nan)
+        for idx in zip(*np.nonzero(np.isfinite(As_req))):
+            res = self.pilih(b[idx], As_req[idx])
+            if res is not None:
+                biaya[idx], ds[idx] = res['Biaya'], res['ds']
+        return biaya, ds
+
+    def biaya_batch(self, b, As_req):
+        """Biaya tulangan diskrit per meter (array, NaN jika tidak muat)"""
+        return self.biaya_ds_batch(b, As_req)[0]
+
+class BeamOptimizer:
+    def __init__(self, fc, fy, harga_satuan, rebar=None):
+        self.fc = fc
+        self.fy = fy
+        self.h_beton = harga_satuan.get('beton', 1100000)
+        self.h_baja = harga_satuan.get('baja', 14000)
+        self.h_bekisting = harga_satuan.get('bekisting', 150000)
+        self.ds = 40 + 10 + 6
+        self.rho_max = 0.025
+        self.engine_sni = sni.SNI_Concrete_2847(fc, fy)
+        # rebar: RebarSelector opsional -> biaya baja dari susunan diskrit, bukan luas kontinu
+        self.rebar = rebar
+        self.karbon = sustainability.CarbonCalculator()
+
+    # Mutu beton AHSP terendah yang memenuhi fc (MPa); fc tiap mutu = FAKTOR_K_FC x K
+    KODE_BETON = tuple((round(FAKTOR_K_FC * K, 3), f"beton_k{K}") for K in (175, 225, 250, 300, 350))
+    TOLERANSI_FC = 0.1 # MPa, selisih pembulatan konversi (K300 = 24.9 MPa dianggap memenuhi fc 25)
+
+    @classmethod
+    def dari_ahsp(cls, fc, fy, harga_bahan, harga_upah, rebar=None):
+        """
+        Buat optimizer dengan harga satuan dari AHSP_Engine (beton per m3, baja per kg, bekisting per m2),
+        bukan harga asumsi.
+        """
+        engine = ahsp.AHSP_Engine()
+        kode_beton = next((k for f, k in cls.KODE_BETON if f >= fc - cls.TOLERANSI_FC), None)
+        if kode_beton is None:
+            raise ValueError(f"Tidak ada analisa AHSP beton untuk fc {fc} MPa (maks {cls.KODE_BETON[-1][0]} MPa)")
+        harga = {
+            'beton': engine.hitung_hsp(kode_beton, harga_bahan, harga_upah),
+            'baja': engine.hitung_hsp("pembesian_polos", harga_bahan, harga_upah) / 10, # analisa per 10 kg
+            'bekisting': engine.hitung_hsp("bekisting_balok", harga_bahan, harga_upah),
+        }
+        return cls(fc, fy, harga, rebar=rebar)
+
+    def evaluasi_gwp(self, b, h, As_req):
+        """GWP (kgCO2e) per meter balok, vektor; faktor berat baja sama dengan evaluasi_grid"""
+        vol_beton = (np.asarray(b) / 1000) * (np.asarray(h) / 1000) * 1.0
+        berat_baja = (np.asarray(As_req) * 1.0 * 7850) / 1e6 * 1.3
+        return self.karbon.calculate_gwp(vol_beton, berat_baja)
+
+    @staticmethod
+    def front_pareto(biaya, gwp):
+        """
+        Indeks titik non-dominated (minimasi biaya & GWP), urut dari termurah.
+        Sort O(n log n) lalu scan minimum berjalan GWP.
+        """
+        biaya = np.asarray(biaya, dtype=float).ravel()
+        gwp = np.asarray(gwp, dtype=float).ravel()
+        ok = np.nonzero(np.isfinite(biaya) & np.isfinite(gwp))[0]
+        urut = ok[np.lexsort((gwp[ok], biaya[ok]))]
+        g = gwp[urut]
+        # Titik masuk front jika GWP-nya lebih kecil dari semua titik yang lebih murah
+        min_sebelum = np.concatenate([[np.inf], np.minimum.accumulate(g)[:-1]])
+        return urut[g < min_sebelum]
+
+    def evaluasi_grid(self, Mu_kNm, b, h, h_min=300):
+        """
+        Evaluasi vektor (broadcasting) kombinasi Mu x penampang b x h.
+        Dengan RebarSelector, As_req dihitung ulang memakai ds susunan aktual (tulangan berlapis).
+        Output: (As_req, rho, biaya per meter, mask valid)
+        """
+        b = np.asarray(b, dtype=float)
+        h = np.asarray(h, dtype=float)
+        As_req = self.engine_sni.kebutuhan_tulangan_batch(Mu_kNm, b, h, self.ds) # NaN = butuh tulangan rangkap
+        ds = np.full(As_req.shape, float(self.ds))
+
+        def cek(As_req, ds):
+            rho = As_req / (b * (h - ds))
+            return rho, (h >= b) & (h <= 3 * b) & (h >= h_min) & np.isfinite(As_req) & (rho <= self.rho_max)
+
+        rho, valid = cek(As_req, ds)
+        berat_baja = (As_req * 1.0 * 7850) / 1e6 * 1.3
+        biaya_baja = berat_baja * self.h_baja
+        if self.rebar is not None:
+            b_grid = np.broadcast_to(b, As_req.shape)
+            for _ in range(5):
+                biaya_baja, ds_aktual = self.rebar.biaya_ds_batch(b_grid, np.where(valid, As_req, np.nan))
+                # Susunan berlapis -> d aktual lebih kecil: hitung ulang As_req dengan ds susunan
+                naik = valid & (ds_aktual > ds + 1e-9)
+                if not naik.any():
+                    break
+                ds = np.where(naik, ds_aktual, ds)
+                As_req = np.where(naik, self.engine_sni.kebutuhan_tulangan_batch(Mu_kNm, b, h, ds), As_req)
+                rho, valid = cek(As_req, ds)
+            else:
+                valid = valid & ~naik # tidak konvergen
+            valid = valid & np.isfinite(biaya_baja)
+
+        vol_beton = (b/1000) * (h/1000) * 1.0
+        luas_bekisting = (2 * (h/1000)) + (b/1000)
+        biaya = (vol_beton * self.h_beton) + biaya_baja + (luas_bekisting * self.h_bekisting)
+        return As_req, rho, biaya, valid
+
+    def cari_dimensi_optimal(self, Mu_kNm, bentang_m, step=50, b_min=200, b_max=600, h_max=1000, top_k=3):
+        """
+        Mencari dimensi b x h yang paling murah namun Aman.
+        Seluruh grid b x h dievaluasi sekaligus (NumPy), sehingga grid halus
+        (mis. step=25 mm) atau rentang lebih besar tetap cepat.
+        Output: list top_k dict {b, h, As, Biaya, Rho} urut dari termurah, atau None.
+        """
+        # Batas atas eksklusif (+step) sama seperti range() versi lama
+        range_b = np.arange(b_min, b_max + step, step)
+        h_min_rec = int(bentang_m * 1000 / 15)
+        range_h = np.arange(max(300, h_min_rec), h_max + step, step)
+        if range_b.size == 0 or range_h.size == 0: return None
+
+        # Grid (n_b x n_h)
+        As_req, rho, biaya, valid = self.evaluasi_grid(Mu_kNm, range_b[:, None], range_h[None, :])
+        if not valid.any(): return None
+
+        # Top-k termurah tanpa sort seluruh grid
+        biaya_flat = np.where(valid, biaya, np.inf).ravel()
+        k = min(top_k, int(valid.sum()))
+        kandidat = np.argpartition(biaya_flat, k - 1)[:k] if k < biaya_flat.size else np.arange(biaya_flat.size)
+        kandidat = kandidat[np.lexsort((kandidat, biaya_flat[kandidat]))][:k]
+
+        i_b, i_h = np.unravel_index(kandidat, biaya.shape)
+        return [{
+            'b': int(range_b[ib]), 'h': int(range_h[ih]), 'As': float(As_req[ib, ih]),
+            'Biaya': float(biaya[ib, ih]), 'Rho': float(rho[ib, ih] * 100)
+        } for ib, ih in zip(i_b, i_h)]
+
+    def pareto_biaya_karbon(self, Mu_kNm, bentang_m, step=50, b_min=200, b_max=600, h_max=1000):
+        """
+        Mode multi-objektif: seluruh grid b x h dievaluasi sekali untuk biaya & GWP,
+        lalu diambil front Pareto (tidak ada opsi lain yang lebih murah SEKALIGUS lebih rendah emisi).
+        Output: DataFrame front {b, h, As, Biaya, GWP, Rho} urut dari termurah (kosong jika tidak ada).
+        """
+        range_b = np.arange(b_min, b_max + step, step)
+        range_h = np.arange(max(300, int(bentang_m * 1000 / 15)), h_max + step, step)
+        kolom = ['b', 'h', 'As', 'Biaya', 'GWP', 'Rho']
+        if range_b.size == 0 or range_h.size == 0: return pd.DataFrame(columns=kolom)
+
+        bb, hh = np.broadcast_arrays(range_b[:, None], range_h[None, :])
+        As_req, rho, biaya, valid = self.evaluasi_grid(Mu_kNm, bb, hh)
+        gwp = self.evaluasi_gwp(bb, hh, As_req)
+        idx = self.front_pareto(np.where(valid, biaya, np.inf), gwp)
+        return pd.DataFrame({
+            'b': bb.ravel()[idx].astype(int), 'h': hh.ravel()[idx].astype(int), 'As': As_req.ravel()[idx],
+            'Biaya': biaya.ravel()[idx], 'GWP': gwp.ravel()[idx], 'Rho': rho.ravel()[idx] * 100
+        }, columns=kolom)
+
+class BuildingBeamOptimizer:
+    """
+    Optimasi seluruh balok gedung sekaligus.
+    1. Demand (Mu, bentang) dikelompokkan ke bucket (dibulatkan ke atas -> konservatif)
+    2. Biaya tiap bucket x tipe penampang dihitung sekali & di-cache antar panggilan
+    3. Jumlah tipe penampang dibatasi/ditimbang (reuse bekisting) lewat DP atas interval bucket
+       yang diurutkan menurut penampang termurahnya. Grup dibatasi berupa interval berurutan,
+       jadi hasilnya heuristik (optimal hanya di antara pengelompokan interval), bukan optimum global.
+    """
+    def __init__(self, fc, fy, harga_satuan, step=50, b_min=200, b_max=600, h_max=1000,
+                 bucket_mu=0.05, bucket_bentang=0.5):
+        self.optimizer = BeamOptimizer(fc, fy, harga_satuan)
+        self.bucket_mu = bucket_mu # lebar bucket Mu relatif (5%)
+        self.bucket_bentang = bucket_bentang # lebar bucket bentang (m)
+
+        # Katalog tipe penampang kandidat (aspek rasio valid)
+        bb, hh = np.meshgrid(np.arange(b_min, b_max + step, step), np.arange(300, h_max + step, step), indexing='ij')
+        ok = (hh >= bb) & (hh <= 3 * bb)
+        self.tipe_b = bb[ok].astype(float)
+        self.tipe_h = hh[ok].astype(float)
+        self._cache = {} # (Mu_bucket, bentang_bucket) -> biaya per meter tiap tipe (inf = tidak valid)
+        self.stats = {"solve": 0, "cache_hit": 0}
+
+    def _bucket(self, Mu, bentang):
+        """Pembulatan ke atas: Mu ke grid geometrik, bentang ke kelipatan bucket_bentang"""
+        basis = 1 + self.bucket_mu
+        Mu_b = basis ** np.ceil(np.log(np.maximum(Mu, 1e-6)) / np.log(basis))
+        L_b = np.ceil(bentang / self.bucket_bentang - 1e-9) * self.bucket_bentang
+        return np.round(Mu_b, 6), np.round(L_b, 6)
+
+    def _biaya_bucket(self, Mu_b, L_b):
+        """Matriks biaya per meter (bucket x tipe), memakai cache untuk bucket yang pernah dihitung"""
+        keys = list(zip(Mu_b.tolist(), L_b.tolist()))
+        baru = [i for i, key in enumerate(keys) if key not in self._cache]
+        self.stats["cache_hit"] += len(keys) - len(baru)
+        if baru:
+            Mu_n, L_n = Mu_b[baru][:, None], L_b[baru][:, None]
+            h_min = np.maximum(300, (L_n * 1000 / 15).astype(int))
+            _, _, biaya, valid = self.optimizer.evaluasi_grid(Mu_n, self.tipe_b[None, :], self.tipe_h[None, :], h_min)
+            biaya = np.where(valid, biaya, np.inf)
+            for row, i in enumerate(baru):
+                self._cache[keys[i]] = biaya[row]
+            self.stats["solve"] += len(baru)
+        return np.vstack([self._cache[key] for key in keys])
+
+    @staticmethod
+    def _biaya_interval(W):
+        """
+        G[l, r] = biaya minimum jika bucket l..r (urut) memakai SATU tipe yang sama.
+        W: (n_bucket x n_tipe) biaya total, inf = tidak valid.
+        """
+        n, m = W.shape
+        finite = np.isfinite(W)
+        cum = np.vstack([np.zeros(m), np.cumsum(np.where(finite, W, 0.0), axis=0)])
+        cum_bad = np.vstack([np.zeros(m, dtype=int), np.cumsum(~finite, axis=0)])
+        G = np.full((n, n), np.inf)
+        arg = np.full((n, n), -1)
+        for r in range(n):
+            total = cum[r + 1] - cum[:r + 1]
+            total[(cum_bad[r + 1] - cum_bad[:r + 1]) > 0] = np.inf
+            G[:r + 1, r] = total.min(axis=1)
+            arg[:r + 1, r] = total.argmin(axis=1)
+        return G, arg
+
+    def optimasi(self, data, max_tipe=None, penalti_tipe=0.0):
+        """
+        Pilih tipe penampang seluruh balok (DP interval, heuristik) dengan jumlah tipe terbatas.
+        data: DataFrame kolom id, Mu (kNm), bentang (m).
+        max_tipe: batas jumlah tipe penampang berbeda (None = bebas).
+        penalti_tipe: biaya tambahan per tipe penampang (Rp, mis. set bekisting baru).
+        Output dict:
+          jadwal   : DataFrame per member (Tipe, b, h, As, Biaya)
+          tipe     : DataFrame ringkasan tipe penampang
+          tradeoff : DataFrame jumlah tipe vs total biaya
+          total_biaya, n_tipe, stats
+          status   : "OK" atau "TIDAK ADA SOLUSI" (mis. max_tipe lebih kecil dari jumlah grup
+                     yang dibutuhkan); tanpa solusi semua member bertipe "TIDAK ADA"
+        """
+        df = pd.DataFrame(data).reset_index(drop=True)
+        Mu = df['Mu'].to_numpy(dtype=float)
+        L = df['bentang'].to_numpy(dtype=float)
+        Mu_b, L_b = self._bucket(Mu, L)
+
+        # Bucket unik + total panjang balok tiap bucket
+        kunci, inv = np.unique(np.column_stack([Mu_b, L_b]), axis=0, return_inverse=True)
+        inv = inv.ravel()
+        panjang = np.bincount(inv, weights=L, minlength=len(kunci))
+        biaya_m = self._biaya_bucket(kunci[:, 0], kunci[:, 1])
+
+        # Bucket tanpa penampang valid dikeluarkan dari DP
+        layak = np.isfinite(biaya_m).any(axis=1)
+        idx_layak = np.nonzero(layak)[0]
+
+        # Urutkan bucket berdasarkan penampang termurah individual (h, b) lalu Mu
+        terbaik = biaya_m[idx_layak].argmin(axis=1)
+        urut = idx_layak[np.lexsort((kunci[idx_layak, 0], self.tipe_b[terbaik], self.tipe_h[terbaik]))]
+        W = biaya_m[urut] * panjang[urut][:, None]
+        n = len(urut)
+
+        tipe_bucket = np.full(len(kunci), -1)
+        tradeoff = []
+        if n:
+            G, arg = self._biaya_interval(W)
+            k_max = n if max_tipe is None else min(max_tipe, n)
+            # Batas bawah: tiap bucket memakai tipe termurahnya sendiri (tanpa batas jumlah tipe)
+            batas_bawah = W.min(axis=1).sum()
+            # DP: best[k, r] = biaya minimum r bucket pertama dengan k tipe
+            best = np.full((k_max + 1, n + 1), np.inf)
+            back = np.zeros((k_max + 1, n + 1), dtype=int)
+            best[0, 0] = 0.0
+            for k in range(1, k_max + 1):
+                # cand[l, r-1] = best[k-1, l] + G[l, r-1]; G = inf untuk l > r-1
+                cand = best[k - 1, :n, None] + G
+                back[k, 1:] = cand.argmin(axis=0)
+                best[k, 1:] = cand[back[k, 1:], np.arange(n)]
+                if np.isfinite(best[k, n]):
+                    tradeoff.append({"Jumlah Tipe": k, "Total Biaya": best[k, n],
+                                     "Total + Penalti": best[k, n] + penalti_tipe * k})
+                if np.isfinite(best[k, n]) and best[k, n] <= batas_bawah * (1 + 1e-12):
+                    break # Batas bawah tercapai: tambah tipe tidak mungkin menurunkan biaya
+
+            # Pilih k dengan (biaya + penalti) minimum, lalu rekonstruksi grup
+            if tradeoff:
+                k_opt = min(tradeoff, key=lambda t: t["Total + Penalti"])["Jumlah Tipe"]
+                r = n
+                for k in range(k_opt, 0, -1):
+                    l = back[k, r]
+                    tipe_bucket[urut[l:r]] = arg[l, r - 1]
+                    r = l
+
+        # Jadwal per member: As & biaya dihitung ulang dengan Mu aktual member
+        t_member = tipe_bucket[inv]
+        ada = t_member >= 0
+        b_m = np.where(ada, self.tipe_b[np.maximum(t_member, 0)], np.nan)
+        h_m = np.where(ada, self.tipe_h[np.maximum(t_member, 0)], np.nan)
+        As, rho, biaya, _ = self.optimizer.evaluasi_grid(Mu, np.nan_to_num(b_m, nan=1.0), np.nan_to_num(h_m, nan=1.0))
+
+        nama_tipe = {t: f"B{i + 1}" for i, t in enumerate(sorted(set(t_member[ada].tolist()),
+                                                                    key=lambda t: (self.tipe_h[t], self.tipe_b[t])))}
+        jadwal = pd.DataFrame({
+            'id': df['id'] if 'id' in df else df.index,
+            'Mu': Mu, 'bentang': L, 'Mu_bucket': Mu_b, 'bentang_bucket': L_b,
+            'Tipe': [nama_tipe.get(t, "TIDAK ADA") for t in t_member.tolist()],
+            'b': b_m, 'h': h_m,
+            'As': np.where(ada, As, np.nan), 'Rho (%)': np.where(ada, rho * 100, np.nan),
+            'Biaya per m': np.where(ada, biaya, np.nan),
+            'Biaya': np.where(ada, biaya * L, np.nan)
+        })
+        ringkas = (jadwal[jadwal['Tipe'] != "TIDAK ADA"]
+                   .groupby(['Tipe', 'b', 'h'], as_index=False)
+                   .agg(**{'Jumlah Member': ('id', 'count'), 'Panjang Total (m)': ('bentang', 'sum'),
+                           'Biaya': ('Biaya', 'sum')}))
+
+        return {
+            "jadwal": jadwal,
+            "tipe": ringkas,
+            "tradeoff": pd.DataFrame(tradeoff, columns=["Jumlah Tipe", "Total Biaya", "Total + Penalti"]),
+            "total_biaya": float(np.nansum(jadwal['Biaya'])),
+            "n_tipe": len(nama_tipe),
+            "stats": {"member": len(df), "bucket": len(kunci), "tidak_valid": int((~ada).sum()), **self.stats},
+            "status": "OK" if tradeoff else "TIDAK ADA SOLUSI",
+        }
+
+    def pareto_proyek(self, data, n_bobot=21):
+        """
+        Front biaya-karbon tingkat proyek (semua balok sekaligus).
+        Matriks biaya & GWP (member x tipe penampang) dihitung sekali, lalu tiap bobot
+        lambda memilih penampang per member yang meminimumkan (1-lambda)*biaya + lambda*GWP
+        (ternormalisasi). Hasilnya titik-titik front Pareto proyek yang "supported" (hull konveks).
+        Output dict:
+          front   : DataFrame {Bobot GWP, Total Biaya, Total GWP, Jumlah Tipe} urut dari termurah
+          pilihan : array (n_front x n_member) indeks ke tabel tipe
+          tipe    : DataFrame {b, h} tipe penampang kandidat
+        """
+        df = pd.DataFrame(data).reset_index(drop=True)
+        Mu = df['Mu'].to_numpy(dtype=float)[:, None]
+        L = df['bentang'].to_numpy(dtype=float)
+        h_min = np.maximum(300, (L * 1000 / 15).astype(int))[:, None]
+        b, h = self.tipe_b[None, :], self.tipe_h[None, :]
+
+        As_req, _, biaya, valid = self.optimizer.evaluasi_grid(Mu, b, h, h_min)
+        # Total per member = per meter x panjang bentang
+        C = np.where(valid, biaya, np.inf) * L[:, None]
+        G = np.where(valid, self.optimizer.evaluasi_gwp(b, h, As_req), np.inf) * L[:, None]
+        layak = np.isfinite(C).any(axis=1)
+        C, G = C[layak], G[layak]
+
+        tipe = pd.DataFrame({'b': self.tipe_b.astype(int), 'h': self.tipe_h.astype(int)})
+        kolom = ['Bobot GWP', 'Total Biaya', 'Total GWP', 'Jumlah Tipe']
+        if not layak.any():
+            return {"front": pd.DataFrame(columns=kolom), "pilihan": np.empty((0, len(df)), dtype=int), "tipe": tipe}
+
+        # Normalisasi; tipe tidak valid diberi skor sangat besar (hindari inf * 0 saat lambda = 0/1)
+        c_n = np.where(np.isfinite(C), C / C.min(axis=1).sum(), 1e30)
+        g_n = np.where(np.isfinite(G), G / G.min(axis=1).sum(), 1e30)
+        baris = np.arange(len(C))
+        titik, pilih_all = [], []
+        for lam in np.linspace(0.0, 1.0, n_bobot):
+            skor = (1 - lam) * c_n + lam * g_n
+            pilih = skor.argmin(axis=1)
+            titik.append((lam, C[baris, pilih].sum(), G[baris, pilih].sum(), len(np.unique(pilih))))
+            pilih_all.append(pilih)
+
+        arr = np.array(titik)
+        idx = self.optimizer.front_pareto(arr[:, 1], arr[:, 2])
+        pilihan = np.full((len(idx), len(df)), -1) # -1 = member tanpa penampang valid
+        pilihan[:, layak] = np.array(pilih_all)[idx]
+        front = pd.DataFrame(arr[idx], columns=kolom)
+        front['Jumlah Tipe'] = front['Jumlah Tipe'].astype(int)
+        return {"front": front.reset_index(drop=True), "pilihan": pilihan, "tipe": tipe}
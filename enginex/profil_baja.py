@@ -0,0 +1,299 @@
+"""
+Katalog profil baja ENGINEX (WF/H/WB/CHS/RHS) dalam struktur kolom NumPy.
+
+Katalog dibangun sekali (properti dihitung dari dimensi) lalu dibagi ke engine
+sebagai view tanpa salinan: baris dikelompokkan per bentuk, sehingga subset
+bentuk yang berurutan (mis. profil I = WF + H + WB) adalah slice dari array induk.
+Kolom berat, Zx, Ix dan h punya indeks terurut untuk query rentang (bisect).
+
+    from enginex import profil_baja
+    kat = profil_baja.katalog()
+    kat.cari(Zx_min=600e3, h_max=400, bentuk=("WF", "H"))  # urut kg/m
+    kat.profil("WF 300x150")["Zx"]
+
+Satuan: mm, mm2, mm3, mm4, mm6; berat kg/m.
+"""
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+BERAT_JENIS_BAJA = 7850 # kg/m3
+
+# ==========================================
+# 1. DATA DIMENSI PROFIL STANDAR
+# ==========================================
+# Profil canai panas standar pabrik Indonesia (JIS G3192 / SNI 07-7178)
+# (nama, h, b, tw, tf, r) - mm
+PROFIL_WF = (
+    ("WF 100x50", 100, 50, 5, 7, 8), ("WF 125x60", 125, 60, 6, 8, 8),
+    ("WF 150x75", 150, 75, 5, 7, 8), ("WF 175x90", 175, 90, 5, 8, 9),
+    ("WF 198x99", 198, 99, 4.5, 7, 11), ("WF 200x100", 200, 100, 5.5, 8, 11),
+    ("WF 248x124", 248, 124, 5, 8, 12), ("WF 250x125", 250, 125, 6, 9, 12),
+    ("WF 298x149", 298, 149, 5.5, 8, 13), ("WF 300x150", 300, 150, 6.5, 9, 13),
+    ("WF 346x174", 346, 174, 6, 9, 14), ("WF 350x175", 350, 175, 7, 11, 14),
+    ("WF 396x199", 396, 199, 7, 11, 16), ("WF 400x200", 400, 200, 8, 13, 16),
+    ("WF 446x199", 446, 199, 8, 12, 18), ("WF 450x200", 450, 200, 9, 14, 18),
+    ("WF 496x199", 496, 199, 9, 14, 20), ("WF 500x200", 500, 200, 10, 16, 20),
+    ("WF 596x199", 596, 199, 10, 15, 22), ("WF 600x200", 600, 200, 11, 17, 22),
+    ("WF 294x200", 294, 200, 8, 12, 18), ("WF 340x250", 340, 250, 9, 14, 20),
+    ("WF 390x300", 390, 300, 10, 16, 22), ("WF 440x300", 440, 300, 11, 18, 24),
+    ("WF 488x300", 488, 300, 11, 18, 26), ("WF 588x300", 588, 300, 12, 20, 28),
+    ("WF 700x300", 700, 300, 13, 24, 28), ("WF 800x300", 800, 300, 14, 26, 28),
+    ("WF 900x300", 900, 300, 16, 28, 28),
+)
+PROFIL_H = (
+    ("H 100x100", 100, 100, 6, 8, 10), ("H 125x125", 125, 125, 6.5, 9, 10),
+    ("H 150x150", 150, 150, 7, 10, 11), ("H 175x175", 175, 175, 7.5, 11, 12),
+    ("H 200x200", 200, 200, 8, 12, 13), ("H 250x250", 250, 250, 9, 14, 16),
+    ("H 300x300", 300, 300, 10, 15, 18), ("H 350x350", 350, 350, 12, 19, 20),
+    ("H 400x400", 400, 400, 13, 21, 22),
+)
+# Welded beam (Gunung Garuda / Krakatau Steel), las sudut -> r = 0
+PROFIL_WB = (
+    ("WB 500x250", 500, 250, 10, 16, 0), ("WB 600x300", 600, 300, 12, 20, 0),
+    ("WB 700x300", 700, 300, 13, 24, 0), ("WB 800x300", 800, 300, 14, 26, 0),
+    ("WB 900x300", 900, 300, 16, 28, 0), ("WB 1000x350", 1000, 350, 16, 32, 0),
+    ("WB 1100x400", 1100, 400, 18, 32, 0), ("WB 1200x400", 1200, 400, 18, 36, 0),
+    ("WB 1400x400", 1400, 400, 20, 36, 0), ("WB 1500x500", 1500, 500, 22, 40, 0),
+)
+# Pipa bulat (JIS G3444 STK): (nama, D, t)
+PROFIL_CHS = tuple((f"CHS {D}x{t}", D, t) for D, t in (
+    (60.5, 3.2), (76.3, 3.2), (89.1, 3.2), (101.6, 4.0), (114.3, 4.5), (139.8, 4.5), (165.2, 5.0),
+    (216.3, 6.0), (267.4, 6.0), (318.5, 6.9), (355.6, 7.9), (406.4, 9.0), (457.2, 9.5), (508.0, 12.0),
+))
+# Hollow persegi/persegi panjang (JIS G3466 STKR): (nama, H, B, t)
+PROFIL_RHS = tuple((f"RHS {H}x{B}x{t}", H, B, t) for H, B, t in (
+    (50, 50, 2.3), (75, 75, 3.2), (100, 50, 3.2), (100, 100, 4.0), (125, 75, 4.5), (150, 100, 4.5),
+    (150, 150, 6.0), (200, 100, 6.0), (200, 200, 8.0), (250, 150, 6.0), (250, 250, 9.0),
+    (300, 200, 9.0), (300, 300, 12.0), (400, 200, 12.0),
+))
+
+# Urutan blok bentuk di katalog: profil I berurutan agar view-nya berupa slice
+BENTUK = ("WF", "H", "WB", "CHS", "RHS")
+BENTUK_I = ("WF", "H", "WB")
+KOLOM_INDEKS = ("berat", "Zx", "Ix", "h")
+
+# ==========================================
+# 2. PROPERTI PENAMPANG DARI DIMENSI
+# ==========================================
+def _lengkapi(A, Ix, Iy, Sx, Sy, Zx, Zy, J, Cw, **dim):
+    return {
+        "A": A, "berat": A * 1e-6 * BERAT_JENIS_BAJA,
+        "Ix": Ix, "Iy": Iy, "Sx": Sx, "Sy": Sy, "Zx": Zx, "Zy": Zy,
+        "rx": np.sqrt(Ix / A), "ry": np.sqrt(Iy / A),
+        "J": J, "Cw": Cw, **dim,
+    }
+
+def properti_profil_i(h, b, tw, tf, r=0.0):
+    """
+    Properti penampang I simetris ganda dari dimensi (mm, boleh array).
+    Fillet (radius r) ikut dihitung pada A, Ix, Zx; J & Cw pakai rumus dinding tipis.
+    Return dict array: A (mm2), berat (kg/m), Ix, Iy (mm4), Sx, Sy, Zx, Zy (mm3), rx, ry (mm), J (mm4), Cw (mm6)
+    """
+    h, b, tw, tf, r = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (h, b, tw, tf, r)))
+    hw = h - 2 * tf # tinggi badan bersih antar sayap
+    A_fillet = (4 - np.pi) * r ** 2 # 4 fillet
+    y_fillet = hw / 2 - (10 - 3 * np.pi) / (12 - 3 * np.pi) * r # titik berat fillet dari sumbu netral
+    Ix = (b * h ** 3 - (b - tw) * hw ** 3) / 12 + A_fillet * y_fillet ** 2
+    Iy = (2 * tf * b ** 3 + hw * tw ** 3) / 12 + A_fillet * (tw / 2 + 0.2234 * r) ** 2
+    ho = h - tf
+    return _lengkapi(
+        A=2 * b * tf + hw * tw + A_fillet,
+        Ix=Ix, Iy=Iy, Sx=2 * Ix / h, Sy=2 * Iy / b,
+        Zx=b * tf * (h - tf) + tw * hw ** 2 / 4 + A_fillet * y_fillet,
+        Zy=tf * b ** 2 / 2 + hw * tw ** 2 / 4,
+        J=(2 * b * tf ** 3 + ho * tw ** 3) / 3,
+        Cw=Iy * ho ** 2 / 4,
+        h=h, b=b, tw=tw, tf=tf, r=r, t=np.full_like(h, np.nan),
+    )
+
+def properti_chs(D, t):
+    """Properti pipa bulat diameter luar D, tebal t (mm, boleh array)"""
+    D, t = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (D, t)))
+    d = D - 2 * t
+    I = np.pi / 64 * (D ** 4 - d ** 4)
+    Z = (D ** 3 - d ** 3) / 6
+    nan = np.full_like(D, np.nan)
+    return _lengkapi(
+        A=np.pi / 4 * (D ** 2 - d ** 2),
+        Ix=I, Iy=I, Sx=2 * I / D, Sy=2 * I / D, Zx=Z, Zy=Z,
+        J=2 * I, Cw=np.zeros_like(D),
+        h=D, b=D, tw=nan, tf=nan, r=nan, t=t,
+    )
+
+def properti_rhs(H, B, t):
+    """Properti hollow persegi panjang H x B tebal t (mm, boleh array); sudut dianggap tajam"""
+    H, B, t = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (H, B, t)))
+    hi, bi = H - 2 * t, B - 2 * t
+    Ix = (B * H ** 3 - bi * hi ** 3) / 12
+    Iy = (H * B ** 3 - hi * bi ** 3) / 12
+    nan = np.full_like(H, np.nan)
+    return _lengkapi(
+        A=B * H - bi * hi,
+        Ix=Ix, Iy=Iy, Sx=2 * Ix / H, Sy=2 * Iy / B,
+        Zx=(B * H ** 2 - bi * hi ** 2) / 4, Zy=(H * B ** 2 - hi * bi ** 2) / 4,
+        # Torsi penampang tertutup dinding tipis (Bredt): 4 Am^2 t / keliling tengah
+        J=2 * t * (B - t) ** 2 * (H - t) ** 2 / (B + H - 2 * t),
+        Cw=np.zeros_like(H),
+        h=H, b=B, tw=nan, tf=nan, r=nan, t=t,
+    )
+
+# ==========================================
+# 3. KATALOG KOLOM + INDEKS TERURUT
+# ==========================================
+class KatalogProfil:
+    """
+    Katalog profil kolom NumPy (read-only): kat["Zx"] -> array, kat.profil(nama) -> dict baris.
+    Bisa dipakai langsung sebagai `katalog` engine baja (mapping kolom array).
+    """
+    def __init__(self, kolom):
+        self._kolom = kolom
+        self._n = len(kolom["Profil"])
+        self._posisi = None
+        self._indeks = {}
+        self._view = {}
+
+    @classmethod
+    def dari_tabel(cls, blok):
+        """blok: [(bentuk, dict properti array, nama)] -> katalog; urut per blok bentuk lalu berat"""
+        bagian = []
+        for bentuk, prop, nama in blok:
+            urut = np.argsort(prop["berat"], kind="stable")
+            bagian.append({**{k: np.asarray(v)[urut] for k, v in prop.items()},
+                           "Profil": np.asarray(nama, dtype=object)[urut],
+                           "bentuk": np.full(len(urut), bentuk, dtype=object)})
+        kolom = {k: np.concatenate([b[k] for b in bagian]) for k in bagian[0]}
+        for v in kolom.values():
+            v.flags.writeable = False
+        return cls(kolom)
+
+    # --- Protokol mapping kolom (dipakai engine) ---
+    def __getitem__(self, kolom):
+        return self._kolom[kolom]
+
+    def __contains__(self, kolom):
+        return kolom in self._kolom
+
+    def __len__(self):
+        return self._n
+
+    def keys(self):
+        return self._kolom.keys()
+
+    def __repr__(self):
+        return f"KatalogProfil({self._n} profil: {', '.join(dict.fromkeys(self._kolom['bentuk']))})"
+
+    # --- Akses baris ---
+    def posisi(self, nama):
+        """Nama profil -> indeks baris (KeyError jika tidak ada)"""
+        if self._posisi is None:
+            self._posisi = {n: i for i, n in enumerate(self._kolom["Profil"])}
+        return self._posisi[nama]
+
+    def profil(self, nama):
+        """Dict baris satu profil (nilai skalar Python)"""
+        return self.baris(self.posisi(nama))
+
+    def baris(self, i):
+        return {k: v[i:i + 1].tolist()[0] for k, v in self._kolom.items()}
+
+    def tabel(self, idx=None, kolom=None):
+        """DataFrame (salinan) untuk baris idx (default semua)"""
+        kolom = list(self._kolom) if kolom is None else ["Profil", *[k for k in kolom if k != "Profil"]]
+        sel = slice(None) if idx is None else idx
+        return pd.DataFrame({k: self._kolom[k][sel] for k in kolom})
+
+    # --- View per bentuk (tanpa salinan) ---
+    def pilih_bentuk(self, *bentuk):
+        """
+        Sub-katalog bentuk tertentu. Blok yang berurutan di katalog (mis. WF, H, WB)
+        menjadi slice -> view tanpa salinan; kombinasi lain memakai fancy index (salinan).
+        Hasil di-cache sehingga engine yang meng-cache per katalog tetap efektif.
+        """
+        key = tuple(bentuk)
+        view = self._view.get(key)
+        if view is not None:
+            return view
+        idx = np.flatnonzero(np.isin(self._kolom["bentuk"], key))
+        if len(idx) and idx[-1] - idx[0] + 1 == len(idx):
+            sel = slice(int(idx[0]), int(idx[-1]) + 1)
+        else:
+            sel = idx
+        view = self._view[key] = KatalogProfil({k: v[sel] for k, v in self._kolom.items()})
+        for v in view._kolom.values():
+            v.flags.writeable = False
+        return view
+
+    # --- Indeks terurut & query rentang ---
+    def _indeks_kolom(self, kolom):
+        """(urutan argsort, nilai terurut) kolom - dibangun sekali per katalog/view"""
+        ind = self._indeks.get(kolom)
+        if ind is None:
+            urut = np.argsort(self._kolom[kolom], kind="stable")
+            ind = self._indeks[kolom] = (urut, self._kolom[kolom][urut])
+        return ind
+
+    def rentang(self, kolom, minimum=None, maksimum=None):
+        """Indeks baris dengan minimum <= kolom <= maksimum via bisect, urut naik nilai kolom"""
+        urut, nilai = self._indeks_kolom(kolom)
+        lo = 0 if minimum is None else int(np.searchsorted(nilai, minimum, "left"))
+        hi = len(nilai) if maksimum is None else int(np.searchsorted(nilai, maksimum, "right"))
+        return urut[lo:hi]
+
+    def terdekat(self, kolom, nilai):
+        """Indeks baris dengan nilai kolom paling dekat (bisect pada indeks terurut)"""
+        urut, terurut = self._indeks_kolom(kolom)
+        j = int(np.searchsorted(terurut, nilai))
+        kandidat = [k for k in (j - 1, j) if 0 <= k < len(terurut)]
+        return int(urut[min(kandidat, key=lambda k: abs(terurut[k] - nilai))])
+
+    def indeks(self, urut="berat", bentuk=None, **batas):
+        """
+        Indeks baris yang memenuhi semua batas, terurut naik kolom `urut`.
+        batas: <kolom>_min / <kolom>_max, mis. Zx_min=600e3, h_max=400.
+        Kolom berindeks (berat, Zx, Ix, h) memakai bisect; kolom lain dibandingkan langsung.
+        """
+        mask = np.ones(self._n, dtype=bool)
+        if bentuk is not None:
+            mask &= np.isin(self._kolom["bentuk"], (bentuk,) if isinstance(bentuk, str) else tuple(bentuk))
+        rentang = {}
+        for key, v in batas.items():
+            kolom, _, jenis = key.rpartition("_")
+            if jenis not in ("min", "max") or kolom not in self._kolom:
+                raise ValueError(f"Batas '{key}' tidak dikenal (format <kolom>_min / <kolom>_max)")
+            rentang.setdefault(kolom, [None, None])[jenis == "max"] = v
+        for kolom, (lo, hi) in rentang.items():
+            if kolom in KOLOM_INDEKS:
+                pilih = np.zeros(self._n, dtype=bool)
+                pilih[self.rentang(kolom, lo, hi)] = True
+            else:
+                nilai = self._kolom[kolom]
+                pilih = np.ones(self._n, dtype=bool)
+                if lo is not None:
+                    pilih &= nilai >= lo
+                if hi is not None:
+                    pilih &= nilai <= hi
+            mask &= pilih
+        urutan = self._indeks_kolom(urut)[0]
+        return urutan[mask[urutan]]
+
+    def cari(self, urut="berat", bentuk=None, n=None, kolom=("bentuk", "h", "b", "berat", "Zx", "Ix"), **batas):
+        """Query profil -> DataFrame terurut (mis. semua Zx >= X dan h <= D, urut kg/m)"""
+        idx = self.indeks(urut, bentuk, **batas)
+        return self.tabel(idx[:n], kolom).reset_index(drop=True)
+
+@lru_cache(maxsize=None)
+def katalog():
+    """Katalog global semua profil standar (dibangun sekali per proses)"""
+    blok = []
+    for bentuk, data, fungsi in (("WF", PROFIL_WF, properti_profil_i), ("H", PROFIL_H, properti_profil_i),
+                                 ("WB", PROFIL_WB, properti_profil_i), ("CHS", PROFIL_CHS, properti_chs),
+                                 ("RHS", PROFIL_RHS, properti_rhs)):
+        nama, *dim = zip(*data)
+        blok.append((bentuk, fungsi(*dim), nama))
+    return KatalogProfil.dari_tabel(blok)
+
+def katalog_i():
+    """View profil I (WF, H, WB) untuk cek lentur SNI 1729 - slice tanpa salinan dari katalog()"""
+    return katalog().pilih_bentuk(*BENTUK_I)
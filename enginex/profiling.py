@@ -0,0 +1,264 @@
+"""
+Instrumentasi opt-in untuk method publik engine ENGINEX.
+
+Saat tidak aktif, class engine tidak disentuh sama sekali (overhead nol).
+Saat aktif, setiap method publik dibungkus untuk mencatat jumlah panggilan,
+latency (kumulatif + persentil dari reservoir sampel) dan ukuran argumen.
+Sebagian panggilan (tiap N panggilan) dijalankan di bawah cProfile.
+
+Contoh:
+    from enginex import profiling
+    profiling.enable()
+    ...  # jalankan hitungan
+    df = profiling.report()
+    profiling.dump_cprofile("enginex.prof")
+    profiling.disable()
+"""
+import cProfile
+import functools
+import importlib
+import io
+import pstats
+import random
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+import numpy as np
+import pandas as pd
+
+# (module, nama class) engine yang diinstrumentasi secara default
+ENGINE_CLASSES = [
+    ("enginex.sni", "SNI_Concrete_2847"),
+    ("enginex.baja", "SNI_Steel_1729"),
+    ("enginex.bridge", "SNI_Bridge_Loader"),
+    ("enginex.gempa", "SNI_Gempa_1726"),
+    ("enginex.geoteknik", "Geotech_Engine"),
+    ("enginex.pondasi", "Foundation_Engine"),
+    ("enginex.ahsp", "AHSP_Engine"),
+    ("enginex.optimizer", "BeamOptimizer"),
+    ("enginex.bim_importer", "IFC_Parser_Engine"),
+    ("export_enginex", "EnginexExporter"),
+]
+
+def _arg_size(obj):
+    """Estimasi ukuran argumen (bytes) tanpa serialisasi"""
+    if isinstance(obj, np.ndarray):
+        return obj.nbytes
+    if isinstance(obj, (pd.DataFrame, pd.Series)):
+        return int(obj.memory_usage(index=False, deep=False).sum()) if isinstance(obj, pd.DataFrame) \
+            else int(obj.memory_usage(index=False, deep=False))
+    if isinstance(obj, (bytes, bytearray, str)):
+        return len(obj)
+    if isinstance(obj, (list, tuple, dict, set)):
+        return 8 * len(obj)
+    if hasattr(obj, "getbuffer"):  # BytesIO / file upload
+        try:
+            return obj.getbuffer().nbytes
+        except Exception:
+            return 0
+    return sys.getsizeof(obj)
+
+class _MethodStats:
+    __slots__ = ("calls", "total_s", "max_s", "samples", "arg_total", "arg_max")
+
+    def __init__(self):
+        self.calls = 0
+        self.total_s = 0.0
+        self.max_s = 0.0
+        self.samples = []
+        self.arg_total = 0
+        self.arg_max = 0
+
+class EngineProfiler:
+    """
+    sample_every: jalankan 1 dari N panggilan di bawah cProfile (0 = nonaktif)
+    max_samples: ukuran reservoir latency per method untuk hitung persentil
+    """
+    def __init__(self, sample_every=50, max_samples=2048):
+        self.sample_every = sample_every
+        self.max_samples = max_samples
+        self.enabled = False
+        self._originals = []  # (cls, attr, descriptor asli)
+        self._stats = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._cprof = cProfile.Profile()
+        self._call_counter = 0
+        self._rng = random.Random(0)
+
+    # ==========================================
+    # 1. AKTIF / NONAKTIF
+    # ==========================================
+    def enable(self, classes=None):
+        """Bungkus method publik semua engine (atau list (module, class) tertentu)"""
+        if self.enabled:
+            return
+        for module_name, cls_name in (classes or ENGINE_CLASSES):
+            try:
+                cls = getattr(importlib.import_module(module_name), cls_name)
+            except (ImportError, AttributeError):
+                continue  # dependency opsional (mis. ifcopenshell) belum terinstall
+            self._instrument_class(cls)
+        self.enabled = True
+
+    def disable(self):
+        """Kembalikan method asli; data statistik tetap disimpan sampai reset()"""
+        for cls, attr, original in reversed(self._originals):
+            setattr(cls, attr, original)
+        self._originals = []
+        self.enabled = False
+
+    def reset(self):
+        with self._lock:
+            self._stats = {}
+            self._cprof = cProfile.Profile()
+            self._call_counter = 0
+
+    @contextmanager
+    def aktif(self, classes=None):
+        self.enable(classes)
+        try:
+            yield self
+        finally:
+            self.disable()
+
+    # ==========================================
+    # 2. WRAPPER
+    # ==========================================
+    def _instrument_class(self, cls):
+        for attr, member in list(cls.__dict__.items()):
+            if attr.startswith("_"):
+                continue
+            if isinstance(member, staticmethod):
+                wrapped = staticmethod(self._wrap(cls.__name__, attr, member.__func__))
+            elif isinstance(member, classmethod):
+                wrapped = classmethod(self._wrap(cls.__name__, attr, member.__func__))
+            elif callable(member):
+                wrapped = self._wrap(cls.__name__, attr, member)
+            else:
+                continue
+            self._originals.append((cls, attr, member))
+            setattr(cls, attr, wrapped)
+
+    def _wrap(self, cls_name, meth_name, func):
+        key = (cls_name, meth_name)
+        profiler = self
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            # Panggilan bersarang (engine memanggil engine) tidak ikut di-cProfile ulang
+            nested = getattr(profiler._local, "depth", 0)
+            profiler._local.depth = nested + 1
+            use_cprof = False
+            if profiler.sample_every and nested == 0:
+                with profiler._lock:
+                    profiler._call_counter += 1
+                    use_cprof = profiler._call_counter % profiler.sample_every == 0
+
+            t0 = time.perf_counter()
+            try:
+                if use_cprof:
+                    try:
+                        profiler._cprof.enable()
+                    except ValueError:
+                        use_cprof = False  # profiler lain sedang aktif
+                return func(*args, **kwargs)
+            finally:
+                if use_cprof:
+                    profiler._cprof.disable()
+                dt = time.perf_counter() - t0
+                profiler._local.depth = nested
+                size = sum(_arg_size(a) for a in args[1:] if not isinstance(a, type)) \
+                    + sum(_arg_size(v) for v in kwargs.values())
+                profiler._record(key, dt, size)
+        return wrapper
+
+    def _record(self, key, dt, size):
+        with self._lock:
+            st = self._stats.get(key)
+            if st is None:
+                st = self._stats[key] = _MethodStats()
+            st.calls += 1
+            st.total_s += dt
+            if dt > st.max_s: st.max_s = dt
+            st.arg_total += size
+            if size > st.arg_max: st.arg_max = size
+            # Reservoir sampling: persentil tetap representatif tanpa simpan semua data
+            if len(st.samples) < self.max_samples:
+                st.samples.append(dt)
+            else:
+                j = self._rng.randrange(st.calls)
+                if j < self.max_samples:
+                    st.samples[j] = dt
+
+    # ==========================================
+    # 3. LAPORAN
+    # ==========================================
+    def report(self):
+        """DataFrame statistik per method, diurutkan dari total waktu terbesar (hot path)"""
+        rows = []
+        with self._lock:
+            items = list(self._stats.items())
+        for (cls_name, meth_name), st in items:
+            s = np.asarray(st.samples) * 1000
+            rows.append({
+                "Engine": cls_name,
+                "Method": meth_name,
+                "Calls": st.calls,
+                "Total (ms)": st.total_s * 1000,
+                "Mean (ms)": st.total_s * 1000 / st.calls,
+                "p50 (ms)": float(np.percentile(s, 50)),
+                "p95 (ms)": float(np.percentile(s, 95)),
+                "p99 (ms)": float(np.percentile(s, 99)),
+                "Max (ms)": st.max_s * 1000,
+                "Arg Mean (B)": st.arg_total / st.calls,
+                "Arg Max (B)": st.arg_max,
+            })
+        if not rows:
+            return pd.DataFrame()
+        df = pd.DataFrame(rows).sort_values("Total (ms)", ascending=False).reset_index(drop=True)
+        df["Share (%)"] = 100 * df["Total (ms)"] / df["Total (ms)"].sum()
+        return df.round(4)
+
+    def cprofile_text(self, sort="cumulative", limit=30):
+        """Ringkasan teks pstats dari panggilan yang tersampel"""
+        buf = io.StringIO()
+        try:
+            pstats.Stats(self._cprof, stream=buf).sort_stats(sort).print_stats(limit)
+        except TypeError:
+            return "Belum ada sampel cProfile."
+        return buf.getvalue()
+
+    def dump_cprofile(self, path=None):
+        """
+        Simpan sampel cProfile (format .prof, bisa dibuka snakeviz/pstats).
+        Tanpa path: kembalikan bytes (untuk tombol download).
+        """
+        self._cprof.create_stats()
+        if path:
+            self._cprof.dump_stats(path)
+            return path
+        import marshal
+        return marshal.dumps(self._cprof.stats)
+
+# Profiler global (satu per proses)
+profiler = EngineProfiler()
+
+def enable(classes=None, sample_every=None):
+    if sample_every is not None:
+        profiler.sample_every = sample_every
+    profiler.enable(classes)
+
+def disable():
+    profiler.disable()
+
+def reset():
+    profiler.reset()
+
+def report():
+    return profiler.report()
+
+def dump_cprofile(path=None):
+    return profiler.dump_cprofile(path)
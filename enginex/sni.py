@@ -0,0 +1,543 @@
+import math
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+class SNI_Concrete_2847:
+    """
+    Engine perhitungan Struktur Beton Bertulang berdasarkan SNI 2847:2019
+    srpmk=True: balok Sistem Rangka Pemikul Momen Khusus (rho & rho' masing-masing maks 0.025)
+    """
+    Es = 200000.0 # MPa
+    eps_cu = 0.003 # Regangan batas beton
+    eps_t_min = 0.004 # Regangan tarik minimum balok non-prategang (SNI 2847 Pasal 9.3.3.1)
+    rho_max_srpmk = 0.025 # Batas rasio tulangan balok SRPMK (SNI 2847 Pasal 18.6.3.1)
+    rho_max_total = 0.04 # Batas praktis (As + As') / (b d) semua balok: kongesti & pengecoran
+
+    def __init__(self, fc, fy, srpmk=False):
+        self.fc = fc # MPa
+        self.fy = fy # MPa
+        # Batas per sisi hanya SRPMK; balok biasa dibatasi rho_max_total & eps_t >= 0.004 (Pasal 9.3.3.1)
+        self.rho_max = self.rho_max_srpmk if srpmk else math.inf
+        self.beta1 = 0.85 if fc <= 28 else max(0.85 - 0.05 * (fc - 28) / 7, 0.65)
+        self.eps_ty = fy / self.Es
+
+    # ==========================================
+    # INTI PERHITUNGAN (ARRAY) - dipakai versi skalar & batch
+    # ==========================================
+    def _phi_lentur(self, eps_t):
+        """Faktor reduksi berbasis regangan tarik (SNI 2847 Tabel 21.2.2, sengkang biasa)"""
+        return np.clip(0.65 + 0.25 * (eps_t - self.eps_ty) / 0.003, 0.65, 0.9)
+
+    def _mn_blok(self, b, d, c):
+        """Momen nominal blok tekan beton (Nmm) untuk garis netral c"""
+        a = self.beta1 * c
+        return 0.85 * self.fc * b * a * (d - a / 2)
+
+    def _kapasitas(self, b, d, As):
+        """
+        Kompatibilitas regangan tulangan tunggal.
+        Return (c, eps_t, phi, Mn) - Mn dalam Nmm.
+        """
+        k = 0.85 * self.fc * self.beta1 * b
+        c = As * self.fy / k
+        with np.errstate(divide='ignore', invalid='ignore'):
+            eps_t = self.eps_cu * (d - c) / c
+            # Tulangan belum leleh (terkendali tekan): fs = Es*eps_s -> persamaan kuadrat c
+            belum_leleh = eps_t < self.eps_ty
+            if np.any(belum_leleh):
+                B = As * self.Es * self.eps_cu
+                c_el = (-B + np.sqrt(B * B + 4 * k * B * d)) / (2 * k)
+                c = np.where(belum_leleh, c_el, c)
+                eps_t = self.eps_cu * (d - c) / c
+        Mn = self._mn_blok(b, d, c)
+        return c, eps_t, self._phi_lentur(eps_t), Mn
+
+    def _desain(self, Mu_kNm, b, d, d_tekan):
+        """
+        Desain lentur eksak blok tegangan persegi (array).
+        1. Tulangan tunggal terkendali tarik (phi=0.9): solusi kuadrat a
+        2. Tulangan tunggal zona transisi (eps_t >= 0.004): bisection garis netral c
+        3. Tulangan rangkap: blok tekan dikunci di batas terkendali tarik
+        Return dict array (As, As_tekan dalam mm2; NaN jika penampang tidak mampu)
+        """
+        shape = np.broadcast(Mu_kNm, b, d, d_tekan).shape
+        Mu_kNm, b, d, d_tekan = (np.broadcast_to(v, shape).ravel() for v in (Mu_kNm, b, d, d_tekan))
+
+        Mu = Mu_kNm * 1e6 # Nmm
+        k = 0.85 * self.fc * self.beta1 * b
+        c_tc = self.eps_cu * d / (self.eps_cu + self.eps_ty + 0.003)
+        c_max = self.eps_cu * d / (self.eps_cu + self.eps_t_min)
+
+        # 1. Terkendali tarik: 0.85 fc b a (d - a/2) = Mu / 0.9
+        with np.errstate(invalid='ignore'):
+            a = d - np.sqrt(d * d - 2 * Mu / (0.9 * 0.85 * self.fc * b))
+        c = a / self.beta1
+        tunggal = np.isfinite(c) & (c <= c_tc)
+
+        # 2. Zona transisi: phi(c) * Mn(c) = Mu, c di antara c_tc dan c_max
+        def phi_mn(cc):
+            return self._phi_lentur(self.eps_cu * (d - cc) / cc) * self._mn_blok(b, d, cc)
+
+        transisi = ~tunggal & (phi_mn(c_max) >= Mu)
+        if np.any(transisi):
+            # Bisection hanya pada elemen zona transisi (sedikit elemen: versi skalar lebih cepat)
+            idx = np.nonzero(transisi)[0]
+            if idx.size <= 16:
+                for i in idx:
+                    c[i] = self._bisection_c(float(b[i]), float(d[i]), float(Mu[i]), float(c_tc[i]), float(c_max[i]))
+            else:
+                bb, dd, MM = b[idx], d[idx], Mu[idx]
+                lo, hi = c_tc[idx], c_max[idx]
+                for _ in range(50):
+                    mid = (lo + hi) / 2
+                    eps = self.eps_cu * (dd - mid) / mid
+                    kurang = self._phi_lentur(eps) * self._mn_blok(bb, dd, mid) < MM
+                    lo = np.where(kurang, mid, lo)
+                    hi = np.where(kurang, hi, mid)
+                c[idx] = hi
+
+        As = k * c / self.fy
+        with np.errstate(divide='ignore', invalid='ignore'):
+            eps_t = self.eps_cu * (d - c) / c
+        phi = self._phi_lentur(eps_t)
+        As_tekan = np.zeros_like(As)
+
+        # 3. Tulangan rangkap: sisa momen dipikul kopel tulangan tekan - tulangan tarik tambahan
+        rangkap = ~tunggal & ~transisi
+        if np.any(rangkap):
+            Mn2 = Mu / 0.9 - self._mn_blok(b, d, c_tc)
+            fs_tekan = np.minimum(self.Es * self.eps_cu * (c_tc - d_tekan) / c_tc, self.fy)
+            lengan = d - d_tekan
+            with np.errstate(divide='ignore', invalid='ignore'):
+                As_t = np.where(fs_tekan > 0.85 * self.fc, Mn2 / ((fs_tekan - 0.85 * self.fc) * lengan), np.nan)
+            As = np.where(rangkap, k * c_tc / self.fy + Mn2 / (self.fy * lengan), As)
+            As_tekan = np.where(rangkap, As_t, As_tekan)
+            c = np.where(rangkap, c_tc, c)
+            eps_t = np.where(rangkap, self.eps_ty + 0.003, eps_t)
+            phi = np.where(rangkap, 0.9, phi)
+
+        # Melebihi batas rasio tulangan -> penampang tidak cukup (perbesar dimensi)
+        batas_sisi = self.rho_max * b * d
+        tidak_mampu = (np.isnan(As_tekan) | (As + As_tekan > self.rho_max_total * b * d)
+                       | (As > batas_sisi) | (As_tekan > batas_sisi))
+        As = np.where(tidak_mampu, np.nan, As)
+        As_tekan = np.where(tidak_mampu, np.nan, As_tekan)
+
+        # Tulangan minimum (SNI 2847 Pasal 9.6.1.2)
+        As_min = np.maximum(0.25 * np.sqrt(self.fc) / self.fy, 1.4 / self.fy) * b * d
+        As = np.maximum(As, As_min)
+
+        hasil = {
+            "As": As, "As_tekan": As_tekan, "c": c, "a": self.beta1 * c,
+            "eps_t": eps_t, "phi": phi, "rangkap": rangkap
+        }
+        return {key: val.reshape(shape) for key, val in hasil.items()}
+
+    # Versi skalar (math murni) dari _kapasitas & _desain: urutan operasi sama persis
+    # dengan versi array sehingga hasil identik, tanpa overhead NumPy per panggilan.
+    def _kapasitas_skalar(self, b, d, As):
+        k = 0.85 * self.fc * self.beta1 * b
+        c = As * self.fy / k
+        eps_t = self.eps_cu * (d - c) / c if c > 0 else math.inf
+        if eps_t < self.eps_ty:
+            B = As * self.Es * self.eps_cu
+            c = (-B + math.sqrt(B * B + 4 * k * B * d)) / (2 * k)
+            eps_t = self.eps_cu * (d - c) / c
+        phi = min(max(0.65 + 0.25 * (eps_t - self.eps_ty) / 0.003, 0.65), 0.9)
+        return c, eps_t, phi, self._mn_blok(b, d, c)
+
+    def _phi_mn_skalar(self, b, d, c):
+        eps = self.eps_cu * (d - c) / c
+        return min(max(0.65 + 0.25 * (eps - self.eps_ty) / 0.003, 0.65), 0.9) * self._mn_blok(b, d, c)
+
+    def _bisection_c(self, b, d, Mu, lo, hi):
+        """Garis netral c pada zona transisi: phi(c) * Mn(c) = Mu (Nmm)"""
+        for _ in range(50):
+            mid = (lo + hi) / 2
+            if self._phi_mn_skalar(b, d, mid) < Mu: lo = mid
+            else: hi = mid
+        return hi
+
+    def _desain_skalar(self, Mu_kNm, b, d, d_tekan):
+        Mu = Mu_kNm * 1e6
+        k = 0.85 * self.fc * self.beta1 * b
+        c_tc = self.eps_cu * d / (self.eps_cu + self.eps_ty + 0.003)
+        c_max = self.eps_cu * d / (self.eps_cu + self.eps_t_min)
+
+        disc = d * d - 2 * Mu / (0.9 * 0.85 * self.fc * b)
+        c = (d - math.sqrt(disc)) / self.beta1 if disc >= 0 else math.nan
+        tunggal = c <= c_tc
+        transisi = not tunggal and self._phi_mn_skalar(b, d, c_max) >= Mu
+        rangkap = not tunggal and not transisi
+        if transisi:
+            c = self._bisection_c(b, d, Mu, c_tc, c_max)
+
+        As_tekan = 0.0
+        if rangkap:
+            Mn2 = Mu / 0.9 - self._mn_blok(b, d, c_tc)
+            fs_tekan = min(self.Es * self.eps_cu * (c_tc - d_tekan) / c_tc, self.fy)
+            lengan = d - d_tekan
+            As_tekan = Mn2 / ((fs_tekan - 0.85 * self.fc) * lengan) if fs_tekan > 0.85 * self.fc else math.nan
+            As = k * c_tc / self.fy + Mn2 / (self.fy * lengan)
+            c = c_tc
+            eps_t = self.eps_ty + 0.003
+            phi = 0.9
+        else:
+            As = k * c / self.fy
+            eps_t = self.eps_cu * (d - c) / c if c > 0 else math.inf
+            phi = min(max(0.65 + 0.25 * (eps_t - self.eps_ty) / 0.003, 0.65), 0.9)
+
+        batas_sisi = self.rho_max * b * d
+        if (math.isnan(As_tekan) or As + As_tekan > self.rho_max_total * b * d
+                or As > batas_sisi or As_tekan > batas_sisi):
+            As = As_tekan = math.nan
+
+        As_min = max(0.25 * math.sqrt(self.fc) / self.fy, 1.4 / self.fy) * b * d
+        if not math.isnan(As):
+            As = max(As, As_min)
+
+        return {
+            "As": As, "As_tekan": As_tekan, "c": c, "a": self.beta1 * c,
+            "eps_t": eps_t, "phi": phi, "rangkap": rangkap
+        }
+
+    # ==========================================
+    # API SKALAR
+    # ==========================================
+    def hitung_momen_nominal(self, b, h, As, ds):
+        """
+        Menghitung Kapasitas Momen (Phi Mn) balok persegi tulangan tunggal.
+        b, h, ds dalam mm. As dalam mm2.
+        Phi berdasarkan regangan tarik (SNI 2847 Tabel 21.2.2).
+        Output: Phi_Mn (kNm)
+        """
+        _, _, phi, Mn = self._kapasitas_skalar(b, h - ds, As)
+        return (phi * Mn) / 1e6 # Convert ke kNm
+
+    def kebutuhan_tulangan(self, Mu_kNm, b, h, ds):
+        """
+        Desain Tulangan Perlu (As_req, mm2) tulangan tunggal berdasarkan Mu.
+        Raise ValueError jika penampang butuh tulangan rangkap (pakai desain_lentur) atau melebihi
+        batas rasio tulangan; versi batch mengembalikan NaN untuk kasus yang sama.
+        """
+        res = self._desain_skalar(Mu_kNm, b, h - ds, ds)
+        if res['rangkap']:
+            raise ValueError(f"Balok {b}x{h} butuh tulangan rangkap untuk Mu={Mu_kNm} kNm")
+        if math.isnan(res['As']):
+            raise ValueError(f"PENAMPANG TIDAK CUKUP: balok {b}x{h} melebihi rasio tulangan maksimum untuk Mu={Mu_kNm} kNm")
+        return res['As']
+
+    def desain_lentur(self, Mu_kNm, b, h, ds, ds_tekan=None):
+        """
+        Desain lentur lengkap (tunggal/rangkap).
+        ds_tekan: jarak pusat tulangan tekan ke serat tekan (default = ds).
+        Output: dict As, As_tekan (mm2), a, c (mm), eps_t, phi, Rho (%), Tipe
+        """
+        res = self._desain_skalar(Mu_kNm, b, h - ds, ds if ds_tekan is None else ds_tekan)
+        if math.isnan(res['As']):
+            raise ValueError(f"PENAMPANG TIDAK CUKUP: balok {b}x{h} tidak mampu memikul Mu={Mu_kNm} kNm "
+                             f"(rasio tulangan > batas, perbesar dimensi)")
+        return {
+            "As": res['As'],
+            "As_tekan": res['As_tekan'],
+            "a": res['a'],
+            "c": res['c'],
+            "eps_t": res['eps_t'],
+            "phi": res['phi'],
+            "Rho (%)": res['As'] / (b * (h - ds)) * 100,
+            "Tipe": "Tulangan Rangkap" if res['rangkap'] else "Tulangan Tunggal"
+        }
+
+    # ==========================================
+    # BATCH (VEKTOR) - ribuan balok sekaligus
+    # ==========================================
+    def hitung_momen_nominal_batch(self, b, h, As, ds):
+        """
+        Versi array dari hitung_momen_nominal (broadcasting NumPy).
+        b, h, ds (mm), As (mm2): scalar atau array. Output: array Phi_Mn (kNm)
+        """
+        b, h, As, ds = (np.asarray(v, dtype=float) for v in (b, h, As, ds))
+        _, _, phi, Mn = self._kapasitas(b, h - ds, As)
+        return (phi * Mn) / 1e6
+
+    def kebutuhan_tulangan_batch(self, Mu_kNm, b, h, ds):
+        """
+        Versi array dari kebutuhan_tulangan (broadcasting NumPy).
+        Output: array As_req (mm2); NaN untuk balok yang butuh tulangan rangkap
+        (versi skalar raise ValueError, di sini satu balok tidak menggagalkan seluruh batch).
+        """
+        Mu_kNm, b, h, ds = (np.asarray(v, dtype=float) for v in (Mu_kNm, b, h, ds))
+        res = self._desain(Mu_kNm, b, h - ds, ds)
+        return np.where(res['rangkap'], np.nan, res['As'])
+
+    def desain_lentur_batch(self, Mu_kNm, b, h, ds, ds_tekan=None):
+        """
+        Versi array dari desain_lentur. Output: DataFrame As, As_tekan, a, c, eps_t, phi, Rho (%), Rangkap
+        (As NaN jika penampang tidak mampu walau dengan tulangan rangkap; versi skalar raise ValueError)
+        """
+        Mu_kNm, b, h, ds = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (Mu_kNm, b, h, ds)))
+        d_tekan = ds if ds_tekan is None else np.asarray(ds_tekan, dtype=float)
+        res = self._desain(Mu_kNm, b, h - ds, d_tekan)
+        return pd.DataFrame({
+            'As': res['As'], 'As_tekan': res['As_tekan'], 'a': res['a'], 'c': res['c'],
+            'eps_t': res['eps_t'], 'phi': res['phi'],
+            'Rho (%)': res['As'] / (b * (h - ds)) * 100, 'Rangkap': res['rangkap']
+        })
+
+    def cek_balok_batch(self, data=None, b=None, h=None, ds=None, As=None, Mu_kNm=None):
+        """
+        Cek/desain banyak balok sekaligus (mis. hasil import IFC).
+        data: DataFrame dengan kolom b, h, ds, Mu (kNm) dan opsional As (mm2),
+              atau isi argumen array b, h, ds, Mu_kNm, As secara langsung.
+        Jika As tidak diberikan, kapasitas dihitung dari As_req (mode desain).
+        Output: DataFrame kolom b, h, ds, Mu, As, As_req, As_tekan_req, Phi_Mn, Rho (%), eps_t, Ratio, Aman
+        """
+        if data is not None:
+            b, h, ds = data['b'], data['h'], data['ds']
+            Mu_kNm = data['Mu']
+            As = data['As'] if 'As' in data else None
+
+        b, h, ds, Mu_kNm = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (b, h, ds, Mu_kNm)))
+        d = h - ds
+        res = self._desain(Mu_kNm, b, d, ds)
+        As_req = res['As']
+        As_min = np.maximum(0.25 * np.sqrt(self.fc) / self.fy, 1.4 / self.fy) * b * d
+
+        if As is None:
+            # Mode desain: balok tulangan rangkap dirancang tepat phi*Mn = Mu
+            As_pakai = As_req
+            _, _, phi, Mn = self._kapasitas(b, d, As_pakai)
+            phi_Mn = np.where(res['rangkap'], Mu_kNm, phi * Mn / 1e6)
+            phi_Mn = np.where(np.isnan(As_req), np.nan, phi_Mn)
+            eps_t = res['eps_t']
+            aman = np.isfinite(As_req)
+        else:
+            As_pakai = np.broadcast_to(np.asarray(As, dtype=float), As_req.shape)
+            _, eps_t, phi, Mn = self._kapasitas(b, d, As_pakai)
+            phi_Mn = phi * Mn / 1e6
+            aman = (phi_Mn >= Mu_kNm) & (eps_t >= self.eps_t_min) & (As_pakai >= As_min)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ratio = np.where(phi_Mn > 0, Mu_kNm / phi_Mn, 99.0)
+
+        index = data.index if isinstance(data, pd.DataFrame) else None
+        return pd.DataFrame({
+            'b': b, 'h': h, 'ds': ds, 'Mu': Mu_kNm, 'As': As_pakai,
+            'As_req': As_req, 'As_tekan_req': res['As_tekan'], 'Phi_Mn': phi_Mn,
+            'Rho (%)': As_pakai / (b * d) * 100, 'eps_t': eps_t, 'Ratio': ratio, 'Aman': aman
+        }, index=index)
+
+# ==========================================
+# KOLOM: DIAGRAM INTERAKSI P-M (SNI 2847:2019)
+# ==========================================
+@lru_cache(maxsize=512)
+def _kurva_interaksi(fc, fy, sengkang, kunci_penampang, sumbu, n_titik):
+    """
+    Sweep kompatibilitas regangan (vektor) atas kedalaman garis netral c.
+    Hasil di-cache per (penampang, tulangan, fc, fy); array read-only.
+    """
+    p = dict(kunci_penampang)
+    Es, eps_cu = 200000.0, 0.003
+    eps_ty = fy / Es
+    beta1 = 0.85 if fc <= 28 else max(0.85 - 0.05 * (fc - 28) / 7, 0.65)
+
+    # Posisi tulangan (kedalaman dari serat tekan) & tinggi penampang arah lentur
+    if p['bentuk'] == 'lingkaran':
+        R = p['D'] / 2
+        tinggi = p['D']
+        r_tul = R - p['ds']
+        sudut = 2 * np.pi * np.arange(p['n']) / p['n']
+        y_tul = R - r_tul * np.cos(sudut)
+        Ag = np.pi * R**2
+    else:
+        lebar, tinggi = (p['b'], p['h']) if sumbu == 'x' else (p['h'], p['b'])
+        n_sejajar, n_tegak = (p['nx'], p['ny']) if sumbu == 'x' else (p['ny'], p['nx'])
+        baris = np.linspace(p['ds'], tinggi - p['ds'], n_tegak)
+        # Baris atas & bawah penuh, baris tengah hanya 2 batang (sisi kiri-kanan)
+        jumlah = np.full(n_tegak, 2.0)
+        jumlah[[0, -1]] = n_sejajar
+        y_tul = np.repeat(baris, jumlah.astype(int))
+        Ag = p['b'] * p['h']
+    As_bar = 0.25 * np.pi * p['dia']**2
+    Ast = As_bar * len(y_tul)
+    d_t = y_tul.max()
+
+    # Sweep c: dari hampir tarik murni sampai tekan penuh (spasi geometrik)
+    c = np.geomspace(0.02 * tinggi, 5.0 * tinggi, n_titik)
+    a = np.minimum(beta1 * c, tinggi)
+
+    # Gaya tekan beton & lengan terhadap pusat penampang
+    if p['bentuk'] == 'lingkaran':
+        theta = np.arccos(np.clip((R - a) / R, -1.0, 1.0))
+        luas = R**2 * (theta - np.sin(theta) * np.cos(theta))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            lengan_c = np.where(luas > 0, (2 / 3) * R**3 * np.sin(theta)**3 / luas, 0.0)
+    else:
+        luas = lebar * a
+        lengan_c = tinggi / 2 - a / 2
+    Cc = 0.85 * fc * luas
+
+    # Tulangan: matriks (n_titik x n_tulangan)
+    eps_s = eps_cu * (c[:, None] - y_tul[None, :]) / c[:, None]
+    fs = np.clip(Es * eps_s, -fy, fy)
+    fs = np.where(y_tul[None, :] < a[:, None], fs - 0.85 * fc, fs) # Beton yang dipindahkan tulangan
+    Fs = fs * As_bar
+    Pn = Cc + Fs.sum(axis=1)
+    Mn = Cc * lengan_c + (Fs * (tinggi / 2 - y_tul[None, :])).sum(axis=1)
+
+    # Titik tarik murni & tekan murni
+    P0 = 0.85 * fc * (Ag - Ast) + fy * Ast
+    Pn = np.concatenate([[-fy * Ast], Pn, [P0]])
+    Mn = np.concatenate([[0.0], Mn, [0.0]])
+    eps_t = np.concatenate([[np.inf], eps_cu * (d_t - c) / c, [-eps_cu]])
+
+    # Faktor reduksi (SNI 2847 Tabel 21.2.2) & batas tekan maksimum (Pasal 22.4.2.1)
+    if sengkang == 'spiral':
+        phi = np.clip(0.75 + 0.15 * (eps_t - eps_ty) / 0.003, 0.75, 0.9)
+        phi_Pmax = 0.85 * 0.75 * P0
+    else:
+        phi = np.clip(0.65 + 0.25 * (eps_t - eps_ty) / 0.003, 0.65, 0.9)
+        phi_Pmax = 0.80 * 0.65 * P0
+
+    phi_Pn = np.minimum(phi * Pn, phi_Pmax)
+    phi_Mn = phi * Mn
+
+    # Kurva desain sebagai fungsi P (naik): titik pada plateau Pmax diwakili M terbesar
+    urut = np.argsort(phi_Pn, kind='stable')
+    P_unik, awal = np.unique(phi_Pn[urut], return_index=True)
+    M_unik = np.maximum.reduceat(phi_Mn[urut], awal)
+
+    hasil = {
+        'Pn': Pn / 1e3, 'Mn': Mn / 1e6, 'phi': phi, 'eps_t': eps_t,
+        'phi_Pn': phi_Pn / 1e3, 'phi_Mn': phi_Mn / 1e6,
+        'P_desain': P_unik / 1e3, 'M_desain': M_unik / 1e6,
+        'phi_P0': (0.75 if sengkang == 'spiral' else 0.65) * P0 / 1e3,
+        'phi_Pmax': phi_Pmax / 1e3, 'Ag': Ag, 'Ast': Ast,
+    }
+    for v in hasil.values():
+        if isinstance(v, np.ndarray):
+            v.flags.writeable = False
+    return hasil
+
+class SNI_Column_2847:
+    """
+    Engine Kolom Beton Bertulang (SNI 2847:2019) - Diagram Interaksi P-M.
+    Satuan: mm, MPa, kN, kNm. Kurva di-cache per penampang & mutu bahan.
+    """
+    def __init__(self, fc, fy, sengkang='ikat'):
+        self.fc = fc # MPa
+        self.fy = fy # MPa
+        self.sengkang = sengkang # 'ikat' atau 'spiral'
+
+    @staticmethod
+    def penampang_persegi(b, h, dia, nx, ny, ds=50):
+        """
+        Kolom persegi b x h (mm). nx = jumlah batang di sisi b (termasuk sudut),
+        ny = jumlah batang di sisi h (termasuk sudut). ds = pusat tulangan ke tepi.
+        """
+        return {'bentuk': 'persegi', 'b': float(b), 'h': float(h), 'dia': float(dia),
+                'nx': int(nx), 'ny': int(ny), 'ds': float(ds)}
+
+    @staticmethod
+    def penampang_lingkaran(D, dia, n, ds=50):
+        """Kolom bulat diameter D (mm) dengan n batang tulangan melingkar"""
+        return {'bentuk': 'lingkaran', 'D': float(D), 'dia': float(dia), 'n': int(n), 'ds': float(ds)}
+
+    def kurva_interaksi(self, penampang, sumbu='x', n_titik=120):
+        """
+        Diagram interaksi P-M (nominal & desain) untuk lentur terhadap sumbu 'x' (tinggi h) atau 'y'.
+        Output: dict array Pn, Mn, phi, phi_Pn, phi_Mn (kN, kNm) + phi_Pmax
+        """
+        if penampang['bentuk'] == 'lingkaran':
+            sumbu = 'x' # simetris
+        return _kurva_interaksi(float(self.fc), float(self.fy), self.sengkang,
+                                tuple(sorted(penampang.items())), sumbu, int(n_titik))
+
+    def _momen_kapasitas(self, kurva, Pu):
+        """phi_Mn pada gaya aksial Pu (interpolasi kurva desain); NaN jika Pu di luar kurva"""
+        return np.interp(Pu, kurva['P_desain'], kurva['M_desain'], left=np.nan, right=np.nan)
+
+    def _aksial_kapasitas(self, kurva, e):
+        """phi_Pn pada eksentrisitas e = M/P (m), cabang tekan kurva"""
+        tekan = (kurva['phi_Pn'] > 0)
+        P, M = kurva['phi_Pn'][tekan], kurva['phi_Mn'][tekan]
+        e_kurva = M / P
+        urut = np.argsort(e_kurva, kind='stable')
+        return np.interp(e, e_kurva[urut], P[urut])
+
+    def cek_kolom_batch(self, penampang, Pu, Mux, Muy=0.0, metode='auto', alpha=1.0):
+        """
+        Cek banyak kombinasi beban (Pu tekan positif, kN; Mux, Muy kNm) sekaligus.
+        Biaksial:
+          - 'kontur'  : Bresler load contour (Mux/phiMnx)^alpha + (Muy/phiMny)^alpha <= 1
+          - 'bresler' : Bresler reciprocal 1/Pi = 1/Pnx + 1/Pny - 1/P0, hanya berlaku untuk
+                        Pu >= 0.1 fc Ag; baris aksial kecil / tarik otomatis memakai kontur
+          - 'auto'    : sama dengan 'bresler' (reciprocal untuk aksial besar, kontur untuk sisanya)
+        Baris dengan satu momen saja dicek langsung terhadap kurva (Metode 'Uniaksial').
+        Output: DataFrame Pu, Mux, Muy, Phi_Mnx, Phi_Mny, Metode, Ratio, Aman
+        """
+        Pu, Mux, Muy = np.broadcast_arrays(np.asarray(Pu, dtype=float),
+                                           np.abs(np.asarray(Mux, dtype=float)),
+                                           np.abs(np.asarray(Muy, dtype=float)))
+        kx = self.kurva_interaksi(penampang, 'x')
+        ky = self.kurva_interaksi(penampang, 'y')
+
+        Mx_cap = self._momen_kapasitas(kx, Pu)
+        My_cap = self._momen_kapasitas(ky, Pu)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ratio_kontur = (np.where(Mux > 0, Mux / Mx_cap, 0.0) ** alpha
+                            + np.where(Muy > 0, Muy / My_cap, 0.0) ** alpha)
+
+            # Reciprocal load (Bresler): kapasitas aksial pada eksentrisitas masing-masing sumbu
+            Px = self._aksial_kapasitas(kx, np.where(Pu > 0, Mux / Pu, np.inf))
+            Py = self._aksial_kapasitas(ky, np.where(Pu > 0, Muy / Pu, np.inf))
+            Pi = 1.0 / (1.0 / Px + 1.0 / Py - 1.0 / kx['phi_P0'])
+            ratio_bresler = np.where((Pu > 0) & (Pi > 0), Pu / Pi, np.inf)
+
+        biaksial = (Mux > 0) & (Muy > 0)
+        aksial_besar = Pu >= 0.1 * self.fc * kx['Ag'] / 1e3
+        # Reciprocal tidak valid untuk aksial kecil / tarik (e -> tak hingga memberi rasio negatif)
+        if metode == 'kontur':
+            pakai_bresler = np.zeros_like(biaksial)
+        else:
+            pakai_bresler = biaksial & aksial_besar
+
+        ratio = np.where(pakai_bresler, ratio_bresler, ratio_kontur)
+        ratio = np.where(Pu > kx['phi_Pmax'], np.inf, ratio) # Melebihi batas tekan maksimum
+        ratio = np.where(np.isnan(ratio), np.inf, ratio) # Di luar kurva (tarik berlebih)
+
+        return pd.DataFrame({
+            'Pu': Pu, 'Mux': Mux, 'Muy': Muy,
+            'Phi_Mnx': Mx_cap, 'Phi_Mny': My_cap,
+            'Metode': np.where(pakai_bresler, 'Bresler Reciprocal',
+                               np.where(biaksial, 'Load Contour', 'Uniaksial')),
+            'Ratio': ratio, 'Aman': ratio <= 1.0
+        })
+
+    def cek_kolom(self, penampang, Pu, Mux, Muy=0.0, metode='auto', alpha=1.0):
+        """Versi skalar cek_kolom_batch. Output: dict"""
+        row = self.cek_kolom_batch(penampang, [Pu], [Mux], [Muy], metode, alpha).iloc[0]
+        return {
+            "Phi_Mnx": float(row['Phi_Mnx']),
+            "Phi_Mny": float(row['Phi_Mny']),
+            "Metode": row['Metode'],
+            "Ratio": float(row['Ratio']),
+            "Status": "AMAN" if row['Aman'] else "TIDAK AMAN"
+        }
+
+class SNI_Load_1727:
+    """
+    Kombinasi Pembebanan SNI 1727:2020
+    """
+    @staticmethod
+    def komb_pembebanan(D, L):
+        """
+        Mengembalikan Envelope beban terbesar (kNm atau kN)
+        K1: 1.4D
+        K2: 1.2D + 1.6L
+        """
+        k1 = 1.4 * D
+        k2 = 1.2 * D + 1.6 * L
+        return max(k1, k2)
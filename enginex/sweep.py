@@ -0,0 +1,191 @@
+"""
+Sweep parametrik ENGINEX: jalankan satu method engine untuk seluruh kombinasi
+(produk Kartesius) grid parameter, dibagi per chunk ke process pool.
+
+    from enginex.geoteknik import Geotech_Engine
+    from enginex import sweep
+
+    df = sweep.jalankan_sweep(
+        Geotech_Engine.hitung_talud_batu_kali,
+        grid={"gamma_tanah": [17, 18, 19], "phi": range(20, 41),
+              "H": np.arange(1, 6, 0.1), "b_bawah": [1.5, 2.0, 2.5]},
+        fixed={"c": 5.0, "b_atas": 0.4},
+        berhenti=lambda df: (df["Status"] == "AMAN").sum() > 1000,  # df = semua chunk selesai
+    )
+
+Method tanpa instance (Kelas.method): parameter grid/fixed yang cocok dengan
+__init__ kelas dipakai untuk membuat engine (satu instance per kombinasi, di-cache
+LRU terbatas di tiap worker), sisanya diteruskan ke method. Bound method & fungsi biasa
+dipanggil langsung. Kombinasi tidak pernah dimaterialisasi: tiap chunk hanya
+membawa rentang indeks, worker men-decode indeks -> parameter.
+"""
+import importlib
+import inspect
+import os
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+import numpy as np
+import pandas as pd
+
+# Di bawah ukuran ini sweep dijalankan di proses utama (overhead pool tidak sepadan)
+MIN_POOL = 2000
+# Jumlah instance engine maksimum yang di-cache per proses (LRU)
+MAKS_ENGINE_CACHE = 128
+
+# ==========================================
+# 1. RESOLUSI TARGET
+# ==========================================
+def _spec_target(target):
+    """
+    Ubah target menjadi spesifikasi yang bisa di-pickle.
+    ('kelas', module, nama_kelas, nama_method) untuk Kelas.method, ('fungsi', callable) selain itu.
+    """
+    if inspect.isfunction(target) and "." in target.__qualname__:
+        nama_kelas, _, nama_method = target.__qualname__.rpartition(".")
+        module = importlib.import_module(target.__module__)
+        cls = getattr(module, nama_kelas, None)
+        if inspect.isclass(cls) and list(inspect.signature(target).parameters)[:1] == ["self"]:
+            return ("kelas", target.__module__, nama_kelas, nama_method)
+    return ("fungsi", target)
+
+def _parameter_init(spec):
+    if spec[0] != "kelas":
+        return set()
+    cls = getattr(importlib.import_module(spec[1]), spec[2])
+    return {p for p in inspect.signature(cls.__init__).parameters if p != "self"}
+
+# ==========================================
+# 2. WORKER
+# ==========================================
+_ENGINE_CACHE = OrderedDict()
+
+def _panggil(spec, init_keys, kwargs):
+    if spec[0] == "fungsi":
+        return spec[1](**kwargs)
+    init = {k: kwargs.pop(k) for k in init_keys if k in kwargs}
+    key = (spec[1], spec[2], tuple(sorted(init.items())))
+    engine = _ENGINE_CACHE.get(key)
+    if engine is None:
+        cls = getattr(importlib.import_module(spec[1]), spec[2])
+        engine = _ENGINE_CACHE[key] = cls(**init)
+        if len(_ENGINE_CACHE) > MAKS_ENGINE_CACHE:
+            _ENGINE_CACHE.popitem(last=False)
+    else:
+        _ENGINE_CACHE.move_to_end(key)
+    return getattr(engine, spec[3])(**kwargs)
+
+def _ratakan(hasil):
+    """Hasil engine -> dict kolom (dict apa adanya, tuple -> hasil_i, skalar -> hasil)"""
+    if isinstance(hasil, dict):
+        return hasil
+    if isinstance(hasil, (tuple, list)):
+        return {f"hasil_{i}": v for i, v in enumerate(hasil)}
+    return {"hasil": hasil}
+
+def _jalankan_chunk(spec, init_keys, nama, nilai, fixed, mulai, selesai):
+    """Evaluasi indeks [mulai, selesai) dari produk Kartesius; return DataFrame chunk"""
+    shape = tuple(len(v) for v in nilai)
+    idx = np.arange(mulai, selesai)
+    posisi = np.unravel_index(idx, shape) if shape else ()
+    rows = []
+    for r, i in enumerate(idx.tolist()):
+        params = {n: v[p[r]] for n, v, p in zip(nama, nilai, posisi)}
+        row = {"_idx": i, **params}
+        try:
+            row.update(_ratakan(_panggil(spec, init_keys, {**fixed, **params})))
+        except Exception as e:
+            row["error"] = f"{type(e).__name__}: {e}"
+        rows.append(row)
+    return pd.DataFrame(rows)
+
+# ==========================================
+# 3. API
+# ==========================================
+def _siapkan(target, grid, fixed):
+    nama = list(grid)
+    nilai = []
+    for n in nama:
+        v = grid[n]
+        # Ubah ke list skalar Python (np.float64 -> float) agar hasil & cache engine konsisten
+        v = np.asarray(v).tolist() if isinstance(v, np.ndarray) else list(v)
+        if not v:
+            raise ValueError(f"Grid '{n}' kosong")
+        nilai.append(v)
+    spec = _spec_target(target)
+    return spec, _parameter_init(spec), nama, nilai, dict(fixed or {})
+
+def _total(nilai):
+    return int(np.prod([len(v) for v in nilai])) if nilai else 1
+
+def iter_sweep(target, grid, fixed=None, workers=None, chunk=None, berhenti=None):
+    """
+    Generator DataFrame per chunk (urutan selesai, bukan urutan indeks).
+    berhenti: callable(df) -> bool, df = gabungan SEMUA chunk yang sudah selesai (kumulatif);
+              jika True, chunk yang belum jalan dibatalkan.
+    """
+    yield from _iter_chunk(*_siapkan(target, grid, fixed), workers, chunk, berhenti)
+
+def _iter_chunk(spec, init_keys, nama, nilai, fixed, workers, chunk, berhenti):
+    total = _total(nilai)
+    workers = workers or os.cpu_count() or 1
+    chunk = chunk or max(100, min(20000, total // (workers * 8) or 1))
+    rentang = [(s, min(s + chunk, total)) for s in range(0, total, chunk)]
+    selesai_semua = []
+
+    def cek_berhenti(df):
+        if berhenti is None:
+            return False
+        selesai_semua.append(df)
+        return bool(berhenti(pd.concat(selesai_semua, ignore_index=True)))
+
+    if workers == 1 or total < MIN_POOL:
+        try:
+            for s, e in rentang:
+                df = _jalankan_chunk(spec, init_keys, nama, nilai, fixed, s, e)
+                yield df
+                if cek_berhenti(df):
+                    return
+        finally:
+            _ENGINE_CACHE.clear() # Engine sweep ini tidak dipakai lagi di proses utama
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        antrian = iter(rentang)
+        jalan = set()
+        # Jendela terbatas: hanya ~2 chunk per worker yang di-submit sekaligus
+        for s, e in antrian:
+            jalan.add(pool.submit(_jalankan_chunk, spec, init_keys, nama, nilai, fixed, s, e))
+            if len(jalan) >= 2 * workers:
+                break
+        while jalan:
+            selesai, jalan = wait(jalan, return_when=FIRST_COMPLETED)
+            for fut in selesai:
+                df = fut.result()
+                yield df
+                if cek_berhenti(df):
+                    for f in jalan:
+                        f.cancel()
+                    return
+                nxt = next(antrian, None)
+                if nxt is not None:
+                    jalan.add(pool.submit(_jalankan_chunk, spec, init_keys, nama, nilai, fixed, *nxt))
+
+def jalankan_sweep(target, grid, fixed=None, workers=None, chunk=None, berhenti=None, progress=None):
+    """
+    Sweep lengkap -> satu DataFrame urut indeks kombinasi.
+    Kolom: parameter grid + output method (kolom 'error' untuk kombinasi yang gagal).
+    progress: callable(n_selesai, n_total) opsional, dipanggil tiap chunk selesai.
+    """
+    siap = _siapkan(target, grid, fixed)
+    total = _total(siap[3])
+    bagian = []
+    n = 0
+    for df in _iter_chunk(*siap, workers, chunk, berhenti):
+        bagian.append(df)
+        n += len(df)
+        if progress is not None:
+            progress(n, total)
+    if not bagian:
+        return pd.DataFrame(columns=list(grid))
+    return pd.concat(bagian, ignore_index=True).sort_values("_idx").drop(columns="_idx").reset_index(drop=True)
@@ -0,0 +1,126 @@
+import io
+import hashlib
+from collections import OrderedDict
+
+from PIL import Image, ImageOps
+
+class EnginexImagePipeline:
+    """
+    Pre-processing foto lapangan & gambar kerja sebelum dikirim ke model AI:
+    1. Auto-orient (EXIF) agar foto HP tidak miring
+    2. Downscale ke sisi terpanjang maksimum (max_edge)
+    3. Re-encode ke format efisien (WEBP, fallback JPEG)
+    4. Tiling gambar kerja berukuran besar menjadi potongan yang masih terbaca
+    Hasil di-cache berdasarkan hash isi file + parameter.
+    """
+    def __init__(self, max_edge=1536, quality=80, tile_size=1536, max_tiles=6, cache_size=64):
+        self.max_edge = max_edge
+        self.quality = quality
+        self.tile_size = tile_size
+        self.max_tiles = max_tiles
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self.format = "WEBP" if "WEBP" in Image.SAVE else "JPEG"
+
+    # ==========================================
+    # 1. API UTAMA
+    # ==========================================
+    def process(self, file_bytes):
+        """
+        Memproses bytes gambar.
+        Output: list of dict {'mime_type', 'data'} siap dikirim ke Gemini.
+        Elemen pertama = overview (seluruh gambar), sisanya = tile detail.
+        """
+        key = self._cache_key(file_bytes)
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            return self._cache[key]
+
+        img = Image.open(io.BytesIO(file_bytes))
+        img = ImageOps.exif_transpose(img)
+        img = self._normalize_mode(img)
+
+        parts = [self._encode(self._downscale(img, self.max_edge))]
+        if self.is_drawing(img) and max(img.size) > 2 * self.max_edge:
+            parts.extend(self._encode(tile) for tile in self._tiles(img))
+
+        self._cache[key] = parts
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return parts
+
+    def stats(self, file_bytes):
+        """Perbandingan ukuran payload asli vs hasil proses (bytes)"""
+        parts = self.process(file_bytes)
+        total = sum(len(p['data']) for p in parts)
+        return {
+            "Asli (bytes)": len(file_bytes),
+            "Proses (bytes)": total,
+            "Jumlah Bagian": len(parts),
+            "Rasio Reduksi": len(file_bytes) / total if total > 0 else 0
+        }
+
+    # ==========================================
+    # 2. HELPER INTERNAL
+    # ==========================================
+    def _cache_key(self, file_bytes):
+        h = hashlib.sha1(file_bytes).hexdigest()
+        return (h, self.max_edge, self.quality, self.tile_size, self.max_tiles)
+
+    def _normalize_mode(self, img):
+        # WEBP/JPEG tidak mendukung palet & 16-bit, buang transparansi ke latar putih
+        if img.mode in ("RGBA", "LA") or (img.mode == "P" and "transparency" in img.info):
+            img = img.convert("RGBA")
+            bg = Image.new("RGB", img.size, (255, 255, 255))
+            bg.paste(img, mask=img.split()[-1])
+            return bg
+        if img.mode != "RGB":
+            return img.convert("RGB")
+        return img
+
+    def _downscale(self, img, edge):
+        if max(img.size) <= edge:
+            return img
+        out = img.copy()
+        # draft() tidak berlaku setelah exif_transpose, jadi pakai thumbnail (reducing_gap = cepat)
+        out.thumbnail((edge, edge), Image.LANCZOS, reducing_gap=3.0)
+        return out
+
+    def _encode(self, img):
+        bio = io.BytesIO()
+        if self.format == "WEBP":
+            img.save(bio, format="WEBP", quality=self.quality, method=4)
+        else:
+            img.save(bio, format="JPEG", quality=self.quality, optimize=True, progressive=True)
+        return {"mime_type": f"image/{self.format.lower()}", "data": bio.getvalue()}
+
+    def is_drawing(self, img):
+        """
+        Deteksi kasar gambar kerja (CAD/scan): dominan latar putih.
+        Foto lapangan biasanya < 30% piksel terang.
+        """
+        thumb = img.convert("L")
+        thumb.thumbnail((128, 128))
+        hist = thumb.histogram()
+        terang = sum(hist[230:])
+        total = sum(hist)
+        return total > 0 and terang / total > 0.6
+
+    def _tiles(self, img):
+        """
+        Potong gambar menjadi grid tile; grid dipilih agar tiap tile
+        mendekati tile_size dan jumlah tile tidak melebihi max_tiles.
+        """
+        w, h = img.size
+        cols = max(1, round(w / self.tile_size))
+        rows = max(1, round(h / self.tile_size))
+        while cols * rows > self.max_tiles:
+            if cols >= rows: cols -= 1
+            else: rows -= 1
+
+        tw = -(-w // cols)
+        th = -(-h // rows)
+        for r in range(rows):
+            for c in range(cols):
+                box = (c * tw, r * th, min(w, (c + 1) * tw), min(h, (r + 1) * th))
+                yield self._downscale(img.crop(box), self.tile_size)
@@ -1,7 +1,16 @@
 """
 PERSONA DEFINITION MODULE FOR ENGINEX ULTIMATE
 Berisi instruksi detail (System Instructions) untuk 29 Tenaga Ahli Virtual.
+
+System instruction dikompilasi (dan di-cache) per persona:
+BASE_INSTRUCTION + profil persona + dokumentasi HANYA untuk library libs_*
+yang benar-benar bisa di-import dan relevan dengan persona/prompt aktif.
 """
+import inspect
+from collections.abc import Mapping
+from functools import lru_cache
+
+import enginex
 
 # ==========================================
 # 1. INSTRUKSI GLOBAL (BASE SYSTEM PROMPT)
@@ -18,292 +27,545 @@ BASE_INSTRUCTION = """
 1. **BIM & IFC**: Anda MEMILIKI kemampuan membaca file IFC secara langsung menggunakan library `libs_bim_importer`. JANGAN PERNAH MENJAWAB "Saya tidak bisa membuka file IFC".
    - Anggap file IFC sudah tersedia di path lokal dengan nama variabel global `file_ifc_user`.
 2. **VISUALISASI**: Jika user meminta gambar/grafik (misal: potongan saluran, diagram momen), GUNAKAN library `matplotlib` dan tampilkan dengan `st.pyplot()`.
-3. **VALIDASI**: Gunakan `libs_research` untuk memvalidasi kewajaran harga atau regulasi jika user memberikan input yang mencurigakan.
 """
 
 # ==========================================
 # 2. INSTRUKSI ALAT BANTU (MANUAL BOOK)
 # ==========================================
-TOOL_DOCS = """
-[ALAT BANTU HITUNG TERSEDIA (PYTHON LIBRARIES)]:
-Anda memiliki akses ke library Python custom berikut. JANGAN menghitung manual, GUNAKAN library ini dalam blok kode python untuk hasil presisi.
-
-1. STRUKTUR BETON (SNI 2847):
-   `import libs_sni`
-   - `engine = libs_sni.SNI_Concrete_2847(fc, fy)`
-   - `As_perlu = engine.kebutuhan_tulangan(Mu_kNm, b_mm, h_mm, ds_mm)`
-
-2. STRUKTUR BAJA (SNI 1729):
-   `import libs_baja`
-   - `engine = libs_baja.SNI_Steel_1729(fy, fu)`
-   - `cek = engine.cek_balok_lentur(Mu_kNm, profil_data, Lb_m)`
-   - Daftar Profil: `libs_bridge.Bridge_Profile_DB.get_profiles()`
-
-3. GEMPA (SNI 1726):
-   `import libs_gempa`
-   - `engine = libs_gempa.SNI_Gempa_1726(Ss, S1, Kelas_Situs)`
-   - `V, Sds, Sd1 = engine.hitung_base_shear(Berat_W_kN, R_redaman)`
-
-4. GEOTEKNIK & PONDASI:
-   `import libs_geoteknik`
-   - `geo = libs_geoteknik.Geotech_Engine(gamma, phi, c)`
-   - `hasil = geo.hitung_talud_batu_kali(H, b_atas, b_bawah)`
-   `import libs_pondasi`
-   - `fdn = libs_pondasi.Foundation_Engine(sigma_tanah)`
-   - `hasil = fdn.hitung_footplate(beban_pu, lebar_B, lebar_L, tebal_mm)`
-
-5. ESTIMASI BIAYA (AHSP):
-   `import libs_ahsp`
-   - `qs = libs_ahsp.AHSP_Engine()`
-   - `harga = qs.hitung_hsp('beton_k300', {'semen':1300, ...}, {'pekerja':120000...})`
-
-6. OPTIMASI DESAIN:
-   `import libs_optimizer`
-   - `opt = libs_optimizer.BeamOptimizer(fc, fy, harga_satuan)`
-   - `saran = opt.cari_dimensi_optimal(Mu_kNm, bentang_m)`
-
-7. IRIGASI & BANGUNAN AIR (HYDRO PLANNER):
-   `import libs_irigasi`
-   - `irig = libs_irigasi.Irrigation_Engine()`
-   - `fig, info = irig.hitung_dan_gambar_saluran(Q, S, n, m)` (Gunakan st.pyplot(fig) untuk menampilkan)
-   - `kebutuhan = irig.hitung_kebutuhan_air_nfr(luas_ha, pola_tanam)`
-
-8. JIAT & PERPIPAAN (AIR TANAH):
-   `import libs_jiat`
-   - `jiat = libs_jiat.JIAT_Engine()`
-   - `pompa = jiat.hitung_head_pompa(Q_liter, L_pipa, H_statis, Dia_inch)`
-   - `sumur = jiat.desain_sumur_dalam(kedalaman, debit)`
-
-9. MEMBACA BIM (IFC):
-   `import libs_bim_importer`
-   - `bim = libs_bim_importer.IFC_Parser_Engine(file_ifc_user)`
-   - `struktur = bim.parse_structure()` -> Mendapat data Balok/Kolom (DataFrame).
-   - `arsitek = bim.parse_architectural_quantities()` -> Mendapat Luas Dinding/Pintu.
-   - `mep = bim.parse_mep_quantities()` -> Mendapat Panjang Pipa.
-
-10. ARSITEKTUR & ZONING:
-    `import libs_arch`
-    - `arch = libs_arch.Architect_Engine()`
-    - `prog = arch.generate_program_ruang(penghuni, mobil, luas_lahan)`
-    `import libs_zoning`
-    - `zone = libs_zoning.Zoning_Analyzer()`
-    - `cek = zone.cek_intensitas_bangunan(luas_lahan, luas_lantai, luas_dasar)`
-    `import libs_green`
-    - `eco = libs_green.Green_Audit()`
-    - `water = eco.hitung_panen_hujan(luas_atap, curah_hujan)`
-
-11. AUDIT & VALIDASI (DEEP RESEARCH):
-    `import libs_research`
-    - `audit = libs_research.Research_Engine()`
-    - `cek_harga = audit.audit_kewajaran_harga(item, harga)`
-    - `cek_lokasi = audit.deep_check_lokasi(nama_kota)`
+# Registry library hitung (nama lama libs_* -> paket enginex). Isi dokumentasi
+# (signature, docstring) dibangkitkan otomatis dari kode, tapi HANYA untuk nama di
+# "api" ("Kelas", "Kelas.method", "fungsi") - utilitas internal engine tidak masuk prompt.
+TOOL_REGISTRY = {
+    "libs_sni": {
+        "judul": "STRUKTUR BETON (SNI 2847)",
+        "keywords": ["beton", "balok", "kolom", "pelat", "tulangan", "lentur", "momen", "2847", "sloof", "ring balk",
+                     "interaksi", "aksial", "biaksial"],
+        "api": ("SNI_Concrete_2847", "SNI_Concrete_2847.hitung_momen_nominal", "SNI_Concrete_2847.kebutuhan_tulangan",
+                "SNI_Concrete_2847.desain_lentur", "SNI_Concrete_2847.cek_balok_batch",
+                "SNI_Column_2847", "SNI_Column_2847.penampang_persegi", "SNI_Column_2847.penampang_lingkaran",
+                "SNI_Column_2847.cek_kolom", "SNI_Column_2847.kurva_interaksi",
+                "SNI_Load_1727", "SNI_Load_1727.komb_pembebanan"),
+    },
+    "libs_baja": {
+        "judul": "STRUKTUR BAJA (SNI 1729) & BAJA RINGAN",
+        "keywords": ["baja", "wf", "profil", "tekuk", "ltb", "1729", "baja ringan", "rangka atap", "atap"],
+        "api": ("SNI_Steel_1729", "SNI_Steel_1729.cek_balok_lentur", "SNI_Steel_1729.pilih_profil_teringan",
+                "Baja_Ringan_Calc", "Baja_Ringan_Calc.hitung_kebutuhan_atap"),
+    },
+    "libs_gempa": {
+        "judul": "GEMPA (SNI 1726)",
+        "keywords": ["gempa", "seismik", "base shear", "geser dasar", "1726", "spektrum", "kelas situs"],
+        "api": ("SNI_Gempa_1726", "SNI_Gempa_1726.hitung_base_shear"),
+    },
+    "libs_geoteknik": {
+        "judul": "GEOTEKNIK",
+        "keywords": ["talud", "tanah", "penahan", "geotek", "bore pile", "tiang", "spt", "longsor", "dxf"],
+        "api": ("Geotech_Engine", "Geotech_Engine.hitung_talud_batu_kali", "Geotech_Engine.hitung_bore_pile",
+                "Geotech_Engine.generate_shop_drawing_dxf"),
+    },
+    "libs_pondasi": {
+        "judul": "PONDASI",
+        "keywords": ["pondasi", "fondasi", "footplate", "telapak", "cakar ayam", "batu kali"],
+        "api": ("Foundation_Engine", "Foundation_Engine.hitung_footplate", "Foundation_Engine.hitung_batu_kali"),
+    },
+    "libs_ahsp": {
+        "judul": "ESTIMASI BIAYA (AHSP)",
+        "keywords": ["biaya", "harga", "rab", "ahsp", "anggaran", "estimasi", "hsp", "boq", "rupiah"],
+        "api": ("AHSP_Engine", "AHSP_Engine.hitung_hsp", "AHSP_Engine.cari_analisa", "AHSP_Engine.hitung_rab",
+                "AHSP_Engine.dari_file", "RAB_Risk_Engine", "RAB_Risk_Engine.simulasi"),
+    },
+    "libs_optimizer": {
+        "judul": "OPTIMASI DESAIN",
+        "keywords": ["optimasi", "optimal", "termurah", "murah", "efisien", "dimensi"],
+        "api": ("BeamOptimizer", "BeamOptimizer.cari_dimensi_optimal", "BeamOptimizer.pareto_biaya_karbon",
+                "BuildingBeamOptimizer", "BuildingBeamOptimizer.optimasi",
+                "RebarSelector", "RebarSelector.pilih"),
+    },
+    "libs_bridge": {
+        "judul": "JEMBATAN (SNI 1725)",
+        "keywords": ["jembatan", "gelagar", "lajur", "1725", "girder"],
+        "api": ("SNI_Bridge_Loader", "SNI_Bridge_Loader.analisis_momen_gelagar", "SNI_Bridge_Loader.hitung_beban_lajur_D",
+                "SNI_Bridge_Loader.hitung_faktor_beban_dinamis", "Bridge_Profile_DB", "Bridge_Profile_DB.get_profiles",
+                "Bridge_Profile_DB.daftar_profil", "Bridge_Profile_DB.pilih_gelagar"),
+    },
+    "libs_bim_importer": {
+        "judul": "MEMBACA BIM (IFC)",
+        "keywords": ["ifc", "bim", "revit", "tekla", "model 3d"],
+        "api": ("IFC_Parser_Engine", "IFC_Parser_Engine.parse_structure", "IFC_Parser_Engine.parse_architectural_quantities",
+                "IFC_Parser_Engine.parse_mep_quantities", "IFC_Parser_Engine.calculate_architectural_loads"),
+    },
+    "libs_sustainability": {
+        "judul": "SUSTAINABILITY (KARBON & GREENSHIP)",
+        "keywords": ["karbon", "co2", "emisi", "gwp", "greenship", "hijau", "sustainab"],
+        "api": ("CarbonCalculator", "CarbonCalculator.calculate_gwp", "GreenshipChecker", "GreenshipChecker.check_mrc_credits"),
+    },
+}
+
+ALL_TOOLS = "*"
 
+TOOL_FOOTER = """
 ATURAN PAKAI:
 - Selalu import library di awal kode.
 - Tampilkan hasil hitungan teks menggunakan `st.write(hasil)` atau `st.dataframe()`.
 - Tampilkan grafik menggunakan `st.pyplot(plt.gcf())`.
+- Untuk sweep parametrik besar (ribuan kombinasi), JANGAN loop manual: gunakan
+  `enginex.sweep.jalankan_sweep(Kelas.method, grid={...}, fixed={...})` -> DataFrame.
 """
 
+@lru_cache(maxsize=None)
+def available_engines():
+    """Daftar library libs_* di TOOL_REGISTRY yang benar-benar bisa di-import"""
+    tersedia = []
+    for module_name in TOOL_REGISTRY:
+        try:
+            enginex.load_lib(module_name)
+            tersedia.append(module_name)
+        except ImportError:
+            continue
+    return tuple(tersedia)
+
+def _kalimat_pertama(teks):
+    """Kalimat pertama: titik/tanda seru/tanya + spasi di luar kurung (aman untuk '14.5' & '(mis. x)')"""
+    kedalaman = 0
+    for i, ch in enumerate(teks):
+        if ch in "([{":
+            kedalaman += 1
+        elif ch in ")]}":
+            kedalaman = max(kedalaman - 1, 0)
+        elif ch in ".!?" and kedalaman == 0 and (i + 1 == len(teks) or teks[i + 1] == " "):
+            return teks[:i + 1]
+    return teks
+
+def _ringkas_doc(obj):
+    """
+    Ringkasan docstring: kalimat pertama baris pertama. Baris yang jelas belum selesai
+    (berakhir ',', ';', ':', '(' atau '-') disambung baris berikutnya agar tidak terpotong.
+    """
+    doc = inspect.getdoc(obj)
+    if not doc:
+        return ""
+    baris = [line.strip() for line in doc.strip().split("\n\n")[0].splitlines()]
+    teks = _kalimat_pertama(baris[0])
+    for lanjut in baris[1:]:
+        if not teks.endswith((",", ";", ":", "(", "-")):
+            break
+        teks = _kalimat_pertama(f"{teks} {lanjut}")
+    return teks
+
+# Argumen opsional yang ditampilkan per signature (sisanya diringkas '...')
+MAKS_ARG_OPSIONAL = 3
+
+def _signature(func, skip_self=True):
+    try:
+        params = list(inspect.signature(func).parameters.values())
+    except (TypeError, ValueError):
+        return "(...)"
+    if skip_self and params and params[0].name in ("self", "cls"):
+        params = params[1:]
+    wajib = [p.name for p in params if p.default is inspect.Parameter.empty]
+    opsional = [f"{p.name}={p.default!r}" for p in params if p.default is not inspect.Parameter.empty]
+    if len(opsional) > MAKS_ARG_OPSIONAL:
+        opsional = opsional[:MAKS_ARG_OPSIONAL] + ["..."]
+    return "(" + ", ".join(wajib + opsional) + ")"
+
+def _baris_api(module_name, module, nama):
+    """Satu entri manual untuk nama di TOOL_REGISTRY[...]["api"]; None jika nama tidak ada di module"""
+    nama_kelas, _, nama_method = nama.partition(".")
+    obj = getattr(module, nama_kelas, None)
+    if obj is None:
+        return None
+    if not nama_method:
+        if inspect.isclass(obj):
+            sig = "()" if obj.__init__ is object.__init__ else _signature(obj.__init__)
+        else:
+            sig = _signature(inspect.unwrap(obj), False)
+        desc = _ringkas_doc(obj)
+        return f"- `{module_name}.{nama_kelas}{sig}`" + (f" -> {desc}" if desc else "")
+    member = inspect.getattr_static(obj, nama_method, None)
+    if member is None:
+        return None
+    func = inspect.unwrap(member.__func__ if isinstance(member, (staticmethod, classmethod)) else member)
+    desc = _ringkas_doc(func)
+    return (f"  - `.{nama_method}{_signature(func, not isinstance(member, staticmethod))}`"
+            + (f" -> {desc}" if desc else ""))
+
+@lru_cache(maxsize=None)
+def render_tool_section(module_name):
+    """
+    Dokumentasi satu library hasil introspeksi, terbatas pada API yang diekspos
+    (TOOL_REGISTRY[...]["api"]): signature + kalimat pertama docstring.
+    """
+    module = enginex.load_lib(module_name)
+    lines = [f"`import {module_name}`"]
+    for nama in TOOL_REGISTRY[module_name]["api"]:
+        baris = _baris_api(module_name, module, nama)
+        if baris is not None:
+            lines.append(baris)
+    return "\n   ".join(lines)
+
+def build_tool_docs(module_names):
+    """Gabungkan section dokumentasi beberapa library menjadi satu manual"""
+    if not module_names:
+        return ""
+    parts = ["[ALAT BANTU HITUNG TERSEDIA (PYTHON LIBRARIES)]:",
+             "Anda memiliki akses ke library Python custom berikut. JANGAN menghitung manual, "
+             "GUNAKAN library ini dalam blok kode python untuk hasil presisi.", ""]
+    for i, module_name in enumerate(module_names, start=1):
+        parts.append(f"{i}. {TOOL_REGISTRY[module_name]['judul']}:")
+        parts.append(f"   {render_tool_section(module_name)}")
+        parts.append("")
+    return "\n".join(parts) + TOOL_FOOTER
+
+def build_tool_index(module_names):
+    """Daftar ringkas (tanpa detail) untuk persona serba-bisa saat prompt tidak spesifik"""
+    if not module_names:
+        return ""
+    items = ", ".join(f"`{m}` ({TOOL_REGISTRY[m]['judul']})" for m in module_names)
+    return f"[ALAT BANTU HITUNG TERSEDIA]: {items}.\n" + TOOL_FOOTER
+
 # ==========================================
 # 3. DAFTAR PERSONA LENGKAP
 # ==========================================
+# tools: daftar libs_* yang relevan, ALL_TOOLS (semua, difilter per prompt), atau [] (tanpa manual)
 
-gems_persona = {
+PERSONA_SPECS = {
     # --- LEVEL MANAJEMEN ---
-    "👑 The GEMS Grandmaster": f"""
-        {BASE_INSTRUCTION}
+    "👑 The GEMS Grandmaster": {
+        "tools": ALL_TOOLS,
+        "brief": """
         PERAN: Direktur Utama Konsultan (Omniscient Project Director).
         KEMAMPUAN: Mengorkestrasi jawaban lintas disiplin, memanggil semua library yang tersedia.
-        {TOOL_DOCS}
-    """,
+        """
+    },
 
-    "👔 Project Manager (PM)": f"""
-        {BASE_INSTRUCTION}
+    "👔 Project Manager (PM)": {
+        "tools": [],
+        "brief": """
         PERAN: Senior Project Manager (PMP).
         FOKUS: Manajemen Waktu (Kurva S), Biaya, dan Mutu.
-    """,
+        """
+    },
 
-    "⚖️ Ahli Legal & Kontrak": f"""
-        {BASE_INSTRUCTION}
+    "⚖️ Ahli Legal & Kontrak": {
+        "tools": [],
+        "brief": """
         PERAN: Ahli Hukum Konstruksi.
         REFERENSI: UU No. 2 Tahun 2017, FIDIC Red Book.
-        FOKUS: Gunakan `libs_research` untuk validasi regulasi daerah.
-    """,
+        FOKUS: Validasi regulasi daerah dan klausul kontrak.
+        """
+    },
 
-    "🕌 Dewan Syariah": f"""
-        {BASE_INSTRUCTION}
+    "🕌 Dewan Syariah": {
+        "tools": [],
+        "brief": """
         PERAN: Ulama Fiqih Bangunan.
         TUGAS: Arah Kiblat, Akad Syariah (Istisna'), Audit Kehalalan Pembiayaan.
-    """,
+        """
+    },
 
-    "💰 Ahli Estimator (RAB)": f"""
-        {BASE_INSTRUCTION}
+    "💰 Ahli Estimator (RAB)": {
+        "tools": ["libs_ahsp"],
+        "brief": """
         PERAN: Senior Quantity Surveyor (QS).
-        {TOOL_DOCS}
-        FOKUS: Gunakan `libs_ahsp` untuk analisa harga dan `libs_research` untuk audit kewajaran harga.
-    """,
+        FOKUS: Gunakan `libs_ahsp` untuk analisa harga dan cek kewajaran harga satuan.
+        """
+    },
 
-    "💵 Ahli Keuangan Proyek": f"""
-        {BASE_INSTRUCTION}
+    "💵 Ahli Keuangan Proyek": {
+        "tools": [],
+        "brief": """
         PERAN: Project Finance Specialist.
         FOKUS: Cashflow, ROI, Pajak Konstruksi.
-    """,
+        """
+    },
 
     # --- LEVEL TEKNIS SIPIL (SDA) ---
-    "🌾 Ahli IKSI-PAI": f"""
-        {BASE_INSTRUCTION}
+    "🌾 Ahli IKSI-PAI": {
+        "tools": [],
+        "brief": """
         PERAN: Ahli Irigasi & Audit Kinerja Sistem Irigasi (AKSI).
-        {TOOL_DOCS}
-        FOKUS: Gunakan `libs_irigasi` untuk menghitung kebutuhan air (NFR) dan audit jaringan.
-    """,
+        FOKUS: Hitung kebutuhan air (NFR) dan audit jaringan langsung dengan numpy/pandas.
+        """
+    },
 
-    "🌊 Ahli Bangunan Air": f"""
-        {BASE_INSTRUCTION}
+    "🌊 Ahli Bangunan Air": {
+        "tools": [],
+        "brief": """
         PERAN: Hydraulic Structures Engineer.
-        {TOOL_DOCS}
-        FOKUS: Gunakan `libs_irigasi` untuk desain saluran dan `libs_jiat` untuk pompa/perpipaan.
+        FOKUS: Desain saluran (Manning) dan pompa/perpipaan (Hazen-Williams) langsung dengan numpy.
         WAJIB: Tampilkan potongan melintang saluran jika diminta desain.
-    """,
+        """
+    },
 
-    "🌧️ Ahli Hidrologi": f"""
-        {BASE_INSTRUCTION}
+    "🌧️ Ahli Hidrologi": {
+        "tools": [],
+        "brief": """
         PERAN: Senior Hydrologist.
         FOKUS: Analisis Curah Hujan Rencana, Debit Banjir.
-    """,
+        """
+    },
 
-    "🏖️ Ahli Teknik Pantai": f"""
-        {BASE_INSTRUCTION}
+    "🏖️ Ahli Teknik Pantai": {
+        "tools": [],
+        "brief": """
         PERAN: Coastal Engineer.
         FOKUS: Pemecah Gelombang, Pasang Surut.
-    """,
+        """
+    },
 
     # --- LEVEL TEKNIS SIPIL (STRUKTUR & GEOTEK) ---
-    "🏗️ Ahli Struktur (Gedung)": f"""
-        {BASE_INSTRUCTION}
+    "🏗️ Ahli Struktur (Gedung)": {
+        "tools": ["libs_sni", "libs_baja", "libs_gempa", "libs_bim_importer", "libs_optimizer"],
+        "brief": """
         PERAN: Principal Structural Engineer.
-        {TOOL_DOCS}
         FOKUS: Gunakan `libs_sni` (Beton), `libs_baja` (Baja), `libs_gempa` (Gempa), dan `libs_bim_importer` (Baca IFC).
         WAJIB: Lakukan optimasi desain menggunakan `libs_optimizer` jika diminta yang termurah.
-    """,
+        """
+    },
 
-    "🪨 Ahli Geoteknik": f"""
-        {BASE_INSTRUCTION}
+    "🪨 Ahli Geoteknik": {
+        "tools": ["libs_geoteknik", "libs_pondasi"],
+        "brief": """
         PERAN: Geotechnical Engineer.
-        {TOOL_DOCS}
         FOKUS: Gunakan `libs_geoteknik` untuk daya dukung tanah dan `libs_pondasi`.
         WAJIB: Cek Safety Factor (SF) pada talud/dinding penahan tanah.
-    """,
+        """
+    },
 
-    "🛣️ Ahli Jalan & Jembatan": f"""
-        {BASE_INSTRUCTION}
+    "🛣️ Ahli Jalan & Jembatan": {
+        "tools": ["libs_bridge", "libs_baja"],
+        "brief": """
         PERAN: Highway & Bridge Engineer.
-        {TOOL_DOCS}
         FOKUS: Gunakan `libs_bridge` untuk beban jembatan dan profil baja.
-    """,
+        """
+    },
 
-    "🌍 Ahli Geodesi & GIS": f"""
-        {BASE_INSTRUCTION}
+    "🌍 Ahli Geodesi & GIS": {
+        "tools": [],
+        "brief": """
         PERAN: Geomatics Engineer.
         FOKUS: Pemetaan, Koordinat, Cut & Fill Lahan.
-    """,
+        """
+    },
 
     # --- ARSITEKTUR & LINGKUNGAN ---
-    "🏛️ Senior Architect": f"""
-        {BASE_INSTRUCTION}
+    "🏛️ Senior Architect": {
+        "tools": [],
+        "brief": """
         PERAN: Principal Architect (IAI).
-        {TOOL_DOCS}
-        FOKUS: Gunakan `libs_arch` (Program Ruang) dan `libs_zoning` (KDB/KLB).
+        FOKUS: Program Ruang dan intensitas bangunan (KDB/KLB).
         WAJIB: Pastikan desain mematuhi standar Neufert dan Regulasi Kota.
-    """,
+        """
+    },
 
-    "🌳 Landscape Architect": f"""
-        {BASE_INSTRUCTION}
+    "🌳 Landscape Architect": {
+        "tools": [],
+        "brief": """
         PERAN: Landscape Architect.
         FOKUS: Desain Taman, RTH, Pemilihan Tanaman.
-    """,
+        """
+    },
 
-    "🌍 Ahli Planologi": f"""
-        {BASE_INSTRUCTION}
+    "🌍 Ahli Planologi": {
+        "tools": [],
+        "brief": """
         PERAN: Urban Planner.
-        {TOOL_DOCS}
-        FOKUS: Gunakan `libs_zoning` untuk analisis tata ruang kota (RTRW/RDTR).
-    """,
+        FOKUS: Analisis tata ruang kota (RTRW/RDTR), KDB/KLB.
+        """
+    },
 
-    "📜 Ahli AMDAL": f"""
-        {BASE_INSTRUCTION}
+    "📜 Ahli AMDAL": {
+        "tools": [],
+        "brief": """
         PERAN: Ahli Lingkungan.
         FOKUS: UKL-UPL, Analisis Dampak Lingkungan.
-    """,
+        """
+    },
 
-    "♻️ Ahli Teknik Lingkungan": f"""
-        {BASE_INSTRUCTION}
+    "♻️ Ahli Teknik Lingkungan": {
+        "tools": ["libs_sustainability"],
+        "brief": """
         PERAN: Sanitary Engineer.
-        {TOOL_DOCS}
-        FOKUS: Gunakan `libs_green` untuk audit air hujan dan sistem plumbing.
-    """,
+        FOKUS: Audit air hujan, sistem plumbing, dan jejak karbon material (`libs_sustainability`).
+        """
+    },
 
-    "⛑️ Ahli K3 Konstruksi": f"""
-        {BASE_INSTRUCTION}
+    "⛑️ Ahli K3 Konstruksi": {
+        "tools": [],
+        "brief": """
         PERAN: Safety Manager (HSE).
         FOKUS: Identifikasi Bahaya, RK3K, Zero Accident.
-    """,
+        """
+    },
 
     # --- PENDUKUNG ---
-    "📝 Drafter Laporan DED": f"""
-        {BASE_INSTRUCTION}
+    "📝 Drafter Laporan DED": {
+        "tools": [],
+        "brief": """
         PERAN: Technical Writer.
         FOKUS: Menyusun laporan teknis yang rapi dan baku.
         (Mode: Text-Only, tidak menjalankan kode Python).
-    """,
+        """
+    },
 
-    "🏭 Ahli Proses Industri": f"""
-        {BASE_INSTRUCTION}
+    "🏭 Ahli Proses Industri": {
+        "tools": [],
+        "brief": """
         PERAN: Process Engineer.
         FOKUS: Diagram Alir, P&ID Industri.
-    """,
+        """
+    },
 
-    "🎨 The Visionary Architect": f"""
-        {BASE_INSTRUCTION}
+    "🎨 The Visionary Architect": {
+        "tools": [],
+        "brief": """
         PERAN: AI Visualizer & Prompt Engineer.
         FOKUS: Menghasilkan deskripsi visual dan prompt untuk rendering gambar.
-    """,
+        """
+    },
 
-    "💻 Lead Engineering Developer": f"""
-        {BASE_INSTRUCTION}
+    "💻 Lead Engineering Developer": {
+        "tools": ALL_TOOLS,
+        "brief": """
         PERAN: Python & Streamlit Expert.
-        {TOOL_DOCS}
         FOKUS: Memperbaiki atau membuat skrip Python baru untuk sistem ini.
-    """,
+        """
+    },
 
-    "📐 CAD & BIM Automator": f"""
-        {BASE_INSTRUCTION}
+    "📐 CAD & BIM Automator": {
+        "tools": ["libs_bim_importer", "libs_geoteknik"],
+        "brief": """
         PERAN: BIM Manager.
-        {TOOL_DOCS}
-        FOKUS: Spesialis `libs_bim_importer` dan `libs_export` (DXF).
+        FOKUS: Spesialis `libs_bim_importer` dan export DXF (`generate_shop_drawing_dxf`).
         TUGAS: Ekstraksi data IFC dan konversi ke gambar kerja.
-    """,
+        """
+    },
 
-    "🖥️ Instruktur Software": f"""
-        {BASE_INSTRUCTION}
+    "🖥️ Instruktur Software": {
+        "tools": [],
+        "brief": """
         PERAN: Software Trainer.
         FOKUS: Mengajarkan cara penggunaan software Sipil (SAP2000, HEC-RAS, dll).
-    """,
+        """
+    },
 
-    "📜 Ahli Perizinan": f"""
-        {BASE_INSTRUCTION}
+    "📜 Ahli Perizinan": {
+        "tools": [],
+        "brief": """
         PERAN: Konsultan Perizinan.
         FOKUS: PBG (Persetujuan Bangunan Gedung), SLF (Sertifikat Laik Fungsi).
-    """,
-    
-    "🤖 The Enginex Architect": f"""
-        {BASE_INSTRUCTION}
+        """
+    },
+
+    "🤖 The Enginex Architect": {
+        "tools": [],
+        "brief": """
         PERAN: System Admin & Core Logic.
         FOKUS: Menjaga integritas sistem dan logika backend.
-    """
+        """
+    }
 }
 
+DEFAULT_PERSONA = "👑 The GEMS Grandmaster"
+
+# ==========================================
+# 4. KOMPILASI INSTRUKSI (DENGAN CACHE)
+# ==========================================
+
+def pilih_tools(persona_name, prompt=None):
+    """
+    Menentukan library yang didokumentasikan untuk persona + prompt:
+    - Library milik persona (yang tersedia) selalu ikut.
+    - Library lain ikut jika kata kuncinya muncul di prompt (lintas disiplin).
+    - Persona ALL_TOOLS: tanpa prompt = semua; dengan prompt = yang relevan saja.
+    - Persona tanpa tools (mis. Legal, Drafter) tidak pernah diberi manual.
+    """
+    spec = PERSONA_SPECS.get(persona_name, PERSONA_SPECS[DEFAULT_PERSONA])
+    if not spec["tools"]:
+        return ()
+    tersedia = available_engines()
+    if spec["tools"] == ALL_TOOLS:
+        if not prompt:
+            return tersedia
+        base = ()
+    else:
+        base = tuple(m for m in spec["tools"] if m in tersedia)
+
+    if not prompt:
+        return base
+    prompt_lower = prompt.lower()
+    relevan = tuple(m for m in tersedia if m not in base
+                    and any(k in prompt_lower for k in TOOL_REGISTRY[m]["keywords"]))
+    return base + relevan
+
+@lru_cache(maxsize=512)
+def compile_instruction(persona_name, tools):
+    """Instruksi lengkap satu persona untuk kombinasi library tertentu (di-cache)"""
+    spec = PERSONA_SPECS.get(persona_name, PERSONA_SPECS[DEFAULT_PERSONA])
+    brief = "\n".join(line.strip() for line in spec["brief"].strip().splitlines())
+    parts = [BASE_INSTRUCTION.strip(), brief]
+    if tools:
+        parts.append(build_tool_docs(tools))
+    elif spec["tools"] == ALL_TOOLS:
+        parts.append(build_tool_index(available_engines()))
+    return "\n\n".join(parts)
+
 def get_persona_list():
-    return list(gems_persona.keys())
+    return list(PERSONA_SPECS.keys())
+
+def get_system_instruction(persona_name, prompt=None):
+    """
+    System instruction terkompilasi. Jika `prompt` diberikan, manual library
+    dipangkas hanya ke bagian yang relevan dengan persona & pertanyaan.
+    """
+    if persona_name not in PERSONA_SPECS:
+        persona_name = DEFAULT_PERSONA
+    return compile_instruction(persona_name, pilih_tools(persona_name, prompt))
+
+class _CompiledPersonaMap(Mapping):
+    """Akses gaya dict lama (gems_persona[nama]) yang dikompilasi saat dibaca"""
+    def __getitem__(self, persona_name):
+        if persona_name not in PERSONA_SPECS:
+            raise KeyError(persona_name)
+        return get_system_instruction(persona_name)
+
+    def __iter__(self):
+        return iter(PERSONA_SPECS)
+
+    def __len__(self):
+        return len(PERSONA_SPECS)
 
-def get_system_instruction(persona_name):
-    return gems_persona.get(persona_name, gems_persona["👑 The GEMS Grandmaster"])
+gems_persona = _CompiledPersonaMap()
+
+# ==========================================
+# 5. PENGUKURAN TOKEN
+# ==========================================
+
+def estimate_tokens(text):
+    """Estimasi jumlah token (~4 karakter/token untuk teks campuran ID/EN + kode)"""
+    return (len(text) + 3) // 4
+
+def prompt_token_report(prompt=None, model=None):
+    """
+    Perbandingan ukuran system prompt per persona:
+    'token_penuh' = manual semua library (perilaku lama), 'token_kompilasi' = hasil builder.
+    Jika `model` (genai.GenerativeModel) diberikan, angka diambil dari model.count_tokens().
+    """
+    def hitung(text):
+        if model is not None:
+            return model.count_tokens(text).total_tokens
+        return estimate_tokens(text)
+
+    rows = []
+    for persona_name, spec in PERSONA_SPECS.items():
+        penuh = compile_instruction(persona_name, available_engines() if spec["tools"] else ())
+        kompilasi = get_system_instruction(persona_name, prompt)
+        t_penuh, t_kompilasi = hitung(penuh), hitung(kompilasi)
+        rows.append({
+            "persona": persona_name,
+            "tools": ", ".join(pilih_tools(persona_name, prompt)),
+            "token_penuh": t_penuh,
+            "token_kompilasi": t_kompilasi,
+            "hemat_%": round(100 * (1 - t_kompilasi / t_penuh), 1) if t_penuh else 0.0
+        })
+    return rows
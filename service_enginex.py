@@ -0,0 +1,505 @@
+"""
+SERVICE LAYER ENGINEX ULTIMATE
+Pipeline konsultasi yang bisa dipakai tanpa UI Streamlit:
+pemilihan persona, konteks riwayat, streaming LLM, eksekusi kode & export.
+Dipakai oleh app_enginex.py (interaktif) dan batch_enginex.py (CLI/batch).
+"""
+import io
+import re
+import threading
+import traceback
+
+import pandas as pd
+import numpy as np
+import matplotlib.pyplot as plt
+import docx
+import google.generativeai as genai
+from google.generativeai.types import HarmCategory, HarmBlockThreshold
+
+from persona import gems_persona, get_system_instruction
+
+# --- LIBRARY TEKNIK SIPIL CUSTOM (ENGINEX BRAIN) ---
+# Engine di-load lazy dari paket enginex, hanya yang disebut di kode AI
+import enginex
+
+DEFAULT_EXPERT = "👑 The GEMS Grandmaster"
+
+# Daftar ahli yang TIDAK BOLEH dikasih senjata coding (Hanya Ngetik)
+LEVEL_2_AGENTS = ["Drafter", "Legal", "Visionary", "Admin", "Syariah"]
+
+# Kata kunci yang memicu eksekusi blok kode python dari AI
+CODE_TRIGGERS = ["plt.", "matplotlib", "libs_", "st.dataframe", "st.write"]
+
+PLOT_INSTRUCTION = """
+[ATURAN PENTING UNTUK VISUALISASI & PERHITUNGAN]:
+Jika user meminta grafik/diagram/plot atau PERHITUNGAN TEKNIS:
+1. JANGAN HANYA MEMBERIKAN DESKRIPSI.
+2. ANDA WAJIB MENULISKAN KODE PYTHON DI DALAM BLOK KODE (```python).
+3. Gunakan library `matplotlib.pyplot` (sebagai plt) dan `numpy` (sebagai np).
+4. Gunakan Library Custom yang tersedia (`libs_sni`, `libs_ahsp`, dll) sesuai instruksi di TOOL_DOCS.
+5. WAJIB: Di akhir kode plotting, gunakan perintah `st.pyplot(plt.gcf())` agar grafik muncul.
+6. Untuk menampilkan Dataframe hasil hitungan, gunakan `st.dataframe(df)` atau `st.write(df)`.
+"""
+
+SAFETY_SETTINGS = {
+    HarmCategory.HARM_CATEGORY_HARASSMENT: HarmBlockThreshold.BLOCK_NONE,
+    HarmCategory.HARM_CATEGORY_HATE_SPEECH: HarmBlockThreshold.BLOCK_NONE,
+    HarmCategory.HARM_CATEGORY_SEXUALLY_EXPLICIT: HarmBlockThreshold.BLOCK_NONE,
+    HarmCategory.HARM_CATEGORY_DANGEROUS_CONTENT: HarmBlockThreshold.BLOCK_NONE,
+}
+
+# ==========================================
+# 1. EXPORT (DOCX & XLSX)
+# ==========================================
+
+def create_docx_from_text(text_content):
+    """Mengubah teks chat menjadi file Word (.docx)"""
+    try:
+        doc = docx.Document()
+        doc.add_heading('Laporan Output ENGINEX', 0)
+
+        lines = text_content.split('\n')
+        for line in lines:
+            clean_line = line.strip()
+            if clean_line.startswith('## '):
+                doc.add_heading(clean_line.replace('## ', ''), level=2)
+            elif clean_line.startswith('### '):
+                doc.add_heading(clean_line.replace('### ', ''), level=3)
+            elif clean_line.startswith('- ') or clean_line.startswith('* '):
+                try:
+                    doc.add_paragraph(clean_line, style='List Bullet')
+                except KeyError: # Template tanpa style 'List Bullet'
+                    doc.add_paragraph(clean_line)
+            elif clean_line:
+                doc.add_paragraph(clean_line)
+
+        bio = io.BytesIO()
+        doc.save(bio)
+        bio.seek(0)
+        return bio
+    except Exception as e:
+        return None
+
+# --- PARSER TABEL MARKDOWN ---
+_SEPARATOR_RE = re.compile(r"^\|?\s*:?-+:?\s*(\|\s*:?-+:?\s*)*\|?$")
+_HEADING_RE = re.compile(r"^#{1,6}\s+(.*)$")
+_ID_GROUPED_RE = re.compile(r"^\d{1,3}(\.\d{3})+(,\d+)?$")    # 1.250.000,50
+_EN_GROUPED_RE = re.compile(r"^\d{1,3}(,\d{3})+(\.\d+)?$")    # 1,250,000.50
+_NUM_RE = re.compile(r"^\d+([.,]\d+)?$")
+# Kolom penomoran/kode (1.1, 1.10, 2.3.1) selalu teks, jangan dijadikan float
+_KOLOM_TEKS_RE = re.compile(r"^(no|nomor|kode|id|pasal|butir|item)\b\.?", re.IGNORECASE)
+_NOMOR_NOL_RE = re.compile(r"^\d+\.(\d?|\d{3,})0$")    # 1.10, 2.20 (bukan ribuan 1.000)
+
+def _split_row(stripped):
+    cells = [c.strip() for c in stripped.split('|')]
+    if stripped.startswith('|'): cells = cells[1:]
+    if stripped.endswith('|'): cells = cells[:-1]
+    return cells
+
+def parse_markdown_tables(text_content):
+    """
+    Parser tabel Markdown satu kali jalan (single pass).
+    Tabel hanya dikenali bila baris header langsung diikuti baris pemisah (|---|:--:|),
+    sehingga teks biasa yang kebetulan memuat '|' tidak ikut terbaca. Baris '|'
+    berikutnya = isi tabel. Judul diambil dari heading terakhir.
+    Output: list of dict {'judul', 'headers', 'rows'}
+    """
+    tables = []
+    current = None
+    calon_header = None
+    last_heading = None
+
+    for line in text_content.split('\n'):
+        stripped = line.strip()
+        if current is not None and '|' in stripped:
+            if not _SEPARATOR_RE.match(stripped):
+                current['rows'].append(_split_row(stripped))
+            continue
+        current = None
+
+        if calon_header is not None and '|' in stripped and _SEPARATOR_RE.match(stripped):
+            current = {'judul': last_heading, 'headers': calon_header, 'rows': []}
+            tables.append(current)
+            calon_header = None
+            continue
+        if '|' in stripped and not _SEPARATOR_RE.match(stripped):
+            calon_header = _split_row(stripped)
+            continue
+        calon_header = None
+
+        m = _HEADING_RE.match(stripped)
+        if m:
+            last_heading = m.group(1).strip('* ')
+        elif stripped.startswith('**') and stripped.endswith('**') and len(stripped) > 4:
+            last_heading = stripped.strip('* :')
+
+    return [t for t in tables if t['rows']]
+
+def _bersihkan_angka(cell):
+    """Buang markup/unit umum: **bold**, 'Rp', '%', spasi pemisah ribuan"""
+    v = cell.replace('*', '').replace('`', '').strip()
+    if v[:2].lower() == 'rp':
+        v = v[2:].lstrip('. ')
+    if v.endswith('%'):
+        v = v[:-1].strip()
+    neg = v.startswith('-') or (v.startswith('(') and v.endswith(')'))
+    v = v.strip('-() ').replace(' ', '').replace('\u00a0', '')
+    return v, neg
+
+def _deteksi_format(values):
+    """
+    Tentukan konvensi angka satu kolom: 'id' (1.250.000,50) atau 'en' (1,250,000.50).
+    Nilai ambigu seperti '1.250' mengikuti bukti lain di kolom yang sama,
+    default 'id' karena laporan ENGINEX berbahasa Indonesia.
+    """
+    id_vote = en_vote = 0
+    for v in values:
+        if _ID_GROUPED_RE.match(v) and (v.count('.') > 1 or ',' in v):
+            id_vote += 1
+        elif _EN_GROUPED_RE.match(v) and (v.count(',') > 1 or '.' in v):
+            en_vote += 1
+        elif _NUM_RE.match(v):
+            sep = ',' if ',' in v else ('.' if '.' in v else None)
+            if sep and len(v.split(sep)[1]) != 3:
+                # '12,5' pasti desimal Indonesia, '2.5' pasti desimal Inggris
+                if sep == ',': id_vote += 1
+                else: en_vote += 1
+    return 'en' if en_vote > id_vote else 'id'
+
+def _to_float(v, fmt):
+    if fmt == 'id':
+        v = v.replace('.', '').replace(',', '.')
+    else:
+        v = v.replace(',', '')
+    return float(v)
+
+def infer_numeric_column(cells):
+    """
+    Coba ubah satu kolom string jadi float64.
+    Sel kosong / '-' dianggap NaN. Return None jika ada sel non-angka, atau jika
+    kolom berupa penomoran bertingkat (mis. '1.1' dan '1.10' sekaligus).
+    """
+    cleaned = []
+    for cell in cells:
+        v, neg = _bersihkan_angka(cell)
+        if v in ('', '-'):
+            cleaned.append((None, False))
+            continue
+        if not (_NUM_RE.match(v) or _ID_GROUPED_RE.match(v) or _EN_GROUPED_RE.match(v)):
+            return None
+        cleaned.append((v, neg))
+
+    present = [v for v, _ in cleaned if v is not None]
+    if not present:
+        return None
+    fmt = _deteksi_format(present)
+    out = np.empty(len(cleaned), dtype=np.float64)
+    for i, (v, neg) in enumerate(cleaned):
+        if v is None:
+            out[i] = np.nan
+            continue
+        try:
+            out[i] = -_to_float(v, fmt) if neg else _to_float(v, fmt)
+        except ValueError:
+            return None
+
+    # '1.1' dan '1.10' di kolom yang sama = penomoran, bukan angka desimal
+    teks_per_nilai = {}
+    for (v, neg), x in zip(cleaned, out):
+        if v is None:
+            continue
+        lain = teks_per_nilai.setdefault(x, v)
+        if lain != v and (_NOMOR_NOL_RE.match(v) or _NOMOR_NOL_RE.match(lain)):
+            return None
+    return out
+
+def markdown_table_to_dataframe(table):
+    """Konversi hasil parse_markdown_tables() menjadi DataFrame bertipe (angka = float64)"""
+    headers = [h if h else f"Kolom_{i + 1}" for i, h in enumerate(table['headers'])]
+    # Rapikan header duplikat
+    seen = {}
+    for i, h in enumerate(headers):
+        if h in seen:
+            seen[h] += 1
+            headers[i] = f"{h}_{seen[h]}"
+        else:
+            seen[h] = 0
+
+    n_col = len(headers)
+    rows = [(r + [''] * n_col)[:n_col] for r in table['rows']]
+    data = {}
+    for i, h in enumerate(headers):
+        col = [r[i] for r in rows]
+        if _KOLOM_TEKS_RE.match(h.replace('*', '').strip()):
+            data[h] = col
+            continue
+        numeric = infer_numeric_column(col)
+        data[h] = numeric if numeric is not None else col
+    return pd.DataFrame(data)
+
+def _nama_sheet(judul, idx, used):
+    base = re.sub(r'[\[\]\*\?/\\:]', '', judul or '')[:28].strip() or f"Tabel_{idx}"
+    name = base
+    n = 2
+    while name.lower() in used:
+        name = f"{base[:26]}_{n}"
+        n += 1
+    used.add(name.lower())
+    return name
+
+def extract_table_to_excel(text_content):
+    """
+    Mendeteksi SEMUA tabel Markdown dalam chat dan mengubahnya ke Excel (.xlsx).
+    Satu tabel = satu sheet; kolom angka (termasuk format Indonesia 1.250.000,50)
+    ditulis sebagai sel numerik dengan format ribuan.
+    """
+    try:
+        tables = parse_markdown_tables(text_content)
+        if not tables: return None
+
+        output = io.BytesIO()
+        with pd.ExcelWriter(output, engine='xlsxwriter') as writer:
+            workbook = writer.book
+            header_fmt = workbook.add_format({'bold': True, 'bg_color': '#D7E4BC', 'border': 1, 'text_wrap': True, 'valign': 'vcenter'})
+            int_fmt = workbook.add_format({'num_format': '#,##0'})
+            dec_fmt = workbook.add_format({'num_format': '#,##0.00'})
+            used = set()
+
+            for idx, table in enumerate(tables, start=1):
+                df = markdown_table_to_dataframe(table)
+                sheet = _nama_sheet(table['judul'], idx, used)
+                df.to_excel(writer, index=False, sheet_name=sheet)
+                worksheet = writer.sheets[sheet]
+
+                for i, col in enumerate(df.columns):
+                    worksheet.write(0, i, col, header_fmt)
+                    series = df[col]
+                    if series.dtype == np.float64:
+                        vals = series.dropna().to_numpy()
+                        is_int = vals.size > 0 and np.all(vals == np.round(vals))
+                        width = max(len(str(col)), len(f"{np.nanmax(np.abs(vals)) if vals.size else 0:,.2f}")) + 2
+                        worksheet.set_column(i, i, min(width, 40), int_fmt if is_int else dec_fmt)
+                    else:
+                        width = max([len(str(col))] + [len(v) for v in series]) + 2
+                        worksheet.set_column(i, i, min(width, 60))
+                worksheet.freeze_panes(1, 0)
+        output.seek(0)
+        return output
+    except Exception as e:
+        return None
+
+# ==========================================
+# 2. PENGGANTI `st` UNTUK EKSEKUSI HEADLESS
+# ==========================================
+
+class HeadlessDisplay:
+    """
+    Pengganti modul `st` saat kode AI dijalankan tanpa Streamlit.
+    Semua output (teks, tabel, grafik) ditampung di `self.outputs`.
+    """
+    def __init__(self):
+        self.outputs = []
+
+    def write(self, *args, **kwargs):
+        for obj in args:
+            if isinstance(obj, pd.DataFrame):
+                self.outputs.append(("dataframe", obj.copy()))
+            else:
+                self.outputs.append(("text", str(obj)))
+
+    def dataframe(self, data, *args, **kwargs):
+        self.outputs.append(("dataframe", pd.DataFrame(data)))
+
+    table = dataframe
+
+    def markdown(self, body, *args, **kwargs):
+        self.outputs.append(("text", str(body)))
+
+    text = caption = title = header = subheader = success = info = warning = error = markdown
+
+    def metric(self, label, value, *args, **kwargs):
+        self.outputs.append(("text", f"{label}: {value}"))
+
+    def code(self, body, *args, **kwargs):
+        self.outputs.append(("code", str(body)))
+
+    def pyplot(self, fig=None, *args, **kwargs):
+        fig = fig if fig is not None else plt.gcf()
+        bio = io.BytesIO()
+        fig.savefig(bio, format='png', dpi=110, bbox_inches='tight')
+        self.outputs.append(("image", bio.getvalue()))
+
+    def __getattr__(self, name):
+        # Widget/komponen lain (columns, expander, dll) diabaikan di mode headless
+        def _noop(*args, **kwargs):
+            return None
+        return _noop
+
+# ==========================================
+# 3. SERVICE UTAMA
+# ==========================================
+
+class EnginexService:
+    """
+    Pipeline konsultasi ENGINEX tanpa ketergantungan UI.
+    backend: instance EnginexBackend (opsional) untuk riwayat & penyimpanan hasil.
+    """
+    def __init__(self, api_key=None, model_name="gemini-1.5-flash", backend=None):
+        if api_key:
+            genai.configure(api_key=api_key.strip(), transport="rest")
+        self.model_name = model_name
+        self.backend = backend
+        # SQLite (check_same_thread=False) dipakai bersama oleh beberapa thread batch
+        self._db_lock = threading.Lock()
+        # pyplot menyimpan state global (figure aktif), eksekusi kode harus serial
+        self._exec_lock = threading.Lock()
+
+    # --- PERSONA ---
+    @staticmethod
+    def is_text_only(expert_name):
+        """Cek apakah ahli masuk golongan Level 2 (tanpa eksekusi kode)"""
+        return any(keyword in expert_name for keyword in LEVEL_2_AGENTS)
+
+    @staticmethod
+    def resolve_expert(name):
+        """Mencocokkan nama ahli (boleh sebagian, case-insensitive) ke key gems_persona"""
+        if name in gems_persona:
+            return name
+        key = name.strip().lower()
+        for persona_name in gems_persona:
+            if key in persona_name.lower():
+                return persona_name
+        raise KeyError(f"Ahli tidak ditemukan: {name}")
+
+    def build_system_instruction(self, expert_name, prompt=None):
+        # Manual library dipangkas sesuai persona & prompt (dikompilasi + di-cache di persona.py)
+        base_instruction = get_system_instruction(expert_name, prompt)
+        if self.is_text_only(expert_name):
+            return base_instruction
+        return base_instruction + "\n\n" + PLOT_INSTRUCTION
+
+    def pilih_ahli_otomatis(self, user_query):
+        """Auto-Pilot: minta model kecil memilih SATU ahli yang relevan"""
+        try:
+            router_model = genai.GenerativeModel("gemini-1.5-flash")
+            list_ahli = list(gems_persona.keys())
+            router_prompt = f"""
+            Pilih SATU ahli dari daftar berikut untuk menjawab pertanyaan: "{user_query}"
+            Daftar: {list_ahli}
+            Output: HANYA nama ahli persis. Jika ragu, pilih '{DEFAULT_EXPERT}'.
+            """
+            response = router_model.generate_content(router_prompt)
+            suggested = response.text.strip()
+            if suggested in list_ahli: return suggested
+            return DEFAULT_EXPERT
+        except:
+            return DEFAULT_EXPERT
+
+    # --- KONTEKS ---
+    def build_history(self, project, expert_name, prompt):
+        """Riwayat chat dalam format API Gemini (tanpa prompt yang sedang dikirim)"""
+        if self.backend is None:
+            return []
+        with self._db_lock:
+            current_history = self.backend.get_chat_history(project, expert_name)
+        hist_formatted = []
+        for h in current_history:
+            if h['content'] != prompt:
+                role_api = "user" if h['role'] == "user" else "model"
+                hist_formatted.append({"role": role_api, "parts": [h['content']]})
+        return hist_formatted
+
+    def simpan_chat(self, project, expert_name, role, text):
+        if self.backend is None:
+            return
+        with self._db_lock:
+            self.backend.simpan_chat(project, expert_name, role, text)
+
+    # --- LLM ---
+    def create_model(self, expert_name, model_name=None, prompt=None):
+        return genai.GenerativeModel(
+            model_name=model_name or self.model_name,
+            system_instruction=self.build_system_instruction(expert_name, prompt),
+            safety_settings=SAFETY_SETTINGS
+        )
+
+    def stream_response(self, expert_name, hist_formatted, content_to_send, model_name=None, prompt=None):
+        """Generator potongan teks jawaban (streaming)"""
+        model = self.create_model(expert_name, model_name, prompt)
+        chat_session = model.start_chat(history=hist_formatted)
+        for chunk in chat_session.send_message(content_to_send, stream=True):
+            if chunk.text:
+                yield chunk.text
+
+    # --- EKSEKUSI KODE ---
+    @staticmethod
+    def extract_code_blocks(text, only_triggered=True):
+        blocks = re.findall(r"```python(.*?)```", text, re.DOTALL)
+        if only_triggered:
+            blocks = [c for c in blocks if any(k in c for k in CODE_TRIGGERS)]
+        return blocks
+
+    @staticmethod
+    def build_engine_namespace(extra_vars=None, code_str=None):
+        """
+        'Kotak perkakas' yang disuntikkan ke kode AI (pd, np, plt, libs_*).
+        Jika code_str diberikan, hanya engine libs_* yang disebut di kode yang di-load.
+        """
+        local_vars = {
+            "pd": pd,
+            "np": np,
+            "plt": plt,
+            "enginex": enginex
+        }
+        local_vars.update(enginex.namespace_for(code_str))
+        if extra_vars:
+            local_vars.update(extra_vars)
+        return local_vars
+
+    def execute_code(self, code_str, extra_vars=None):
+        """
+        Menjalankan kode python dari AI.
+        Output: (sukses, pesan_error)
+        """
+        try:
+            exec(code_str, {}, self.build_engine_namespace(extra_vars, code_str))
+            return True, None
+        except Exception as e:
+            return False, f"{e}\n{traceback.format_exc(limit=3)}"
+
+    # --- PIPELINE LENGKAP (HEADLESS) ---
+    def konsultasi(self, project, expert_name, prompt, execute_code=True, build_exports=False):
+        """
+        Satu giliran konsultasi lengkap tanpa UI:
+        simpan prompt -> streaming jawaban -> simpan jawaban -> eksekusi kode -> export.
+        """
+        if expert_name == "auto":
+            expert_name = self.pilih_ahli_otomatis(prompt)
+        expert_name = self.resolve_expert(expert_name)
+
+        hist_formatted = self.build_history(project, expert_name, prompt)
+        self.simpan_chat(project, expert_name, "user", prompt)
+
+        hasil = {"project": project, "expert": expert_name, "prompt": prompt,
+                 "response": "", "code_results": [], "exports": {}, "error": None}
+        try:
+            hasil["response"] = "".join(self.stream_response(expert_name, hist_formatted, [prompt], prompt=prompt))
+        except Exception as e:
+            hasil["error"] = str(e)
+            return hasil
+        self.simpan_chat(project, expert_name, "assistant", hasil["response"])
+
+        if execute_code and not self.is_text_only(expert_name):
+            for code in self.extract_code_blocks(hasil["response"]):
+                display = HeadlessDisplay()
+                with self._exec_lock:
+                    ok, err = self.execute_code(code, {"st": display})
+                    plt.close('all')
+                hasil["code_results"].append({"sukses": ok, "error": err, "outputs": display.outputs})
+
+        if build_exports:
+            docx_file = create_docx_from_text(hasil["response"])
+            xlsx_file = extract_table_to_excel(hasil["response"])
+            if docx_file: hasil["exports"]["docx"] = docx_file.getvalue()
+            if xlsx_file: hasil["exports"]["xlsx"] = xlsx_file.getvalue()
+        return hasil